@@ -0,0 +1,42 @@
+"""
+버전 기반 ETag / 조건부 GET(304 Not Modified) 공통 모듈
+
+응답 본문을 만들어 해시하는 대신, 리소스 범위의 버전 값(최대 updated_at/id, 개수 등)을
+가벼운 집계 쿼리로 구해 ETag를 만듭니다. If-None-Match가 일치하면 직렬화 없이 304를 반환합니다.
+
+사용법:
+    def wallet_version(request, *args, **kwargs):
+        return Wallet.objects.filter(user=request.user).values_list('id', 'balance').first()
+
+    @conditional_get(wallet_version)
+    class WalletBalanceView(APIView):
+        ...
+
+버전 함수가 None을 반환하면 ETag 없이 일반 응답을 보냅니다.
+ETag에는 경로, 쿼리 문자열, 요청 사용자도 포함되므로 사용자별 응답이 섞이지 않습니다.
+"""
+import hashlib
+
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+# 응답 형식(시리얼라이저)이 바뀌면 올려서 기존 ETag를 모두 무효화
+ETAG_FORMAT_VERSION = 1
+
+
+def make_etag(request, version):
+    """요청 범위(경로/쿼리/사용자)와 버전 값으로 ETag 생성"""
+    user_id = getattr(request.user, 'pk', None)
+    material = repr((ETAG_FORMAT_VERSION, request.path, request.GET.urlencode(), user_id, version))
+    return hashlib.md5(material.encode()).hexdigest()
+
+
+def conditional_get(version_func):
+    """APIView 클래스의 get()에 버전 기반 ETag / 304 응답을 적용하는 클래스 데코레이터"""
+    def etag_func(request, *args, **kwargs):
+        version = version_func(request, *args, **kwargs)
+        if version is None:
+            return None
+        return make_etag(request, version)
+
+    return method_decorator(condition(etag_func=etag_func), name='get')
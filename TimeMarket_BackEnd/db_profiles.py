@@ -0,0 +1,133 @@
+"""
+DB 설정 프로필 (환경 변수 TIMEMARKET_DB로 선택)
+
+- sqlite (기본값): WAL 저널, synchronous=NORMAL, busy_timeout, mmap을 연결마다 적용하고
+  쓰기 트랜잭션을 IMMEDIATE로 시작해 잠금 승격 중 "database is locked" 오류를 줄입니다.
+  WAL에서는 읽기가 쓰기를 막지 않으므로 채팅 메시지 저장/거래 정산 중에도 조회가 대기하지 않습니다.
+  SQLite 연결은 파일을 여는 것뿐이라 재사용 이득이 거의 없고, ASGI(daphne)에서는 sync_to_async 스레드마다
+  지속 연결이 남아 파일 잠금 경합만 늘어나므로 기본값은 요청마다 닫는 CONN_MAX_AGE=0입니다.
+- postgres: psycopg 3 연결 풀(Django 5.1+ OPTIONS['pool'])을 사용합니다.
+  POSTGRES_POOL=0이면 풀 대신 CONN_MAX_AGE 지속 연결 + 상태 확인(CONN_HEALTH_CHECKS)을 사용합니다.
+
+환경 변수
+    TIMEMARKET_DB         sqlite | postgres
+    DB_CONN_MAX_AGE       지속 연결 유지 시간(초) - sqlite 기본 0, postgres(POSTGRES_POOL=0) 기본 60, 풀 사용 시 무시
+    SQLITE_PATH           SQLite 파일 경로 (기본 BASE_DIR/db.sqlite3)
+    SQLITE_BUSY_TIMEOUT   잠금 대기 시간(ms), 기본 5000
+    SQLITE_MMAP_SIZE      mmap 크기(byte), 기본 256MB
+    POSTGRES_DB / POSTGRES_USER / POSTGRES_PASSWORD / POSTGRES_HOST / POSTGRES_PORT
+    POSTGRES_POOL         1(기본) | 0
+    POSTGRES_POOL_MIN_SIZE / POSTGRES_POOL_MAX_SIZE / POSTGRES_POOL_TIMEOUT
+    SQLITE_REPLICA_PATHS  읽기 복제본 SQLite 파일 경로 (쉼표로 구분, 예: Litestream/LiteFS 복제본)
+    POSTGRES_REPLICA_HOSTS 읽기 복제본 호스트 (쉼표로 구분, host 또는 host:port)
+
+복제본은 replica1, replica2 ... 별칭으로 추가되며 primary와 같은 프로필 설정을 사용합니다.
+테스트에서는 복제본이 primary 테스트 DB를 그대로 가리킵니다(TEST.MIRROR).
+
+postgres 프로필은 psycopg 3와 연결 풀(psycopg[binary,pool], requirements.txt)이 필요합니다.
+테스트도 같은 환경 변수로 DB를 고릅니다. (Django가 test_<POSTGRES_DB> DB를 만들 수 있는 계정이어야 함)
+    TIMEMARKET_DB=postgres POSTGRES_HOST=localhost POSTGRES_PASSWORD=... python manage.py test
+SQLite 전용 검사(PRAGMA, EXPLAIN QUERY PLAN)는 postgres에서 건너뜁니다.
+"""
+import os
+
+PROFILES = ('sqlite', 'postgres')
+
+
+def _int(env, name, default):
+    return int(env.get(name, default))
+
+
+def _flag(env, name, default):
+    return env.get(name, default).lower() not in ('0', 'false', 'no', 'off', '')
+
+
+def sqlite_profile(base_dir, env):
+    busy_timeout = _int(env, 'SQLITE_BUSY_TIMEOUT', 5000)
+    pragmas = [
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',           # WAL에서는 커밋마다 fsync하지 않아도 손상 위험 없음
+        f'PRAGMA busy_timeout={busy_timeout}',
+        f"PRAGMA mmap_size={_int(env, 'SQLITE_MMAP_SIZE', 256 * 1024 * 1024)}",
+        'PRAGMA temp_store=MEMORY',
+    ]
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': env.get('SQLITE_PATH') or os.path.join(base_dir, 'db.sqlite3'),
+        'CONN_MAX_AGE': _int(env, 'DB_CONN_MAX_AGE', 0),
+        'OPTIONS': {
+            'timeout': busy_timeout / 1000,
+            'transaction_mode': 'IMMEDIATE',
+            'init_command': ';'.join(pragmas),
+        },
+    }
+
+
+def postgres_profile(env):
+    database = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': env.get('POSTGRES_DB', 'timemarket'),
+        'USER': env.get('POSTGRES_USER', 'timemarket'),
+        'PASSWORD': env.get('POSTGRES_PASSWORD', ''),
+        'HOST': env.get('POSTGRES_HOST', 'localhost'),
+        'PORT': env.get('POSTGRES_PORT', '5432'),
+        'OPTIONS': {},
+    }
+    if _flag(env, 'POSTGRES_POOL', '1'):
+        # 풀과 지속 연결(CONN_MAX_AGE)은 함께 쓸 수 없습니다.
+        database['CONN_MAX_AGE'] = 0
+        database['OPTIONS']['pool'] = {
+            'min_size': _int(env, 'POSTGRES_POOL_MIN_SIZE', 2),
+            'max_size': _int(env, 'POSTGRES_POOL_MAX_SIZE', 20),
+            'timeout': _int(env, 'POSTGRES_POOL_TIMEOUT', 10),
+        }
+    else:
+        database['CONN_MAX_AGE'] = _int(env, 'DB_CONN_MAX_AGE', 60)
+        database['CONN_HEALTH_CHECKS'] = True
+    return database
+
+
+def _profile_name(env):
+    return env.get('TIMEMARKET_DB', 'sqlite').lower()
+
+
+def database_from_env(base_dir, env=None):
+    """TIMEMARKET_DB 환경 변수로 선택한 프로필의 DATABASES['default'] 설정"""
+    env = os.environ if env is None else env
+    profile = _profile_name(env)
+    if profile == 'sqlite':
+        return sqlite_profile(base_dir, env)
+    if profile == 'postgres':
+        return postgres_profile(env)
+    raise ValueError(f"알 수 없는 TIMEMARKET_DB 값: {profile} (가능한 값: {', '.join(PROFILES)})")
+
+
+def _split(value):
+    return [item.strip() for item in (value or '').split(',') if item.strip()]
+
+
+def replicas_from_env(base_dir, env=None):
+    """읽기 복제본 DATABASES 설정 {'replica1': {...}, ...} (설정이 없으면 빈 dict)"""
+    env = os.environ if env is None else env
+    primary = database_from_env(base_dir, env)
+    if _profile_name(env) == 'sqlite':
+        overrides = [{'NAME': path} for path in _split(env.get('SQLITE_REPLICA_PATHS'))]
+    else:
+        overrides = []
+        for host in _split(env.get('POSTGRES_REPLICA_HOSTS')):
+            host, _, port = host.partition(':')
+            overrides.append({'HOST': host, 'PORT': port or primary['PORT']})
+
+    replicas = {}
+    for index, override in enumerate(overrides, start=1):
+        replica = dict(primary, OPTIONS=dict(primary['OPTIONS']), **override)
+        replica['TEST'] = {'MIRROR': 'default'}
+        if 'init_command' in replica['OPTIONS']:
+            # SQLite 복제본은 읽기 전용일 수 있으므로 저널 모드 변경/쓰기 잠금(IMMEDIATE)을 하지 않음
+            replica['OPTIONS'].pop('transaction_mode', None)
+            replica['OPTIONS']['init_command'] = ';'.join(
+                pragma for pragma in replica['OPTIONS']['init_command'].split(';')
+                if not pragma.startswith('PRAGMA journal_mode')
+            )
+        replicas[f'replica{index}'] = replica
+    return replicas
@@ -0,0 +1,91 @@
+"""
+희소 필드셋(sparse fieldset) / 임베드 제어 시리얼라이저 믹스인
+
+요청 쿼리 파라미터로 응답 모양을 조절합니다.
+- fields=id,status,post.title : 포함할 필드만 남김 (점 표기로 중첩 객체의 필드 지정)
+- expand=post,post.user       : 나열한 관계만 중첩 객체로 펼치고, 나머지 관계는 id(목록은 id 배열)로 응답
+
+두 파라미터가 없으면 기존과 같은 전체 응답입니다. (expand를 빈 값으로 주면 모든 관계가 id로 응답)
+관계를 id로 접으면 중첩 사용자의 평점 집계 같은 추가 쿼리도 실행되지 않습니다.
+최상위 시리얼라이저(또는 many=True 목록의 항목)에서만 적용되며, request가 없는 경우(WebSocket 등)에는 무시됩니다.
+"""
+from django.utils.functional import cached_property
+from rest_framework import serializers
+
+
+def parse_field_list(value):
+    """'a, b.c' → {'a', 'b.c'} (파라미터가 없으면 None)"""
+    if value is None:
+        return None
+    return {item.strip() for item in value.split(',') if item.strip()}
+
+
+def _nested_fields(field):
+    """중첩 시리얼라이저의 필드 dict (중첩 객체가 아니면 None)"""
+    if isinstance(field, serializers.ListSerializer):
+        field = field.child
+    if isinstance(field, serializers.Serializer):
+        return field.fields
+    return None
+
+
+def _sub_paths(paths, name):
+    prefix = f'{name}.'
+    return {path[len(prefix):] for path in paths if path.startswith(prefix)}
+
+
+def restrict_fields(fields, paths):
+    """paths에 없는 필드 제거 ('post.title'은 post를 남기고 post의 필드를 title로 제한)"""
+    top_level = {path.split('.', 1)[0] for path in paths}
+    for name in list(fields):
+        if name not in top_level:
+            fields.pop(name)
+            continue
+        sub_paths = _sub_paths(paths, name)
+        nested = _nested_fields(fields[name])
+        if sub_paths and nested is not None:
+            restrict_fields(nested, sub_paths)
+
+
+def collapse_relations(fields, expand):
+    """expand에 없는 중첩 관계를 기본키 필드로 교체"""
+    top_level = {path.split('.', 1)[0] for path in expand}
+    for name, field in list(fields.items()):
+        nested = _nested_fields(field)
+        if nested is None:
+            continue
+        if name in top_level:
+            collapse_relations(nested, _sub_paths(expand, name))
+            continue
+        kwargs = {'read_only': True, 'many': isinstance(field, serializers.ListSerializer)}
+        if field.source != name:
+            kwargs['source'] = field.source
+        fields[name] = serializers.PrimaryKeyRelatedField(**kwargs)
+
+
+class SparseFieldsetMixin:
+    """fields= / expand= 쿼리 파라미터를 지원하는 시리얼라이저 믹스인"""
+
+    @cached_property
+    def fields(self):
+        fields = super().fields
+        if not self._is_response_root():
+            return fields
+
+        query_params = getattr(self.context.get('request'), 'query_params', None)
+        if query_params is None:
+            return fields
+
+        expand = parse_field_list(query_params.get('expand'))
+        if expand is not None:
+            collapse_relations(fields, expand)
+        only = parse_field_list(query_params.get('fields'))
+        if only:
+            restrict_fields(fields, only)
+        return fields
+
+    def _is_response_root(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
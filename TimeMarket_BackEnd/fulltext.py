@@ -0,0 +1,227 @@
+"""
+전문 검색(Full-text search) 공통 모듈
+
+DB 종류에 따라 검색 백엔드를 선택합니다.
+- SQLite: FTS5 외부 콘텐츠(external content) 가상 테이블 + 트리거로 색인 유지, bm25 순위
+- PostgreSQL: to_tsvector GIN 인덱스 + ts_rank 순위
+- 그 외: icontains 검색 (순위 없음, 최신순)
+
+색인 테이블/트리거/인덱스는 각 앱의 마이그레이션에서 create_index_operation()으로 생성합니다.
+"""
+import re
+
+from django.db import connections, migrations
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+SEARCH_CONFIG = 'simple'
+
+
+def build_fts5_query(query):
+    """사용자 입력을 FTS5 MATCH 구문으로 변환 (각 단어 접두어 검색, AND 결합)"""
+    terms = [term.replace('"', '') for term in re.split(r'\s+', query or '')]
+    return ' '.join(f'"{term}"*' for term in terms if term)
+
+
+def _sqlite_create_sql(table, fts_table, fields):
+    columns = ', '.join(fields)
+    return [
+        f"CREATE VIRTUAL TABLE {fts_table} USING fts5({columns}, content='{table}', content_rowid='id', tokenize='unicode61')",
+        *_sqlite_trigger_sql(table, fts_table, fields),
+        f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')",
+    ]
+
+
+def _sqlite_trigger_sql(table, fts_table, fields):
+    columns = ', '.join(fields)
+    new_values = ', '.join(f'new.{field}' for field in fields)
+    old_values = ', '.join(f'old.{field}' for field in fields)
+    return [
+        f"CREATE TRIGGER {fts_table}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts_table}(rowid, {columns}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER {fts_table}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER {fts_table}_au AFTER UPDATE OF {columns} ON {table} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts_table}(rowid, {columns}) VALUES (new.id, {new_values}); END",
+    ]
+
+
+def _sqlite_drop_trigger_sql(fts_table):
+    return [
+        f"DROP TRIGGER IF EXISTS {fts_table}_ai",
+        f"DROP TRIGGER IF EXISTS {fts_table}_ad",
+        f"DROP TRIGGER IF EXISTS {fts_table}_au",
+    ]
+
+
+def _sqlite_drop_sql(fts_table):
+    return [*_sqlite_drop_trigger_sql(fts_table), f"DROP TABLE IF EXISTS {fts_table}"]
+
+
+def _postgres_document_sql(fields, table=None):
+    prefix = f'"{table}".' if table else ''
+    return " || ' ' || ".join(f"COALESCE({prefix}{field}, '')" for field in fields)
+
+
+def create_index_operation(table, fts_table, fields):
+    """
+    전문 검색 색인을 만드는 마이그레이션 오퍼레이션
+    table: 원본 테이블, fts_table: 색인 이름, fields: 검색 대상 컬럼 목록
+    """
+    def forwards(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        if vendor == 'sqlite':
+            statements = _sqlite_create_sql(table, fts_table, fields)
+        elif vendor == 'postgresql':
+            statements = [
+                f"CREATE INDEX {fts_table} ON {table} USING GIN "
+                f"(to_tsvector('{SEARCH_CONFIG}', {_postgres_document_sql(fields)}))"
+            ]
+        else:
+            statements = []
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    def backwards(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        if vendor == 'sqlite':
+            statements = _sqlite_drop_sql(fts_table)
+        elif vendor == 'postgresql':
+            statements = [f"DROP INDEX IF EXISTS {fts_table}"]
+        else:
+            statements = []
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return migrations.RunPython(forwards, backwards)
+
+
+def restore_triggers_operation(table, fts_table, fields):
+    """
+    SQLite에서 테이블을 재생성하는 마이그레이션(AddField/AlterField 등) 뒤에 색인 트리거를 다시 만드는 오퍼레이션
+    (테이블 재생성 시 기존 트리거가 함께 삭제됩니다. 행 id는 유지되므로 색인 내용은 그대로 사용합니다.)
+    """
+    def forwards(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for statement in [*_sqlite_drop_trigger_sql(fts_table), *_sqlite_trigger_sql(table, fts_table, fields)]:
+            schema_editor.execute(statement)
+
+    return migrations.RunPython(forwards, forwards)
+
+
+class FullTextIndex:
+    """모델 하나에 대한 전문 검색 색인"""
+
+    def __init__(self, model, fields, fts_table):
+        self.model = model
+        self.fields = list(fields)
+        self.fts_table = fts_table
+
+    def search(self, queryset, query, limit, offset=0, after=None):
+        """
+        queryset 범위 안에서 query와 일치하는 객체를 관련도 순(같으면 pk 역순)으로 반환
+        각 객체에는 search_rank 속성이 붙습니다 (값이 작을수록/클수록의 의미는 백엔드별로 다름).
+        after: 이전 페이지 마지막 객체의 (search_rank, pk) - 주어지면 그 다음 위치부터 반환 (keyset)
+        """
+        vendor = connections[queryset.db].vendor
+        if vendor == 'sqlite':
+            return self._search_sqlite(queryset, query, limit, offset, after)
+        if vendor == 'postgresql':
+            return self._search_postgres(queryset, query, limit, offset, after)
+        return self._search_fallback(queryset, query, limit, offset, after)
+
+    def filter(self, queryset, query):
+        """queryset을 query와 일치하는 객체로 제한 (순위 없이, 집계/패싯 계산용)"""
+        vendor = connections[queryset.db].vendor
+        if vendor == 'sqlite':
+            match = build_fts5_query(query)
+            if not match:
+                return queryset.none()
+            return queryset.filter(
+                pk__in=RawSQL(f"SELECT rowid FROM {self.fts_table} WHERE {self.fts_table} MATCH %s", [match])
+            )
+        if vendor == 'postgresql':
+            from django.contrib.postgres.search import SearchQuery
+
+            if not (query or '').strip():
+                return queryset.none()
+            return queryset.annotate(search_document=self._postgres_document()).filter(
+                search_document=SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch')
+            )
+        return queryset.filter(self._fallback_condition(query))
+
+    def _search_sqlite(self, queryset, query, limit, offset, after):
+        match = build_fts5_query(query)
+        if not match:
+            return []
+
+        # 범위(queryset)를 서브쿼리로 넣고 FTS5 rank(bm25, 작을수록 관련도 높음)로 정렬
+        scope_sql, scope_params = queryset.values('pk').query.sql_with_params()
+        position_sql, position_params = '', []
+        if after:
+            rank, pk = after
+            position_sql = "AND (rank > %s OR (rank = %s AND rowid < %s)) "
+            position_params = [rank, rank, pk]
+        sql = (
+            f"SELECT rowid, rank FROM {self.fts_table} "
+            f"WHERE {self.fts_table} MATCH %s AND rowid IN ({scope_sql}) {position_sql}"
+            f"ORDER BY rank, rowid DESC LIMIT %s OFFSET %s"
+        )
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(sql, [match, *scope_params, *position_params, limit, offset])
+            ranked = cursor.fetchall()
+
+        objects = queryset.in_bulk([row_id for row_id, _ in ranked])
+        results = []
+        for row_id, rank in ranked:
+            obj = objects.get(row_id)
+            if obj is not None:
+                obj.search_rank = rank
+                results.append(obj)
+        return results
+
+    def _search_postgres(self, queryset, query, limit, offset, after):
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        if not (query or '').strip():
+            return []
+
+        document = self._postgres_document()
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch')
+        results = queryset.annotate(search_document=document, search_rank=SearchRank(document, search_query)).filter(
+            search_document=search_query
+        )
+        if after:
+            # ts_rank는 클수록 관련도 높음: (search_rank, pk) < 커서
+            rank, pk = after
+            results = results.filter(Q(search_rank__lt=rank) | Q(search_rank=rank, pk__lt=pk))
+        return list(results.order_by('-search_rank', '-pk')[offset:offset + limit])
+
+    def _postgres_document(self):
+        from django.contrib.postgres.search import SearchVectorField
+
+        # GIN 인덱스와 같은 식을 사용해야 인덱스를 탑니다. (조인 시 모호하지 않도록 테이블명 명시)
+        document_sql = _postgres_document_sql(self.fields, self.model._meta.db_table)
+        return RawSQL(f"to_tsvector('{SEARCH_CONFIG}', {document_sql})", [], output_field=SearchVectorField())
+
+    def _fallback_condition(self, query):
+        terms = [term for term in re.split(r'\s+', query or '') if term]
+        if not terms:
+            return Q(pk__in=[])
+        condition = Q()
+        for term in terms:
+            term_condition = Q()
+            for field in self.fields:
+                term_condition |= Q(**{f'{field}__icontains': term})
+            condition &= term_condition
+        return condition
+
+    def _search_fallback(self, queryset, query, limit, offset, after):
+        if not (query or '').strip():
+            return []
+        results = queryset.filter(self._fallback_condition(query))
+        if after:
+            results = results.filter(pk__lt=after[1])
+        return list(results.order_by('-pk')[offset:offset + limit])
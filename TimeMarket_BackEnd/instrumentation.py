@@ -0,0 +1,237 @@
+"""
+요청/이벤트 단위 쿼리 수 · 지연 시간 계측
+
+- QueryInstrumentationMiddleware: HTTP 요청마다 라우트(메서드 + URL 패턴) 단위로 기록
+- InstrumentedConsumerMixin: WebSocket 이벤트마다 이벤트 타입 단위로 기록
+- 기록 항목: 쿼리 수, DB 시간, 직렬화 시간(HTTP 응답 렌더링 / WebSocket 프레임 인코딩), 전체 시간
+  (뷰 안에서 실행되는 시리얼라이저 .data는 전체 시간에만 포함됩니다.)
+- 집계는 프로세스 단위로 보관되며 get_stats()(내부 엔드포인트 /api/internal/stats/)로 조회합니다.
+- 쿼리 수가 설정된 예산(settings.INSTRUMENTATION)을 넘으면 경고 로그를 남깁니다.
+
+쿼리 계측은 모든 DB 연결에 execute wrapper를 하나 설치하고, 현재 요청의 수집기를 ContextVar로 찾습니다.
+(sync_to_async로 다른 스레드에서 실행되는 쿼리도 같은 요청/이벤트로 집계됩니다.)
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_INSTRUMENTATION = {
+    'ENABLED': True,
+    'QUERY_BUDGET': 30,     # 요청/이벤트당 기본 쿼리 예산
+    'QUERY_BUDGETS': {},    # 라우트/이벤트별 예산 (예: {'GET api/chat/history/': 10, 'ws chat': 5})
+}
+
+_current = ContextVar('instrumentation_metrics', default=None)
+_stats = {}
+_stats_lock = threading.Lock()
+_installed = False
+
+
+def get_config():
+    """settings.INSTRUMENTATION 값을 기본값과 병합하여 반환"""
+    config = dict(DEFAULT_INSTRUMENTATION)
+    config.update(getattr(settings, 'INSTRUMENTATION', {}))
+    return config
+
+
+class Metrics:
+    """요청/이벤트 하나의 측정값"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialization_time = 0.0
+        self._serialization_depth = 0
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started_at
+
+
+def _execute_wrapper(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_time += time.perf_counter() - start
+
+
+def _install_on_connection(connection, **kwargs):
+    if _execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_execute_wrapper)
+
+
+@contextmanager
+def serialization_timer():
+    """블록 실행 시간을 현재 요청의 직렬화 시간에 더함 (중첩 시 가장 바깥 블록만 계산)"""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    metrics._serialization_depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics._serialization_depth -= 1
+        if metrics._serialization_depth == 0:
+            metrics.serialization_time += time.perf_counter() - start
+
+
+def install():
+    """모든 DB 연결에 execute wrapper 설치 (여러 번 호출해도 한 번만 설치)"""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+
+    connection_created.connect(_install_on_connection, dispatch_uid='instrumentation_execute_wrapper')
+    for connection in connections.all(initialized_only=True):
+        _install_on_connection(connection)
+
+
+@contextmanager
+def collect(key):
+    """
+    블록 안에서 실행된 쿼리/직렬화를 key로 기록
+    yield되는 dict의 'key'를 바꾸면 최종 라우트/이벤트 이름을 바꿀 수 있습니다.
+    """
+    if not get_config()['ENABLED']:
+        yield {'key': key}
+        return
+
+    label = {'key': key}
+    metrics = Metrics()
+    token = _current.set(metrics)
+    try:
+        yield label
+    finally:
+        _current.reset(token)
+        record(label['key'], metrics)
+
+
+def get_query_budget(key):
+    config = get_config()
+    return config['QUERY_BUDGETS'].get(key, config['QUERY_BUDGET'])
+
+
+def record(key, metrics):
+    """측정값을 집계에 반영하고 쿼리 예산 초과 시 경고"""
+    elapsed = metrics.elapsed
+    budget = get_query_budget(key)
+    over_budget = budget is not None and metrics.queries > budget
+
+    with _stats_lock:
+        entry = _stats.setdefault(key, {
+            'count': 0, 'queries': 0, 'max_queries': 0, 'db_time': 0.0,
+            'serialization_time': 0.0, 'total_time': 0.0, 'max_time': 0.0, 'over_budget': 0,
+        })
+        entry['count'] += 1
+        entry['queries'] += metrics.queries
+        entry['max_queries'] = max(entry['max_queries'], metrics.queries)
+        entry['db_time'] += metrics.db_time
+        entry['serialization_time'] += metrics.serialization_time
+        entry['total_time'] += elapsed
+        entry['max_time'] = max(entry['max_time'], elapsed)
+        entry['over_budget'] += int(over_budget)
+
+    if over_budget:
+        logger.warning(
+            f"⚠️ 쿼리 예산 초과: {key} - 쿼리 {metrics.queries}개 (예산 {budget}), "
+            f"DB {metrics.db_time * 1000:.1f}ms / 전체 {elapsed * 1000:.1f}ms"
+        )
+
+
+def get_stats():
+    """라우트/이벤트별 집계 (평균값은 ms 단위로 계산해 포함)"""
+    with _stats_lock:
+        snapshot = {key: dict(entry) for key, entry in _stats.items()}
+    result = {}
+    for key, entry in sorted(snapshot.items()):
+        count = entry['count']
+        result[key] = {
+            'count': count,
+            'avg_queries': round(entry['queries'] / count, 2),
+            'max_queries': entry['max_queries'],
+            'avg_db_ms': round(entry['db_time'] * 1000 / count, 2),
+            'avg_serialization_ms': round(entry['serialization_time'] * 1000 / count, 2),
+            'avg_total_ms': round(entry['total_time'] * 1000 / count, 2),
+            'max_total_ms': round(entry['max_time'] * 1000, 2),
+            'query_budget': get_query_budget(key),
+            'over_budget': entry['over_budget'],
+        }
+    return result
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def route_key(request):
+    """'GET api/chat/match/my-chats/' 형태의 라우트 이름 (URL 패턴 기준이라 id 값과 무관)"""
+    match = getattr(request, 'resolver_match', None)
+    route = match.route if match else 'unresolved'
+    return f"{request.method} {route}"
+
+
+class QueryInstrumentationMiddleware:
+    """HTTP 요청별 쿼리 수/DB 시간/직렬화 시간/전체 시간 기록 (MIDDLEWARE 맨 앞에 두세요)"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        install()
+
+    def __call__(self, request):
+        with collect('unresolved') as label:
+            response = self.get_response(request)
+            label['key'] = route_key(request)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF Response는 뷰가 끝난 뒤 렌더링되므로 렌더링(ORJSONRenderer 등) 시간을 직렬화 시간으로 기록
+        metrics = _current.get()
+        if metrics is not None:
+            start = time.perf_counter()
+
+            def add_render_time(rendered):
+                metrics.serialization_time += time.perf_counter() - start
+
+            response.add_post_render_callback(add_render_time)
+        return response
+
+
+class InstrumentedConsumerMixin:
+    """
+    WebSocket 이벤트별 계측 믹스인
+    이벤트 이름은 'ws <ASGI 메시지 타입>'이며, 핸들러에서 label_event()로 세부 타입을 붙일 수 있습니다.
+    (예: 'ws websocket.receive:chat', 'ws chat_message')
+    """
+
+    async def dispatch(self, message):
+        install()
+        with collect(f"ws {message.get('type')}") as label:
+            self._instrumentation_label = label
+            try:
+                return await super().dispatch(message)
+            finally:
+                self._instrumentation_label = None
+
+    def label_event(self, name):
+        label = getattr(self, '_instrumentation_label', None)
+        if label is not None and ':' not in label['key']:
+            label['key'] = f"{label['key']}:{name}"
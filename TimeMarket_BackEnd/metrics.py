@@ -0,0 +1,423 @@
+"""
+Prometheus 형식 운영 지표 (/metrics)
+
+외부 라이브러리 없이 프로세스 내부 레지스트리에 값을 모으고, 스크레이프 시 텍스트 형식(0.0.4)으로 내보냅니다.
+값은 워커 프로세스 단위이므로 여러 워커를 띄운 경우 Prometheus에서 인스턴스별로 수집해 합산하세요.
+
+- HTTP: 뷰별 응답 시간 히스토그램 (PrometheusMetricsMiddleware)
+- WebSocket: 활성 연결 수, 연결이 있는 채널 그룹(채팅방) 수와 그룹 크기 분포 (ChatConsumer)
+  채팅방별 시계열은 채팅방 수만큼 늘어나므로 METRICS['PER_GROUP_GAUGE']를 켠 경우에만 내보냅니다.
+- 거래 정산: 정산 소요 시간 히스토그램과 결과별 횟수 (WebSocket / REST 정산 경로)
+- 푸시: 전송 중인 푸시 수와 결과별 전송 수
+- DB: 열려 있는 연결 수, 새로 연 연결 수
+- 스크레이프 시점 수집: WebSocket 드롭 프레임 수, 게시글 피드 캐시 적중/미스 수
+"""
+import bisect
+import math
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework.exceptions import ValidationError
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Prometheus 클라이언트 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+DEFAULT_METRICS = {
+    'ENABLED': True,
+    'BEARER_TOKEN': None,   # 설정 시 Authorization: Bearer <토큰> 헤더가 있어야 조회 가능
+    'PER_GROUP_GAUGE': False,  # 채팅방별 연결 수 시계열 (채팅방 수만큼 시계열이 생기므로 디버깅용)
+}
+
+# 채널 그룹 크기 분포 버킷 (연결 수)
+GROUP_SIZE_BUCKETS = (1, 2, 5, 10, 25, 50, 100)
+
+
+def get_config():
+    """settings.METRICS 값을 기본값과 병합하여 반환"""
+    config = dict(DEFAULT_METRICS)
+    config.update(getattr(settings, 'METRICS', {}))
+    return config
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    if value == -math.inf:
+        return '-Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in labels) + '}'
+
+
+class Metric:
+    """레이블별 값을 보관하는 지표 (스레드 안전)"""
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 {self.labelnames}가 필요합니다 (받은 값: {tuple(labels)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key):
+        return tuple(zip(self.labelnames, key))
+
+    def samples(self):
+        """[(이름, 레이블 튜플, 값), ...]"""
+        with self._lock:
+            return [(self.name, self._labels(key), value) for key, value in sorted(self._values.items())]
+
+    def get(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    type = 'gauge'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) - amount
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)  # value <= 경계값인 첫 버킷
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = {'buckets': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0}
+            entry['buckets'][index] += 1
+            entry['sum'] += value
+            entry['count'] += 1
+
+    def get(self, **labels):
+        """{'sum', 'count'} 반환 (관측값이 없으면 0)"""
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return {'sum': entry['sum'], 'count': entry['count']} if entry else {'sum': 0.0, 'count': 0}
+
+    def samples(self):
+        with self._lock:
+            snapshot = [(key, list(entry['buckets']), entry['sum'], entry['count']) for key, entry in sorted(self._values.items())]
+        result = []
+        for key, bucket_counts, total, count in snapshot:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), bucket_counts):
+                cumulative += bucket_count
+                result.append((f'{self.name}_bucket', labels + (('le', _format_value(float(bound))),), cumulative))
+            result.append((f'{self.name}_sum', labels, total))
+            result.append((f'{self.name}_count', labels, count))
+        return result
+
+
+class Registry:
+    """지표와 스크레이프 시점 수집 함수(collector)를 모아 텍스트 형식으로 내보냄"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+
+    def register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 지표입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector):
+        """collector() → [(이름, 타입, 설명, [(레이블 튜플, 값), ...]) 또는 Metric, ...]"""
+        self._collectors.append(collector)
+        return collector
+
+    def render(self):
+        lines = []
+
+        def family(name, type_, documentation, samples):
+            lines.append(f'# HELP {name} {documentation}')
+            lines.append(f'# TYPE {name} {type_}')
+            for sample_name, labels, value in samples:
+                lines.append(f'{sample_name}{_format_labels(labels)} {_format_value(value)}')
+
+        for metric in self._metrics.values():
+            family(metric.name, metric.type, metric.documentation, metric.samples())
+        for collector in self._collectors:
+            for collected in collector():
+                if isinstance(collected, Metric):
+                    family(collected.name, collected.type, collected.documentation, collected.samples())
+                    continue
+                name, type_, documentation, samples = collected
+                family(name, type_, documentation, [(name, labels, value) for labels, value in samples])
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+http_request_duration = registry.histogram(
+    'timemarket_http_request_duration_seconds', 'HTTP 요청 처리 시간 (뷰별)', ('view', 'method', 'status'),
+)
+websocket_connections = registry.gauge(
+    'timemarket_websocket_connections', '현재 워커의 활성 WebSocket 연결 수',
+)
+trade_settlement_duration = registry.histogram(
+    'timemarket_trade_settlement_duration_seconds', '거래 정산(지갑 이체) 소요 시간', ('path',),
+)
+trade_settlements = registry.counter(
+    'timemarket_trade_settlements_total', '거래 정산 결과별 횟수 (completed / rejected / error)', ('path', 'outcome'),
+)
+push_pending = registry.gauge(
+    'timemarket_push_pending', '전송 중(응답 대기)인 푸시 알림 수',
+)
+push_messages = registry.counter(
+    'timemarket_push_messages_total', '푸시 알림 전송 결과별 수 (success / failure / skipped)', ('result',),
+)
+websocket_connections.set(0)
+push_pending.set(0)
+
+db_connections_opened = registry.counter(
+    'timemarket_db_connections_opened_total', '새로 연 DB 연결 수', ('alias',),
+)
+
+
+# -------------------- HTTP --------------------
+
+def view_label(request):
+    """요청을 처리한 뷰의 경로 (예: 'chat.views.MyChatsView')"""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unresolved'
+    func = getattr(match.func, 'view_class', match.func)
+    return f'{func.__module__}.{func.__name__}'
+
+
+class PrometheusMetricsMiddleware:
+    """HTTP 요청 처리 시간을 뷰/메서드/상태 코드별 히스토그램으로 기록"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        response = self.get_response(request)
+        http_request_duration.observe(
+            time.perf_counter() - start,
+            view=view_label(request), method=request.method, status=response.status_code,
+        )
+        return response
+
+
+# -------------------- WebSocket --------------------
+
+# 채널 그룹 → 현재 워커의 연결 수 (연결이 없는 그룹은 제거)
+_group_sizes = {}
+_group_sizes_lock = threading.Lock()
+
+
+def websocket_connected(group):
+    websocket_connections.inc()
+    with _group_sizes_lock:
+        _group_sizes[group] = _group_sizes.get(group, 0) + 1
+
+
+def websocket_disconnected(group):
+    websocket_connections.dec()
+    with _group_sizes_lock:
+        size = _group_sizes.get(group, 0) - 1
+        if size > 0:
+            _group_sizes[group] = size
+        else:
+            _group_sizes.pop(group, None)
+
+
+def get_group_size(group):
+    with _group_sizes_lock:
+        return _group_sizes.get(group, 0)
+
+
+@registry.add_collector
+def collect_channel_groups():
+    """채널 그룹 수와 그룹 크기 분포 (채팅방별 시계열은 PER_GROUP_GAUGE 설정 시에만)"""
+    with _group_sizes_lock:
+        sizes = dict(_group_sizes)
+    distribution = Histogram(
+        'timemarket_channel_group_size', '채널 그룹(채팅방)별 연결 수 분포', buckets=GROUP_SIZE_BUCKETS,
+    )
+    for size in sizes.values():
+        distribution.observe(size)
+
+    families = [
+        ('timemarket_channel_groups', 'gauge', '연결이 있는 채널 그룹(채팅방) 수', [((), len(sizes))]),
+        distribution,
+    ]
+    if get_config()['PER_GROUP_GAUGE']:
+        families.append((
+            'timemarket_channel_group_connections', 'gauge', '채널 그룹(채팅방)별 연결 수',
+            [((('group', group),), size) for group, size in sorted(sizes.items())],
+        ))
+    return families
+
+
+# -------------------- 거래 정산 --------------------
+
+class SettlementTimer:
+    """정산 시작부터 finish(outcome)까지의 시간을 기록 (여러 번 호출해도 한 번만 기록)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.started_at = time.perf_counter()
+        self.finished = False
+
+    def finish(self, outcome):
+        if self.finished:
+            return
+        self.finished = True
+        trade_settlement_duration.observe(time.perf_counter() - self.started_at, path=self.path)
+        trade_settlements.inc(path=self.path, outcome=outcome)
+
+
+def start_settlement(path):
+    return SettlementTimer(path)
+
+
+@contextmanager
+def track_settlement(path):
+    """블록 실행을 정산 한 건으로 기록 (검증 오류는 rejected, 그 외 예외는 error)"""
+    timer = start_settlement(path)
+    try:
+        yield timer
+    except (ValidationError, DjangoValidationError):
+        timer.finish('rejected')
+        raise
+    except Exception:
+        timer.finish('error')
+        raise
+    timer.finish('completed')
+
+
+# -------------------- 푸시 --------------------
+
+@contextmanager
+def track_push(count):
+    """count개의 푸시 전송이 끝날 때까지 대기 중인 푸시 수에 포함"""
+    push_pending.inc(count)
+    try:
+        yield
+    finally:
+        push_pending.dec(count)
+
+
+def record_push_results(success=0, failure=0, skipped=0):
+    for result, count in (('success', success), ('failure', failure), ('skipped', skipped)):
+        if count:
+            push_messages.inc(count, result=result)
+
+
+# -------------------- DB 연결 --------------------
+
+_db_wrappers = weakref.WeakSet()
+_db_wrappers_lock = threading.Lock()
+
+
+def _track_connection(sender, connection, **kwargs):
+    db_connections_opened.inc(alias=connection.alias)
+    with _db_wrappers_lock:
+        _db_wrappers.add(connection)
+
+
+connection_created.connect(_track_connection, dispatch_uid='metrics_track_connection')
+for _connection in connections.all(initialized_only=True):
+    _db_wrappers.add(_connection)
+
+
+@registry.add_collector
+def collect_db_connections():
+    """모든 스레드에서 현재 열려 있는 DB 연결 수 (alias별)"""
+    counts = {alias: 0 for alias in settings.DATABASES}
+    with _db_wrappers_lock:
+        wrappers = list(_db_wrappers)
+    for wrapper in wrappers:
+        if wrapper.connection is not None:
+            counts[wrapper.alias] = counts.get(wrapper.alias, 0) + 1
+    return [(
+        'timemarket_db_connections', 'gauge', '열려 있는 DB 연결 수',
+        [((('alias', alias),), count) for alias, count in sorted(counts.items())],
+    )]
+
+
+@registry.add_collector
+def collect_existing_counters():
+    """다른 모듈에서 이미 집계 중인 값 (WebSocket 드롭 프레임, 게시글 피드 캐시)"""
+    from chat.throttling import get_dropped_frame_counts
+    from posts.cache import get_feed_cache_stats
+
+    feed_cache = get_feed_cache_stats()
+    return [
+        (
+            'timemarket_websocket_dropped_frames_total', 'counter', 'WebSocket 드롭 프레임 수 (사유별)',
+            [((('reason', reason),), count) for reason, count in sorted(get_dropped_frame_counts().items())],
+        ),
+        (
+            'timemarket_post_feed_cache_requests_total', 'counter', '게시글 피드 캐시 조회 수 (적중 여부별)',
+            [((('result', 'hit'),), feed_cache['hits']), ((('result', 'miss'),), feed_cache['misses'])],
+        ),
+    ]
@@ -0,0 +1,68 @@
+"""
+orjson 기반 JSON 렌더러/파서 (선택 의존성)
+
+- ORJSONRenderer / ORJSONParser: DRF JSONRenderer / JSONParser와 같은 출력/입력 규칙
+  (Decimal → float, datetime → ISO 8601 + UTC는 'Z', 지연 번역 문자열 → str 등)
+- dumps()/loads(): ChatConsumer 등 DRF 밖에서 쓰는 같은 규칙의 JSON 인코더/디코더 (dumps는 str 반환)
+
+orjson이 설치되어 있지 않으면 DRF 기본 구현(표준 json 모듈)으로 동작합니다.
+"""
+import json
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+_drf_encoder = JSONEncoder()
+
+
+def json_default(obj):
+    """orjson이 기본 지원하지 않는 타입(Decimal, timedelta, 지연 번역 문자열 등)을 DRF JSONEncoder와 같은 방식으로 변환"""
+    return _drf_encoder.default(obj)
+
+
+def dumps(obj):
+    """DRF 응답과 같은 규칙으로 JSON 문자열 생성 (WebSocket 텍스트 프레임용)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=json_default, option=ORJSON_OPTIONS).decode()
+    return json.dumps(obj, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':'))
+
+
+def loads(data):
+    """JSON 문자열/바이트 파싱"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """orjson으로 응답을 직렬화하는 JSONRenderer (들여쓰기 요청 시에는 기본 구현 사용)"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type or '', renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(data, default=json_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONParser(JSONParser):
+    """orjson으로 요청 본문을 파싱하는 JSONParser (UTF-8이 아닌 본문은 기본 구현 사용)"""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', 'utf-8')
+        if orjson is None or encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
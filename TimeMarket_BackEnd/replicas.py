@@ -0,0 +1,144 @@
+"""
+읽기 복제본(replica) DB 라우팅
+
+- ReplicaRouter: 복제본으로 보내도 되는 읽기만 복제본으로 보내고, 쓰기/마이그레이션은 항상 primary(default)
+- ReplicaReadMixin: 읽기 전용 목록 뷰(피드/게시판/리뷰 목록/거래 히스토리)에 붙여 GET/HEAD 요청의 읽기를 복제본으로 보냄
+  (그 외 뷰, 관리자, WebSocket 컨슈머의 읽기는 기존처럼 primary에서 읽습니다.)
+- read-your-writes: 요청/이벤트 중 쓰기가 있으면 그 뒤의 읽기는 primary로 보내고,
+  사용자를 STICKY_SECONDS 동안 primary에 고정해 복제 지연 때문에 방금 쓴 내용이 안 보이는 일을 막습니다.
+  (고정 정보는 캐시에 저장하므로 여러 워커가 공유하려면 Redis/Memcached 등 공유 캐시를 사용하세요.)
+
+복제본은 settings.REPLICA_ROUTING['REPLICAS']에 나열한 DATABASES 별칭입니다 (없으면 라우팅하지 않음).
+공개 피드 응답 캐시(posts.cache)는 복제본에서 만든 응답을 TIMEOUT 동안 보관하므로, 복제 지연만큼 늦게 반영될 수 있습니다.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.permissions import SAFE_METHODS
+
+
+DEFAULT_REPLICA_ROUTING = {
+    'REPLICAS': [],          # 읽기 복제본 DATABASES 별칭 목록
+    'STICKY_SECONDS': 15,    # 쓰기 후 사용자를 primary에 고정하는 시간(초) - 최대 복제 지연보다 길게
+    'CACHE_ALIAS': 'default',
+    'USE_TEST_MIRRORS': False,  # 복제본 대신 TEST.MIRROR 대상 별칭으로 읽기 (테스트용)
+}
+
+PIN_KEY = 'replicas:pin:{user_id}'
+
+_state = ContextVar('replica_routing', default=None)
+
+
+def get_config():
+    """settings.REPLICA_ROUTING 값을 기본값과 병합하여 반환"""
+    config = dict(DEFAULT_REPLICA_ROUTING)
+    config.update(getattr(settings, 'REPLICA_ROUTING', {}))
+    return config
+
+
+def choose_replica(replicas):
+    return random.choice(replicas)
+
+
+class RoutingState:
+    """요청/이벤트 하나의 라우팅 상태"""
+
+    def __init__(self):
+        self.use_replica = False
+        self.wrote = False
+
+
+def _pin_cache():
+    return caches[get_config()['CACHE_ALIAS']]
+
+
+def pin_user(user_id):
+    """사용자의 읽기를 STICKY_SECONDS 동안 primary로 고정"""
+    timeout = get_config()['STICKY_SECONDS']
+    if user_id is not None and timeout:
+        _pin_cache().set(PIN_KEY.format(user_id=user_id), True, timeout=timeout)
+
+
+def is_pinned(user):
+    if not getattr(user, 'is_authenticated', False):
+        return False
+    return bool(_pin_cache().get(PIN_KEY.format(user_id=user.pk)))
+
+
+@contextmanager
+def track_writes(user_id=None):
+    """블록 안의 쓰기를 추적하고, 쓰기가 있었으면 종료 시 사용자를 primary에 고정"""
+    state = RoutingState()
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+        if state.wrote:
+            pin_user(user_id)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.use_replica or state.wrote:
+            return None
+        config = get_config()
+        if not config['REPLICAS']:
+            return None
+        alias = choose_replica(config['REPLICAS'])
+        if config['USE_TEST_MIRRORS']:
+            alias = settings.DATABASES[alias].get('TEST', {}).get('MIRROR') or alias
+        return alias
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 primary와 같은 데이터이므로 어느 별칭에서 읽은 객체끼리도 관계를 허용
+        databases = {DEFAULT_DB_ALIAS, *get_config()['REPLICAS']}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본은 primary의 스키마 변경을 복제받음
+        if db in get_config()['REPLICAS']:
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """HTTP 요청마다 라우팅 상태를 만들고, 쓰기가 있었던 요청의 사용자를 primary에 고정"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = RoutingState()
+        token = _state.set(state)
+        try:
+            return self.get_response(request)
+        finally:
+            _state.reset(token)
+            # DRF 인증(JWT) 결과는 뷰 처리 후 request.user에 반영되어 있음
+            user = getattr(request, 'user', None)
+            if state.wrote and getattr(user, 'is_authenticated', False):
+                pin_user(user.pk)
+
+
+class ReplicaReadMixin:
+    """읽기 전용 APIView 믹스인: 인증 후 GET/HEAD 요청이고 최근 쓰기로 고정되지 않은 사용자면 복제본에서 읽음"""
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        state = _state.get()
+        if state is not None and request.method in SAFE_METHODS and not is_pinned(request.user):
+            state.use_replica = True
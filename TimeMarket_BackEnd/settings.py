@@ -29,7 +29,17 @@ DEBUG = True
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
-    )
+    ),
+    # orjson 렌더러/파서 (orjson 미설치 시 표준 json으로 동작)
+    'DEFAULT_RENDERER_CLASSES': (
+        'TimeMarket_BackEnd.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'TimeMarket_BackEnd.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
 }
 
 from datetime import timedelta
@@ -68,6 +78,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "TimeMarket_BackEnd.instrumentation.QueryInstrumentationMiddleware",  # 요청별 쿼리 수/지연 시간 계측 (가장 바깥)
+    "TimeMarket_BackEnd.metrics.PrometheusMetricsMiddleware",  # /metrics 뷰별 응답 시간 히스토그램
     "corsheaders.middleware.CorsMiddleware",  # 👈 1. 이 부분을 가장 위에 추가
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -76,6 +88,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "TimeMarket_BackEnd.replicas.ReplicaRoutingMiddleware",  # 읽기 복제본 라우팅 / 쓰기 후 primary 고정
 ]
 
 ROOT_URLCONF = "TimeMarket_BackEnd.urls"
@@ -102,12 +115,27 @@ ASGI_APPLICATION = "TimeMarket_BackEnd.asgi.application"
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
+# 🗄️ TIMEMARKET_DB=sqlite(기본, WAL 튜닝) | postgres(연결 풀) — TimeMarket_BackEnd/db_profiles.py 참고
+
+import sys
+
+from .db_profiles import database_from_env, replicas_from_env
+
+# manage.py test 실행 중 여부
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
 
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": database_from_env(BASE_DIR),
+    **replicas_from_env(BASE_DIR),  # 📖 읽기 복제본 (SQLITE_REPLICA_PATHS / POSTGRES_REPLICA_HOSTS)
+}
+
+# 읽기 전용 목록 뷰의 읽기를 복제본으로 분산 (쓰기 직후 사용자는 primary에 고정) — TimeMarket_BackEnd/replicas.py 참고
+DATABASE_ROUTERS = ["TimeMarket_BackEnd.replicas.ReplicaRouter"]
+REPLICA_ROUTING = {
+    'REPLICAS': [alias for alias in DATABASES if alias != "default"],
+    'STICKY_SECONDS': 15,  # 최대 복제 지연보다 길게
+    # 테스트 중에는 복제본 읽기를 TEST.MIRROR 대상(primary) 연결로 보내 TestCase 트랜잭션 안의 데이터가 보이게 함
+    'USE_TEST_MIRRORS': TESTING,
 }
 
 # 미디어 작업
@@ -166,6 +194,48 @@ CHANNEL_LAYERS = {
     }
 }
 
+# ChatConsumer 수신 속도 제한 / 송신 대기열 설정 (chat/throttling.py 기본값 덮어쓰기)
+CHAT_WEBSOCKET_LIMITS = {
+    'CONNECTION_RATE': 5,      # 연결당 초당 프레임 수
+    'CONNECTION_BURST': 10,
+    'USER_RATE': 10,           # 사용자당 초당 프레임 수 (모든 연결 합산)
+    'USER_BURST': 20,
+    'SEND_QUEUE_SIZE': 100,    # 초과 시 느린 클라이언트로 판단하여 연결 종료
+    'MAX_VIOLATIONS': 20,
+}
+
+# 캐시 (기본: 프로세스 로컬 메모리, 운영에서 여러 워커가 공유하려면 Redis 등으로 교체)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'timemarket-default',
+    },
+}
+
+# 요청/WebSocket 이벤트별 쿼리 수·지연 시간 계측 (/api/internal/stats/)
+INSTRUMENTATION = {
+    'ENABLED': True,
+    'QUERY_BUDGET': 30,    # 초과 시 경고 로그
+    'QUERY_BUDGETS': {
+        # 'GET api/chat/history/': 10,
+        # 'ws websocket.receive:chat': 5,
+    },
+}
+
+# Prometheus 지표 엔드포인트 (/metrics)
+METRICS = {
+    'ENABLED': True,
+    'BEARER_TOKEN': None,  # 운영 환경에서는 토큰을 설정하거나 /metrics를 내부망으로 제한하세요.
+    'PER_GROUP_GAUGE': False,  # 채팅방별 연결 수 시계열 (채팅방 수만큼 늘어나므로 기본 꺼짐)
+}
+
+# 공개 게시글 피드(게시판/근처 목록) 응답 캐시
+POST_FEED_CACHE = {
+    'ALIAS': 'default',
+    'TIMEOUT': 30,         # 초
+    'CELL_SIZE': 0.005,    # 위치 격자 크기(도, 약 500m)
+}
+
 # WebSocket을 위한 추가 설정 - 모든 포트 허용
 ALLOWED_HOSTS = ['*']  # 모든 호스트 허용 (개발용)
 
@@ -0,0 +1,59 @@
+import unittest
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from TimeMarket_BackEnd.db_profiles import database_from_env
+
+
+class DatabaseProfileTest(SimpleTestCase):
+    def test_sqlite_is_default_and_tuned(self):
+        database = database_from_env('/srv/app', {})
+
+        self.assertEqual(database['ENGINE'], 'django.db.backends.sqlite3')
+        self.assertEqual(database['NAME'], '/srv/app/db.sqlite3')
+        self.assertEqual(database['OPTIONS']['transaction_mode'], 'IMMEDIATE')
+        self.assertEqual(database['CONN_MAX_AGE'], 0)
+        init_command = database['OPTIONS']['init_command']
+        for pragma in ('journal_mode=WAL', 'synchronous=NORMAL', 'busy_timeout=5000', 'mmap_size='):
+            self.assertIn(pragma, init_command)
+
+    def test_postgres_uses_pool_without_persistent_connections(self):
+        database = database_from_env('/srv/app', {
+            'TIMEMARKET_DB': 'postgres',
+            'POSTGRES_HOST': 'db',
+            'POSTGRES_POOL_MAX_SIZE': '40',
+        })
+
+        self.assertEqual(database['ENGINE'], 'django.db.backends.postgresql')
+        self.assertEqual(database['HOST'], 'db')
+        self.assertEqual(database['CONN_MAX_AGE'], 0)
+        self.assertEqual(database['OPTIONS']['pool']['max_size'], 40)
+
+    def test_postgres_without_pool_keeps_connections_alive(self):
+        database = database_from_env('/srv/app', {
+            'TIMEMARKET_DB': 'postgres',
+            'POSTGRES_POOL': '0',
+            'DB_CONN_MAX_AGE': '120',
+        })
+
+        self.assertNotIn('pool', database['OPTIONS'])
+        self.assertEqual(database['CONN_MAX_AGE'], 120)
+        self.assertTrue(database['CONN_HEALTH_CHECKS'])
+
+    def test_unknown_profile_is_rejected(self):
+        with self.assertRaises(ValueError):
+            database_from_env('/srv/app', {'TIMEMARKET_DB': 'mysql'})
+
+
+@unittest.skipUnless(connection.vendor == 'sqlite', 'SQLite PRAGMA 확인')
+class SqliteConnectionPragmaTest(TestCase):
+    def pragma(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute(f'PRAGMA {name}')
+            return cursor.fetchone()[0]
+
+    def test_connection_applies_init_command(self):
+        self.assertEqual(self.pragma('synchronous'), 1)  # NORMAL
+        self.assertEqual(self.pragma('busy_timeout'), 5000)
+        self.assertEqual(self.pragma('temp_store'), 2)  # MEMORY
@@ -0,0 +1,90 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from posts.models import TimePost
+from TimeMarket_BackEnd import replicas
+from TimeMarket_BackEnd.db_profiles import replicas_from_env
+from users.models import User
+
+REPLICA_ROUTING = {'REPLICAS': ['replica1'], 'STICKY_SECONDS': 60}
+
+
+@override_settings(REPLICA_ROUTING=REPLICA_ROUTING)
+class ReplicaRouterTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.router = replicas.ReplicaRouter()
+
+    def test_reads_outside_replica_views_use_primary(self):
+        self.assertIsNone(self.router.db_for_read(TimePost))
+        with replicas.track_writes():
+            self.assertIsNone(self.router.db_for_read(TimePost))
+
+    def test_reads_after_write_in_same_request_use_primary(self):
+        with replicas.track_writes() as state:
+            state.use_replica = True
+            self.assertEqual(self.router.db_for_read(TimePost), 'replica1')
+            self.assertEqual(self.router.db_for_write(TimePost), 'default')
+            self.assertIsNone(self.router.db_for_read(TimePost))
+
+    def test_write_pins_user(self):
+        user = User.objects.create_user(nickname='writer', email='writer@test.com', password='testpass')
+        with replicas.track_writes(user.pk):
+            TimePost.objects.create(user=user, title='글', description='내용', type='sale')
+        self.assertTrue(replicas.is_pinned(user))
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(self.router.allow_migrate('replica1', 'posts'))
+        self.assertIsNone(self.router.allow_migrate('default', 'posts'))
+
+    def test_replica_profile_mirrors_primary_in_tests(self):
+        databases = replicas_from_env('/srv/app', {'SQLITE_REPLICA_PATHS': '/replica/db.sqlite3'})
+
+        self.assertEqual(databases['replica1']['NAME'], '/replica/db.sqlite3')
+        self.assertEqual(databases['replica1']['TEST'], {'MIRROR': 'default'})
+        self.assertNotIn('journal_mode', databases['replica1']['OPTIONS']['init_command'])
+
+
+@override_settings(REPLICA_ROUTING=REPLICA_ROUTING)
+class ReplicaReadViewTest(TestCase):
+    """복제본 별칭 대신 default를 돌려주도록 바꿔, 읽기가 복제본으로 라우팅됐는지만 확인"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(nickname='reader', email='reader@test.com', password='testpass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        patcher = mock.patch.object(replicas, 'choose_replica', return_value='default')
+        self.choose_replica = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_list_views_read_from_replica(self):
+        for url in (reverse('review-list'), reverse('trade-history')):
+            self.choose_replica.reset_mock()
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(self.choose_replica.called, url)
+
+    def test_other_views_read_from_primary(self):
+        self.client.get(reverse('my-chats'))
+        self.assertFalse(self.choose_replica.called)
+
+    def test_user_reads_own_writes_from_primary(self):
+        response = self.client.post(reverse('timepost-create'), {
+            'title': '이사 도와드립니다', 'description': '1시간', 'type': 'sale',
+            'latitude': 37.5, 'longitude': 127.0,
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+
+        self.client.get(reverse('review-list'))
+        self.assertFalse(self.choose_replica.called)
+
+        # 다른 사용자는 계속 복제본에서 읽음
+        self.client.force_authenticate(user=User.objects.create_user(
+            nickname='other', email='other@test.com', password='testpass'))
+        self.client.get(reverse('review-list'))
+        self.assertTrue(self.choose_replica.called)
@@ -1,6 +1,8 @@
 # project/urls.py
 from django.contrib import admin
 from django.urls import path, include
+from chat.views import TradeHistoryView
+from .views import InternalStatsView, metrics_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -9,9 +11,11 @@ urlpatterns = [
     path('api/map/', include('map.urls')),
     path('api/time-posts/', include('posts.urls')),
     path('api/chat/', include('chat.urls')),
-    path('api/trades/', include('chat.urls')),  # 거래 히스토리용 추가 경로
+    path('api/trades/history/', TradeHistoryView.as_view()),  # 거래 히스토리용 추가 경로 (api/chat/history/와 같음)
     path('api/push/', include('push_notice.urls')),
     path('api/reviews/', include('review.urls')),  # 리뷰 API
+    path('api/internal/stats/', InternalStatsView.as_view(), name='internal-stats'),  # 내부 운영 지표 (관리자)
+    path('metrics', metrics_view, name='metrics'),  # Prometheus 스크레이프
 ]
 
 from django.conf import settings
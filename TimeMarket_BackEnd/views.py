@@ -0,0 +1,46 @@
+from django.http import HttpResponse, HttpResponseForbidden, HttpResponseNotFound
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from chat.throttling import get_dropped_frame_counts
+from posts.cache import get_feed_cache_stats
+from .instrumentation import get_stats, reset_stats
+from . import metrics
+
+
+class InternalStatsView(APIView):
+    """
+    내부 운영 지표 (관리자 전용)
+    - routes: HTTP 라우트 / WebSocket 이벤트별 쿼리 수·DB 시간·직렬화 시간·지연 시간 집계
+    - feed_cache: 게시글 피드 캐시 적중률
+    - dropped_frames: WebSocket 드롭 프레임 수 (사유별)
+    DELETE로 라우트 집계를 초기화합니다.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response({
+            'routes': get_stats(),
+            'feed_cache': get_feed_cache_stats(),
+            'dropped_frames': get_dropped_frame_counts(),
+        })
+
+    def delete(self, request):
+        reset_stats()
+        return Response(status=204)
+
+
+
+def metrics_view(request):
+    """
+    Prometheus 스크레이프 엔드포인트 (텍스트 형식)
+    settings.METRICS['BEARER_TOKEN']이 설정되어 있으면 Authorization: Bearer <토큰> 헤더가 필요합니다.
+    """
+    config = metrics.get_config()
+    if not config['ENABLED']:
+        return HttpResponseNotFound()
+    token = config['BEARER_TOKEN']
+    if token and request.headers.get('Authorization') != f'Bearer {token}':
+        return HttpResponseForbidden()
+    return HttpResponse(metrics.registry.render(), content_type=metrics.CONTENT_TYPE)
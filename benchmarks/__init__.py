@@ -0,0 +1,48 @@
+"""
+성능 벤치마크 스크립트 모음
+
+각 스크립트는 `python -m benchmarks.<이름>`으로 실행하며, 테스트 DB를 새로 만들어 사용합니다.
+"""
+import os
+import statistics
+import time
+from contextlib import contextmanager
+
+import django
+
+
+def setup():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'TimeMarket_BackEnd.settings')
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """벤치마크용 테스트 DB 생성 후 종료 시 삭제"""
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def measure(func, repeat):
+    """func를 repeat번 실행한 중앙값(초)과 마지막 한 번의 쿼리 수"""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    timings = []
+    for _ in range(repeat):
+        connection.queries_log.clear()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    connection.queries_log.clear()
+    with CaptureQueriesContext(connection) as queries:
+        func()
+    return statistics.median(timings), len(queries)
@@ -0,0 +1,103 @@
+"""
+JSON 렌더링 벤치마크 (DRF JSONRenderer vs ORJSONRenderer)
+
+사용법:
+    python -m benchmarks.json_rendering [--trades 2000] [--repeat 20]
+
+TradeHistoryView 응답 데이터(모든 페이지를 이어 붙인 직렬화 완료 상태)를 두 렌더러로 렌더링하는 시간을 비교합니다.
+"""
+import argparse
+import random
+from decimal import Decimal
+
+from benchmarks import measure, setup, test_database
+
+setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from rest_framework.test import APIRequestFactory, force_authenticate  # noqa: E402
+
+from chat.models import Room, TradeHistoryEntry, TradeRequest  # noqa: E402
+from chat.views import TradeHistoryView  # noqa: E402
+from posts.models import TimePost  # noqa: E402
+from TimeMarket_BackEnd.renderers import ORJSONRenderer, orjson  # noqa: E402
+
+User = get_user_model()
+
+
+def seed(trade_count):
+    rng = random.Random(42)
+    password = make_password('benchmark')
+    User.objects.bulk_create([
+        User(nickname=f'bench{i}', email=f'bench{i}@test.com', password=password) for i in range(20)
+    ])
+    users = list(User.objects.all())
+    me = users[0]
+    TimePost.objects.bulk_create([
+        TimePost(user=rng.choice(users), title=f'게시글 {i}', description='벤치마크용 게시글', type='sale', price=10000)
+        for i in range(50)
+    ])
+    posts = list(TimePost.objects.all())
+    rooms = []
+    for post in posts:
+        room = Room.objects.create(post=post)
+        room.users.add(me, post.user)
+        rooms.append(room)
+    trades = TradeRequest.objects.bulk_create([
+        TradeRequest(
+            room=room, post=room.post, requester=me, receiver=room.post.user,
+            proposed_price=Decimal(rng.randrange(1000, 50000)),
+            proposed_hours=Decimal(rng.randrange(1, 20)) / 2,
+            message='거래 요청합니다',
+        )
+        for room in (rng.choice(rooms) for _ in range(trade_count))
+    ])
+    TradeHistoryEntry.backfill(trades)
+    return me
+
+
+def fetch_history(user):
+    """TradeHistoryView의 모든 페이지 결과를 이어 붙인 응답 데이터"""
+    results, cursor = [], None
+    while True:
+        params = {'limit': TradeHistoryView.MAX_LIMIT}
+        if cursor:
+            params['cursor'] = cursor
+        request = APIRequestFactory().get('/api/chat/history/', params)
+        force_authenticate(request, user=user)
+        data = TradeHistoryView.as_view()(request).data
+        results.extend(data['results'])
+        cursor = data['next_cursor']
+        if cursor is None:
+            return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--trades', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    if orjson is None:
+        parser.exit(1, 'orjson이 설치되어 있지 않습니다.\n')
+
+    with test_database():
+        me = seed(args.trades)
+        data = fetch_history(me)
+
+        drf_renderer, orjson_renderer = JSONRenderer(), ORJSONRenderer()
+        body = orjson_renderer.render(data)
+        assert body == drf_renderer.render(data)
+
+        drf_time, _ = measure(lambda: drf_renderer.render(data), args.repeat)
+        orjson_time, _ = measure(lambda: orjson_renderer.render(data), args.repeat)
+        print(f'trades={len(data)} payload={len(body) / 1024:.0f} KiB repeat={args.repeat} (median)')
+        print(f'  JSONRenderer    {drf_time * 1000:8.2f} ms')
+        print(f'  ORJSONRenderer  {orjson_time * 1000:8.2f} ms')
+        print(f'  speedup         {drf_time / orjson_time:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,344 @@
+"""
+REST / WebSocket 핵심 경로 부하 벤치마크
+
+사용법:
+    python -m benchmarks.load [--scenarios nearby,board,my_chats,history,trade_accept,fanout]
+                              [--concurrency 10] [--requests 200] [--json results.json]
+
+테스트 DB에 합성 데이터를 채운 뒤 ASGI 애플리케이션(TimeMarket_BackEnd.asgi)을 서버 없이 프로세스 안에서 호출합니다.
+시나리오마다 동시 실행 수(--concurrency)만큼 워커가 총 --requests번 요청을 보내고
+처리량(req/s)과 지연 시간 p50/p95/p99를 출력합니다. --json으로 결과를 저장해 변경 전후를 비교할 수 있습니다.
+
+시나리오:
+    nearby        GET /api/time-posts/?lat=&lng=           (근처 게시글, 위치는 서울 일대에서 무작위)
+    board         GET /api/time-posts/board/               (게시판)
+    my_chats      GET /api/chat/match/my-chats/            (내 채팅방 목록)
+    history       GET /api/chat/match/chat/<id>/messages/  (채팅 메시지 내역)
+    trade_accept  PATCH /api/chat/match/trades/<id>/       (양쪽 수락 → 지갑 정산)
+    fanout        WebSocket 채팅 한 건이 채팅방의 모든 연결(--fanout개)에 도착할 때까지의 시간
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import random
+import time
+from decimal import Decimal
+
+from benchmarks import setup, test_database
+
+setup()
+
+from channels.testing import HttpCommunicator, WebsocketCommunicator  # noqa: E402
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from django.test import override_settings  # noqa: E402
+from rest_framework_simplejwt.tokens import AccessToken  # noqa: E402
+
+from chat.models import ChatMessage, Room, TradeEvent, TradeHistoryEntry, TradeRequest  # noqa: E402
+from chat.trade_state import initial_events  # noqa: E402
+from posts.models import TimePost  # noqa: E402
+from wallet.models import Wallet  # noqa: E402
+
+User = get_user_model()
+
+SCENARIOS = ['nearby', 'board', 'my_chats', 'history', 'trade_accept', 'fanout']
+
+# 벤치마크 중에는 WebSocket 속도 제한에 걸리지 않도록 한도를 크게 잡습니다.
+BENCHMARK_WEBSOCKET_LIMITS = {
+    'CONNECTION_RATE': 100000, 'CONNECTION_BURST': 100000,
+    'USER_RATE': 100000, 'USER_BURST': 100000,
+    'SEND_QUEUE_SIZE': 10000,
+}
+
+
+# -------------------- 데이터 --------------------
+
+class Dataset:
+    """시드된 데이터의 id와 인증 토큰"""
+
+    def __init__(self):
+        self.tokens = {}         # {user_id: access token}
+        self.rooms = []          # [(room_id, [member user_id, ...])]
+        self.trades = []         # [(trade_id, receiver_id)] - 요청자가 이미 수락한 대기 중 거래
+
+
+def seed(args):
+    rng = random.Random(args.seed)
+    password = make_password('benchmark')
+    User.objects.bulk_create([
+        User(nickname=f'bench{i}', email=f'bench{i}@test.com', password=password) for i in range(args.users)
+    ])
+    users = list(User.objects.order_by('id'))
+    Wallet.objects.bulk_create([Wallet(user=user, balance=Decimal('100000')) for user in users])
+
+    TimePost.objects.bulk_create([
+        TimePost(
+            user=rng.choice(users),
+            title=f'게시글 {i}',
+            description='벤치마크용 게시글',
+            type='sale',
+            price=rng.choice([0, 500, 5000, 15000, 30000]),
+            latitude=37.45 + rng.random() * 0.2,
+            longitude=126.85 + rng.random() * 0.2,
+        )
+        for i in range(args.posts)
+    ])
+    posts = list(TimePost.objects.select_related('user').order_by('id')[:args.rooms])
+
+    dataset = Dataset()
+    messages = []
+    trades_per_room = -(-args.requests // max(len(posts), 1))
+    for post in posts:
+        buyer = rng.choice([user for user in users if user.id != post.user_id])
+        room = Room.objects.create(post=post)
+        room.users.add(post.user, buyer)
+        dataset.rooms.append((room.id, [post.user_id, buyer.id]))
+        for i in range(args.messages):
+            sender, receiver = (buyer, post.user) if i % 2 else (post.user, buyer)
+            messages.append(ChatMessage(room=room, sender=sender, receiver=receiver, message=f'메시지 {i}'))
+        trades = TradeRequest.objects.bulk_create([
+            TradeRequest(
+                room=room, post=post, requester=buyer, receiver=post.user,
+                proposed_price=Decimal('1000'), proposed_hours=Decimal('0.5'), requester_accepted=True,
+            )
+            for _ in range(trades_per_room)
+        ])
+        TradeHistoryEntry.backfill(trades)
+        TradeEvent.objects.bulk_create([event for trade in trades for event in initial_events(trade)])
+        dataset.trades.extend((trade.id, post.user_id) for trade in trades)
+    ChatMessage.objects.bulk_create(messages)
+
+    member_ids = {user_id for _, members in dataset.rooms for user_id in members}
+    dataset.tokens = {user.id: str(AccessToken.for_user(user)) for user in users if user.id in member_ids}
+    return dataset
+
+
+# -------------------- 시나리오 --------------------
+
+class Scenario:
+    """워커마다 start → call(index) 반복 → stop 순서로 실행"""
+
+    def __init__(self, application, dataset, args):
+        self.application = application
+        self.dataset = dataset
+        self.args = args
+
+    def workers(self, concurrency):
+        return concurrency
+
+    async def start(self, worker):
+        pass
+
+    async def call(self, worker, index):
+        raise NotImplementedError
+
+    async def stop(self, worker):
+        pass
+
+
+class HttpScenario(Scenario):
+    """request(index) → (method, path, body, user_id)를 ASGI HTTP 요청으로 전송"""
+
+    def request(self, index):
+        raise NotImplementedError
+
+    async def call(self, worker, index):
+        method, path, body, user_id = self.request(index)
+        headers = [(b'host', b'testserver')]
+        if user_id is not None:
+            headers.append((b'authorization', f'Bearer {self.dataset.tokens[user_id]}'.encode()))
+        if body is not None:
+            body = json.dumps(body).encode()
+            headers.append((b'content-type', b'application/json'))
+        communicator = HttpCommunicator(self.application, method, path, body=body or b'', headers=headers)
+        response = await communicator.get_response(timeout=30)
+        await communicator.wait(timeout=30)
+        return response['status'] < 400
+
+    def room(self, index):
+        return self.dataset.rooms[index % len(self.dataset.rooms)]
+
+
+class NearbyScenario(HttpScenario):
+    def request(self, index):
+        rng = random.Random(index)
+        return 'GET', f'/api/time-posts/?lat={37.45 + rng.random() * 0.2:.5f}&lng={126.85 + rng.random() * 0.2:.5f}', None, None
+
+
+class BoardScenario(HttpScenario):
+    def request(self, index):
+        return 'GET', '/api/time-posts/board/', None, None
+
+
+class MyChatsScenario(HttpScenario):
+    def request(self, index):
+        _, members = self.room(index)
+        return 'GET', '/api/chat/match/my-chats/', None, members[index % 2]
+
+
+class HistoryScenario(HttpScenario):
+    def request(self, index):
+        room_id, members = self.room(index)
+        return 'GET', f'/api/chat/match/chat/{room_id}/messages/', None, members[0]
+
+
+class TradeAcceptScenario(HttpScenario):
+    def request(self, index):
+        trade_id, receiver_id = self.dataset.trades[index]
+        return 'PATCH', f'/api/chat/match/trades/{trade_id}/', {'receiver_accepted': True}, receiver_id
+
+
+class FanoutScenario(Scenario):
+    """워커마다 채팅방 하나에 --fanout개 연결을 열고, 채팅 한 건이 모든 연결에 도착하는 시간을 측정"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.connections = {}
+
+    def workers(self, concurrency):
+        # 워커끼리 같은 채팅방을 쓰면 서로의 메시지를 받게 되므로 채팅방 수를 넘지 않음
+        return min(concurrency, len(self.dataset.rooms))
+
+    async def start(self, worker):
+        room_id, members = self.dataset.rooms[worker % len(self.dataset.rooms)]
+        connections = []
+        for i in range(max(self.args.fanout, 1)):
+            token = self.dataset.tokens[members[i % 2]]
+            communicator = WebsocketCommunicator(self.application, f'/ws/chat/{room_id}/?token={token}')
+            connected, _ = await communicator.connect(timeout=30)
+            if not connected:
+                raise RuntimeError(f'WebSocket 연결 실패: room={room_id}')
+            connections.append(communicator)
+        self.connections[worker] = connections
+
+    async def call(self, worker, index):
+        sender, *listeners = self.connections[worker]
+        await sender.send_to(text_data=json.dumps({'type': 'chat', 'message': f'벤치마크 {index}'}))
+        frames = await asyncio.gather(*(
+            communicator.receive_json_from(timeout=30) for communicator in [sender, *listeners]
+        ))
+        return all(frame.get('type') == 'chat_message' for frame in frames)
+
+    async def stop(self, worker):
+        for communicator in self.connections.pop(worker, []):
+            await communicator.disconnect()
+
+
+SCENARIO_CLASSES = {
+    'nearby': NearbyScenario,
+    'board': BoardScenario,
+    'my_chats': MyChatsScenario,
+    'history': HistoryScenario,
+    'trade_accept': TradeAcceptScenario,
+    'fanout': FanoutScenario,
+}
+
+
+# -------------------- 실행 / 집계 --------------------
+
+def percentile(sorted_values, pct):
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def run_scenario(scenario, total, concurrency):
+    latencies = []
+    errors = 0
+    next_index = iter(range(total))
+
+    async def worker(worker_id):
+        nonlocal errors
+        await scenario.start(worker_id)
+        try:
+            for index in next_index:
+                start = time.perf_counter()
+                try:
+                    ok = await scenario.call(worker_id, index)
+                except Exception:
+                    ok = False
+                latencies.append(time.perf_counter() - start)
+                errors += not ok
+        finally:
+            await scenario.stop(worker_id)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(scenario.workers(concurrency))))
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def print_results(results):
+    print(f"{'scenario':<14}{'requests':>9}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<14}{result['requests']:>9}{result['errors']:>8}{result['throughput']:>10.1f}"
+            f"{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='쉼표로 구분한 시나리오 목록')
+    parser.add_argument('--concurrency', type=int, default=10, help='시나리오별 동시 실행 워커 수')
+    parser.add_argument('--requests', type=int, default=200, help='시나리오별 총 요청 수')
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--posts', type=int, default=2000)
+    parser.add_argument('--rooms', type=int, default=50)
+    parser.add_argument('--messages', type=int, default=100, help='채팅방별 메시지 수')
+    parser.add_argument('--fanout', type=int, default=10, help='fanout 시나리오의 채팅방별 연결 수')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--verbose', action='store_true', help='앱의 print/로그 출력을 숨기지 않음')
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = set(names) - set(SCENARIO_CLASSES)
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+
+    from TimeMarket_BackEnd.asgi import application
+
+    quiet = contextlib.ExitStack()
+    if not args.verbose:
+        quiet.enter_context(contextlib.redirect_stdout(io.StringIO()))
+        logging.disable(logging.WARNING)
+
+    results = {}
+    with test_database(), override_settings(DEBUG=False, CHAT_WEBSOCKET_LIMITS=BENCHMARK_WEBSOCKET_LIMITS):
+        with quiet:
+            dataset = seed(args)
+
+            async def run_all():
+                for name in names:
+                    scenario = SCENARIO_CLASSES[name](application, dataset, args)
+                    results[name] = await run_scenario(scenario, args.requests, args.concurrency)
+
+            asyncio.run(run_all())
+
+    print(
+        f'users={args.users} posts={args.posts} rooms={args.rooms} messages={args.messages} '
+        f'concurrency={args.concurrency} requests={args.requests} fanout={args.fanout}'
+    )
+    print_results(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'results': results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+TimePost 목록 직렬화 벤치마크 (DRF TimePostSerializer vs serialize_time_posts)
+
+사용법:
+    python -m benchmarks.post_serialization [--posts 1000] [--users 100] [--repeat 5]
+
+테스트 DB를 만들어 데이터를 채운 뒤 두 경로의 실행 시간/쿼리 수를 비교합니다.
+"""
+import argparse
+import random
+
+from benchmarks import measure, setup, test_database
+
+setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from rest_framework.request import Request  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from posts.models import TimePost  # noqa: E402
+from posts.serializers import TimePostSerializer, serialize_time_posts  # noqa: E402
+
+User = get_user_model()
+
+
+def seed(post_count, user_count):
+    rng = random.Random(42)
+    password = make_password('benchmark')
+    User.objects.bulk_create([
+        User(nickname=f'bench{i}', email=f'bench{i}@test.com', password=password) for i in range(user_count)
+    ])
+    users = list(User.objects.all())
+    TimePost.objects.bulk_create([
+        TimePost(
+            user=rng.choice(users),
+            title=f'게시글 {i}',
+            description='벤치마크용 게시글',
+            type=rng.choice(['sale', 'request']),
+            price=rng.choice([0, 500, 5000, 15000, 30000]),
+            latitude=37.5 + rng.random() * 0.2,
+            longitude=126.9 + rng.random() * 0.2,
+        )
+        for i in range(post_count)
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--posts', type=int, default=1000)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with test_database():
+        seed(args.posts, args.users)
+        request = Request(APIRequestFactory().get('/api/posts/board/', {'lat': '37.55', 'lng': '126.98'}))
+
+        def drf():
+            posts = TimePost.objects.select_related('user').order_by('-created_at')
+            return TimePostSerializer(posts, many=True, context={'request': request}).data
+
+        def fast():
+            posts = TimePost.objects.select_related('user').order_by('-created_at')
+            return serialize_time_posts(posts, request)
+
+        drf_time, drf_queries = measure(drf, args.repeat)
+        fast_time, fast_queries = measure(fast, args.repeat)
+        print(f'posts={args.posts} users={args.users} repeat={args.repeat} (median)')
+        print(f'  TimePostSerializer    {drf_time * 1000:9.1f} ms  {drf_queries:5d} queries')
+        print(f'  serialize_time_posts  {fast_time * 1000:9.1f} ms  {fast_queries:5d} queries')
+        print(f'  speedup               {drf_time / fast_time:9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class ChatConfig(AppConfig):
+    name = "chat"
+
+    def ready(self):
+        from . import signals  # noqa: F401 (거래 히스토리 갱신 시그널 등록)
@@ -1,25 +1,42 @@
-import json
+import asyncio
+from urllib.parse import parse_qs
 from channels.generic.websocket import AsyncWebsocketConsumer
-from .models import Room, ChatMessage, TradeRequest
-from users.models import User
+from .models import Room, ChatMessage, TradeRequest, RoomReadState
 from posts.models import TimePost
-from wallet.models import Wallet, Transaction
 from asgiref.sync import sync_to_async
 from django.db import transaction
+from django.core.exceptions import ValidationError
 # ✅ serializers를 import하여 데이터 형식을 통일합니다.
 from .serializers import ChatMessageSerializer, TradeRequestSerializer, TradeRequestCreateSerializer
 from rest_framework import serializers as rest_serializers
+from .trade_state import TERMINAL_STATUSES, participant_role, settle, transition
+from .throttling import (
+    TokenBucket, acquire_user_bucket, consume_all, get_limits, record_dropped_frame, release_user_bucket
+)
+from .protocol import select_codec
+from TimeMarket_BackEnd.instrumentation import InstrumentedConsumerMixin, serialization_timer
+from TimeMarket_BackEnd import metrics, replicas
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class ChatConsumer(AsyncWebsocketConsumer):
+# 거래 응답으로 허용하는 값 (그 외 값은 상태를 바꾸지 않고 에러 응답)
+TRADE_RESPONSES = ('accept', 'reject')
+
+
+class ChatConsumer(InstrumentedConsumerMixin, AsyncWebsocketConsumer):
+    # 재연결 시 한 번에 재전송하는 최대 메시지 수 (초과분은 REST로 조회)
+    REPLAY_LIMIT = 200
+
     async def connect(self):
         print(f"🔌 WebSocket 연결 시도: {self.scope}")
         self.room_name = self.scope['url_route']['kwargs']['room_name']
         self.room_group_name = f'chat_{self.room_name}'
         self.user = self.scope['user']
+        # 채팅방/상대방은 첫 이벤트에서 한 번만 조회합니다. (get_room_context)
+        self.room = None
+        self.receiver = None
         
         print(f"📍 방 이름: {self.room_name}, 사용자: {self.user}")
 
@@ -27,47 +44,167 @@ class ChatConsumer(AsyncWebsocketConsumer):
             self.room_group_name,
             self.channel_name
         )
-        await self.accept()
+        # 📦 서브프로토콜 협상: timemarket.msgpack.v1 요청 시 MessagePack, 그 외에는 JSON
+        self.codec = select_codec(self.scope.get('subprotocols'))
+        await self.accept(subprotocol=self.codec.subprotocol)
         print(f"✅ WebSocket 연결 수락됨")
+        metrics.websocket_connected(self.room_group_name)
+        self.counted_in_metrics = True
+
+        # 🚦 수신 속도 제한 (연결 단위 + 사용자 단위 토큰 버킷)
+        limits = get_limits()
+        self.connection_bucket = TokenBucket(limits['CONNECTION_RATE'], limits['CONNECTION_BURST'])
+        self.user_bucket = acquire_user_bucket(getattr(self.user, 'id', None))
+        self.max_violations = limits['MAX_VIOLATIONS']
+        self.violations = 0
+
+        # 📤 송신 대기열: 느린 클라이언트가 대기열을 가득 채우면 연결을 끊습니다.
+        self.send_queue = asyncio.Queue(maxsize=limits['SEND_QUEUE_SIZE'])
+        self.sender_task = asyncio.ensure_future(self._drain_send_queue())
+        self.closing = False
+
+        # 🔁 재연결: 마지막으로 받은 메시지 이후의 메시지를 먼저 전송한 뒤 실시간 모드로 전환
+        self.replayed_up_to = 0
+        await self.replay_missed_messages()
 
     async def disconnect(self, close_code):
+        sender_task = getattr(self, 'sender_task', None)
+        if sender_task:
+            sender_task.cancel()
+        if getattr(self, 'user_bucket', None) is not None:
+            release_user_bucket(getattr(self.user, 'id', None))
+            self.user_bucket = None
+        if getattr(self, 'counted_in_metrics', False):
+            metrics.websocket_disconnected(self.room_group_name)
+            self.counted_in_metrics = False
         await self.channel_layer.group_discard(
             self.room_group_name,
             self.channel_name
         )
 
-    async def receive(self, text_data):
-        data = json.loads(text_data)
+    async def send(self, text_data=None, bytes_data=None, close=False):
+        """송신 프레임을 대기열에 넣고, 가득 찬 경우 느린 소비자로 판단하여 연결 종료"""
+        send_queue = getattr(self, 'send_queue', None)
+        if send_queue is None:
+            await super().send(text_data=text_data, bytes_data=bytes_data, close=close)
+            return
+
+        if self.closing:
+            record_dropped_frame('closing')
+            return
+
+        try:
+            send_queue.put_nowait((text_data, bytes_data))
+        except asyncio.QueueFull:
+            record_dropped_frame('slow_consumer')
+            logger.warning(f"[WebSocket 송신 대기열 초과] room={self.room_name}, user={self.user} - 연결 종료")
+            await self._close_connection(4008)
+            return
+
+        if close:
+            await send_queue.join()
+            await self.close(close)
+
+    async def send_payload(self, payload):
+        """협상된 코덱(JSON/MessagePack)으로 이벤트 전송"""
+        with serialization_timer():
+            frame = self.codec.encode(payload)
+        await self.send(**frame)
+
+    async def _drain_send_queue(self):
+        """송신 대기열의 프레임을 순서대로 클라이언트에 전송"""
+        while True:
+            text_data, bytes_data = await self.send_queue.get()
+            try:
+                await super().send(text_data=text_data, bytes_data=bytes_data)
+            finally:
+                self.send_queue.task_done()
+
+    async def _close_connection(self, code):
+        if self.closing:
+            return
+        self.closing = True
+        await self.close(code=code)
+
+    def _allow_frame(self):
+        """연결/사용자 토큰 버킷을 모두 통과해야 프레임을 처리 (한쪽에서 거절되면 다른 쪽 토큰도 소비하지 않음)"""
+        return consume_all(self.connection_bucket, self.user_bucket)
+
+    async def receive(self, text_data=None, bytes_data=None):
+        if self.closing:
+            record_dropped_frame('closing')
+            return
+
+        if not self._allow_frame():
+            record_dropped_frame('rate_limited')
+            self.violations += 1
+            if self.violations >= self.max_violations:
+                logger.warning(f"[WebSocket 속도 제한] room={self.room_name}, user={self.user} - 제한 초과 누적으로 연결 종료")
+                await self._close_connection(4029)
+            elif self.violations == 1:
+                await self.send_error("메시지를 너무 빠르게 보내고 있습니다. 잠시 후 다시 시도해주세요.")
+            return
+        self.violations = 0
+
+        try:
+            data = self.codec.decode(text_data=text_data, bytes_data=bytes_data)
+        except Exception:
+            record_dropped_frame('malformed')
+            await self.send_error("잘못된 메시지 형식입니다.")
+            return
         message_type = data.get('type', 'chat')  # 기본값은 채팅
+        self.label_event(message_type)
         
-        if message_type == 'chat':
-            await self.handle_chat_message(data)
-        elif message_type == 'trade_request':
-            await self.handle_trade_request(data)
-        elif message_type == 'trade_response':
-            await self.handle_trade_response(data)
+        # 📖 이 이벤트에서 쓰기가 있었으면 사용자의 REST 읽기(거래 히스토리 등)를 잠시 primary로 고정
+        with replicas.track_writes(self.user.id):
+            if message_type == 'chat':
+                await self.handle_chat_message(data)
+            elif message_type == 'trade_request':
+                await self.handle_trade_request(data)
+            elif message_type == 'trade_response':
+                await self.handle_trade_response(data)
+            elif message_type == 'read':
+                await self.handle_read_receipt(data)
     
+    def _get_query_param(self, name):
+        query_params = parse_qs(self.scope.get('query_string', b'').decode())
+        return query_params.get(name, [None])[0]
+
+    async def replay_missed_messages(self):
+        """?last_message_id=N 으로 연결한 경우 N 이후 메시지를 하나의 replay 프레임으로 전송"""
+        last_message_id = self._get_query_param('last_message_id')
+        if last_message_id is None:
+            return
+        try:
+            last_message_id = int(last_message_id)
+        except ValueError:
+            return
+
+        messages, has_more = await self.get_missed_messages(last_message_id)
+        if messages is None:
+            return
+
+        # 재전송과 실시간 브로드캐스트에 모두 포함된 메시지는 chat_message에서 건너뜁니다.
+        self.replayed_up_to = messages[-1]['id'] if messages else last_message_id
+        await self.send_payload({
+            'type': 'replay',
+            'data': messages,
+            'has_more': has_more,
+        })
+
     async def handle_chat_message(self, data):
         """기존 채팅 메시지 처리"""
         message = data['message']
 
-        receiver = await self.get_receiver()
+        room, receiver = await self.get_room_context()
 
         if not receiver:
             print("🚨 상대방을 찾을 수 없어 메시지를 저장하지 않습니다.")
             return
 
-        # ✅ DB에 메시지를 저장하고, 저장된 객체를 받아옵니다.
-        new_message_obj = await self.save_message(
-            self.room_name,
-            self.user,
-            receiver,
-            message
-        )
-
-        # ✅ Serializer를 사용해 new_message_obj를 JSON으로 변환합니다.
-        #    이렇게 하면 모든 데이터 타입(id는 int, 나머지는 string 등)이 정확해집니다.
-        serialized_message = await self.serialize_message(new_message_obj)
+        # ✅ DB 저장과 Serializer 변환을 한 번의 sync 전환에서 처리합니다.
+        #    (id는 int, 나머지는 string 등 REST 응답과 같은 형식)
+        serialized_message = await self.save_message(room, receiver, message)
 
         # 그룹 전체로 직렬화된 메시지 데이터를 전송합니다.
         await self.channel_layer.group_send(
@@ -78,11 +215,25 @@ class ChatConsumer(AsyncWebsocketConsumer):
             }
         )
     
+    async def handle_read_receipt(self, data):
+        """읽음 확인 처리 - 마지막으로 읽은 메시지 포인터 갱신 후 상대방에게 알림"""
+        state = await self.mark_read(data.get('message_id'))
+        if not state:
+            return
+
+        await self.channel_layer.group_send(
+            self.room_group_name,
+            {
+                'type': 'read_receipt',
+                'user_id': self.user.id,
+                'last_read_message_id': state.last_read_message_id,
+            }
+        )
+
     async def handle_trade_request(self, data):
         """거래 요청 처리"""
         try:
-            receiver = await self.get_receiver()
-            room = await self.get_room()
+            room, receiver = await self.get_room_context()
             
             logger.info(f"[WebSocket 거래 요청 생성]")
             logger.info(f"  - 요청자(self.user): {self.user.nickname}")
@@ -123,22 +274,10 @@ class ChatConsumer(AsyncWebsocketConsumer):
             
             logger.info(f"  - ✅ 데이터 검증 완료")
             
-            # 거래 요청 생성
-            trade_request = await self.create_trade_request(
-                room=room,
-                requester=self.user,
-                receiver=receiver,
-                proposed_price=serializer.validated_data['proposed_price'],
-                proposed_hours=serializer.validated_data['proposed_hours'],
-                message=serializer.validated_data['message']
-            )
-            
-            logger.info(f"  - 생성된 거래 요청 ID: {trade_request.id}")
-            logger.info(f"  - 저장된 requester: {trade_request.requester.nickname}")
-            logger.info(f"  - 저장된 receiver: {trade_request.receiver.nickname}")
+            # 거래 요청 생성 + 직렬화 (한 번의 sync 전환)
+            serialized_trade = await self.create_trade_request(room, receiver, serializer.validated_data)
             
-            # 거래 요청 직렬화
-            serialized_trade = await self.serialize_trade_request(trade_request)
+            logger.info(f"  - 생성된 거래 요청 ID: {serialized_trade['id']}")
             
             # 그룹에 거래 요청 알림
             await self.channel_layer.group_send(
@@ -157,25 +296,19 @@ class ChatConsumer(AsyncWebsocketConsumer):
         """거래 응답 처리 (수락/거절)"""
         try:
             trade_request_id = data['trade_request_id']
-            response = data['response']  # 'accept' 또는 'reject'
-            
-            # 거래 요청이 존재하는지만 확인
-            trade_exists = await self.check_trade_exists(trade_request_id)
-            
-            if not trade_exists:
-                await self.send_error("거래 요청을 찾을 수 없습니다.")
+            response = data.get('response')  # 'accept' 또는 'reject'
+            if response not in TRADE_RESPONSES:
+                await self.send_error("응답은 'accept' 또는 'reject'여야 합니다.")
                 return
             
-            # ID만 전달하여 처리
-            updated_trade = await self.update_trade_response_by_id(trade_request_id, self.user.id, response)
+            # 존재 확인 → 상태 전이/정산 → 직렬화를 한 번의 sync 전환에서 처리
+            serialized_trade, error_msg = await self.process_trade_response(trade_request_id, response)
             
-            if not updated_trade:
-                await self.send_error("이 거래 요청에 대한 권한이 없습니다.")
+            if error_msg:
+                await self.send_error(error_msg)
                 return
             
             # 거래 상태 업데이트 알림
-            serialized_trade = await self.serialize_trade_request_by_id(trade_request_id)
-            
             await self.channel_layer.group_send(
                 self.room_group_name,
                 {
@@ -189,45 +322,91 @@ class ChatConsumer(AsyncWebsocketConsumer):
             await self.send_error(f"거래 응답 처리 중 오류가 발생했습니다: {str(e)}")
 
     async def chat_message(self, event):
+        if event['message']['id'] <= self.replayed_up_to:
+            return
         # ✅ 받은 데이터를 그대로 클라이언트에게 전송합니다.
-        await self.send(text_data=json.dumps({
+        await self.send_payload({
             'type': 'chat_message',
             'data': event['message']
-        }))
+        })
     
     async def trade_request_notification(self, event):
         """거래 요청 알림"""
-        await self.send(text_data=json.dumps({
+        await self.send_payload({
             'type': 'trade_request',
             'data': event['trade_request']
-        }))
+        })
     
     async def trade_status_update(self, event):
         """거래 상태 업데이트 알림"""
-        await self.send(text_data=json.dumps({
+        await self.send_payload({
             'type': 'trade_status_update',
             'data': event['trade_request'],
             'is_completed': event['is_completed']
-        }))
+        })
     
+    async def read_receipt(self, event):
+        """읽음 확인 알림"""
+        await self.send_payload({
+            'type': 'read_receipt',
+            'user_id': event['user_id'],
+            'last_read_message_id': event['last_read_message_id'],
+        })
+
     async def send_error(self, message):
         """에러 메시지 전송"""
-        await self.send(text_data=json.dumps({
+        await self.send_payload({
             'type': 'error',
             'message': message
-        }))
+        })
+
+    async def get_room_context(self):
+        """
+        (채팅방, 상대방) - async ORM으로 연결당 한 번만 조회합니다. (채팅방 참여자는 바뀌지 않음)
+        채팅방이 없으면 (None, None)
+        """
+        if self.receiver is None:
+            try:
+                self.room = await Room.objects.select_related('post__user').aget(id=int(self.room_name))
+            except Room.DoesNotExist:
+                return None, None
+            self.receiver = await self.room.users.exclude(id=self.user.id).afirst()
+        return self.room, self.receiver
 
     @sync_to_async
-    def save_message(self, room_id, sender, receiver, message):
-        room = Room.objects.get(id=int(room_id))
-        # ✅ create()는 생성된 객체를 반환합니다.
-        return ChatMessage.objects.create(room=room, sender=sender, receiver=receiver, message=message)
+    def save_message(self, room, receiver, message):
+        """메시지 저장 + 안 읽은 수 갱신 + 직렬화"""
+        with transaction.atomic():
+            new_message = ChatMessage.objects.create(room=room, sender=self.user, receiver=receiver, message=message)
+            RoomReadState.record_new_message(new_message)
+        fake_request = self._create_fake_request()
+        return ChatMessageSerializer(new_message, context={'request': fake_request}).data
 
     @sync_to_async
-    def get_receiver(self):
-        room = Room.objects.prefetch_related('users').get(id=int(self.room_name))
-        receiver = room.users.exclude(id=self.user.id).first()
-        return receiver
+    def mark_read(self, message_id):
+        """읽음 확인 저장 (채팅방 참여자가 아니면 None - 알림도 보내지 않음)"""
+        if message_id is not None:
+            try:
+                message_id = int(message_id)
+            except (TypeError, ValueError):
+                return None
+        return RoomReadState.mark_read(int(self.room_name), self.user.id, message_id)
+
+    @sync_to_async
+    def get_missed_messages(self, last_message_id):
+        """last_message_id 이후 메시지 조회 (채팅방 참여자만 가능)"""
+        if not Room.objects.filter(id=int(self.room_name), users__id=self.user.id).exists():
+            return None, False
+
+        messages = list(
+            ChatMessage.objects.filter(room_id=int(self.room_name), id__gt=last_message_id)
+            .select_related('sender')
+            .order_by('id')[:self.REPLAY_LIMIT + 1]
+        )
+        has_more = len(messages) > self.REPLAY_LIMIT
+        messages = messages[:self.REPLAY_LIMIT]
+        fake_request = self._create_fake_request()
+        return ChatMessageSerializer(messages, many=True, context={'request': fake_request}).data, has_more
 
     def _create_fake_request(self):
         """WebSocket에서 사용할 가짜 request 객체 생성"""
@@ -244,72 +423,37 @@ class ChatConsumer(AsyncWebsocketConsumer):
         
         return FakeRequest(self.scope)
     
-    # ✅ 메시지 객체를 직렬화하는 헬퍼 함수 추가
     @sync_to_async
-    def serialize_message(self, message_obj):
-        fake_request = self._create_fake_request()
-        return ChatMessageSerializer(message_obj, context={'request': fake_request}).data
-    
-    @sync_to_async
-    def get_room(self):
-        """현재 채팅방 객체 가져오기"""
-        try:
-            return Room.objects.select_related('post__user').get(id=int(self.room_name))
-        except Room.DoesNotExist:
-            return None
-    
-    @sync_to_async
-    def create_trade_request(self, room, requester, receiver, proposed_price, proposed_hours, message):
-        """거래 요청 생성"""
-        return TradeRequest.objects.create(
+    def create_trade_request(self, room, receiver, validated_data):
+        """거래 요청 생성 후 직렬화된 데이터 반환"""
+        trade_request = TradeRequest.objects.create(
             room=room,
             post=room.post,
-            requester=requester,
+            requester=self.user,
             receiver=receiver,
-            proposed_price=proposed_price,
-            proposed_hours=proposed_hours,
-            message=message
+            **validated_data
         )
+        fake_request = self._create_fake_request()
+        return TradeRequestSerializer(trade_request, context={'request': fake_request}).data
     
     @sync_to_async
-    def get_trade_request(self, trade_request_id):
-        """거래 요청 가져오기"""
-        try:
-            return TradeRequest.objects.get(id=trade_request_id)
-        except TradeRequest.DoesNotExist:
-            return None
-    
-    @sync_to_async
-    def save_trade_request(self, trade_request):
-        """거래 요청 저장"""
-        trade_request.save()
-        return trade_request
-    
-    @sync_to_async
-    def check_trade_exists(self, trade_request_id):
-        """거래 요청 존재 여부 확인"""
-        return TradeRequest.objects.filter(id=trade_request_id).exists()
-    
-    async def update_trade_response_by_id(self, trade_request_id, user_id, response):
-        """거래 응답 업데이트 및 완료 확인 (ID 기반)"""
-        logger.info(f"[WebSocket 거래 응답] Trade #{trade_request_id} by user #{user_id}")
+    def process_trade_response(self, trade_request_id, response):
+        """거래 응답 처리 후 (직렬화된 거래 요청, 에러 메시지) 반환"""
+        if not TradeRequest.objects.filter(id=trade_request_id).exists():
+            return None, "거래 요청을 찾을 수 없습니다."
+
+        logger.info(f"[WebSocket 거래 응답] Trade #{trade_request_id} by user #{self.user.id}")
         logger.info(f"  - 응답: {response}")
-        
-        # ID만 전달하여 sync 함수에서 다시 조회
-        # 성공 여부만 리턴 (True/False/None)
-        result = await self._update_trade_response_sync(trade_request_id, user_id, response)
-        return result
-    
-    @sync_to_async
-    def serialize_trade_request_by_id(self, trade_request_id):
-        """거래 요청 직렬화 (ID 기반)"""
+        if not self._update_trade_response_sync(trade_request_id, self.user.id, response):
+            return None, "이 거래 요청에 대한 권한이 없습니다."
+
         trade_request = TradeRequest.objects.select_related('post__user', 'requester', 'receiver').get(id=trade_request_id)
         fake_request = self._create_fake_request()
-        return TradeRequestSerializer(trade_request, context={'request': fake_request}).data
+        return TradeRequestSerializer(trade_request, context={'request': fake_request}).data, None
     
-    @sync_to_async
     def _update_trade_response_sync(self, trade_request_id, user_id, response):
-        """거래 응답 업데이트 및 처리 (모든 동기 로직을 하나로 통합)"""
+        """거래 응답을 상태 머신(chat.trade_state) 전이로 처리하고, 양쪽 모두 수락하면 정산"""
+        error = None
         
         # 🔒 트랜잭션 전체를 atomic으로 감싸서 동시성 문제 방지
         with transaction.atomic():
@@ -318,32 +462,25 @@ class ChatConsumer(AsyncWebsocketConsumer):
                 'post__user', 'requester', 'receiver'
             ).get(id=trade_request_id)
             
-            user = User.objects.get(id=user_id)
-            
             # ✅ 이미 처리된 거래는 재처리하지 않음
-            if trade_request.status in ['completed', 'rejected', 'cancelled']:
+            if trade_request.status in TERMINAL_STATUSES:
                 logger.warning(f"[거래 응답 거부] Trade #{trade_request_id} - 이미 처리된 거래 (상태: {trade_request.status})")
                 return False
             
             # 사용자가 요청자인지 수신자인지 확인
-            if trade_request.requester.id == user.id:
-                trade_request.requester_accepted = (response == 'accept')
-                logger.info(f"  - 요청자({user.nickname})가 {'수락' if response == 'accept' else '거절'}")
-            elif trade_request.receiver.id == user.id:
-                trade_request.receiver_accepted = (response == 'accept')
-                logger.info(f"  - 수신자({user.nickname})가 {'수락' if response == 'accept' else '거절'}")
-            else:
+            if participant_role(trade_request, user_id) is None:
                 logger.warning(f"  - ❌ 권한 없음")
                 return None  # 권한 없음
             
-            trade_request.save()
-            
-            # 거절인 경우 상태를 바로 거절로 변경
+            # 거절인 경우 상태를 바로 거절로 변경 (응답 값은 handle_trade_response에서 검증)
             if response == 'reject':
-                trade_request.status = 'rejected'
-                trade_request.save()
+                transition(trade_request, 'rejected', actor_id=user_id)
                 logger.info(f"  - 거래 거절됨")
                 return True
+            if response != 'accept':
+                return None
+
+            transition(trade_request, 'accepted', actor_id=user_id)
             
             # 양쪽 모두 수락했는지 확인
             if not (trade_request.requester_accepted and trade_request.receiver_accepted):
@@ -352,155 +489,18 @@ class ChatConsumer(AsyncWebsocketConsumer):
             
             # 🎉 양쪽 모두 수락! 거래 처리 시작
             logger.info(f"  - 🎉 양쪽 모두 수락! 거래 처리 시작")
-            
+            settlement = metrics.start_settlement('websocket')
             try:
-                post = trade_request.post
-                requester = trade_request.requester
-                receiver = trade_request.receiver
-                proposed_hours = trade_request.proposed_hours
-                
-                logger.info(f"[거래 처리 시작] Trade #{trade_request.id}")
-                logger.info(f"  - 게시글 ID: {post.id}")
-                logger.info(f"  - 게시글 타입: {post.type} ({post.get_type_display()})")
-                logger.info(f"  - 게시글 작성자: {post.user.nickname}")
-                logger.info(f"  - 거래 요청자: {requester.nickname}")
-                logger.info(f"  - 거래 수신자: {receiver.nickname}")
-                logger.info(f"  - 거래 시간: {proposed_hours}시간")
-                
-                # ✅ 게시글 타입에 따라 역할 구분 및 검증
-                if post.type == 'sale':
-                    # 판매 글: 게시글 작성자가 판매자, 거래 요청자가 구매자
-                    seller = post.user
-                    buyer = requester
-                    
-                    # ✅ 검증: 구매자는 판매자가 아니어야 함
-                    if buyer.id == seller.id:
-                        logger.error(f"  - ❌ 검증 실패: 자신의 판매글은 구매할 수 없음")
-                        trade_request.status = 'rejected'
-                        trade_request.save()
-                        raise rest_serializers.ValidationError("자신의 판매글은 구매할 수 없습니다.")
-                    
-                    payer = buyer      # 구매자가 지불
-                    payee = seller     # 판매자가 받음
-                    
-                    logger.info(f"  - [판매 타입] 구매자({payer.nickname})가 판매자({payee.nickname})에게 {proposed_hours}시간 지불")
-                    
-                elif post.type == 'request':
-                    # 구인 글: 게시글 작성자가 구인자(고용주), 거래 요청자가 지원자(일꾼)
-                    employer = post.user
-                    worker = requester
-                    
-                    # ✅ 검증: 지원자는 구인자가 아니어야 함
-                    if worker.id == employer.id:
-                        logger.error(f"  - ❌ 검증 실패: 자신의 구인글에는 지원할 수 없음")
-                        trade_request.status = 'rejected'
-                        trade_request.save()
-                        raise rest_serializers.ValidationError("자신의 구인글에는 지원할 수 없습니다.")
-                    
-                    payer = employer   # 구인자가 지불
-                    payee = worker     # 지원자가 받음
-                    
-                    logger.info(f"  - [구인 타입] 구인자({payer.nickname})가 지원자({payee.nickname})에게 {proposed_hours}시간 지불")
-                    
-                else:
-                    logger.error(f"  - ❌ 알 수 없는 게시글 타입: {post.type}")
-                    trade_request.status = 'rejected'
-                    trade_request.save()
-                    raise rest_serializers.ValidationError(f"알 수 없는 게시글 타입: {post.type}")
-                
-                # 🔒 지갑에 락을 걸어 동시성 문제 방지
-                # 지갑이 없으면 생성
-                payer_wallet, _ = Wallet.objects.get_or_create(user=payer)
-                payee_wallet, _ = Wallet.objects.get_or_create(user=payee)
-                
-                # 다시 락을 걸어서 조회 (생성 후에도 락 필요)
-                payer_wallet = Wallet.objects.select_for_update().get(id=payer_wallet.id)
-                payee_wallet = Wallet.objects.select_for_update().get(id=payee_wallet.id)
-                
-                logger.info(f"  - 거래 전 잔액:")
-                logger.info(f"    * {payer.nickname} (지불자): {payer_wallet.balance}시간")
-                logger.info(f"    * {payee.nickname} (수령자): {payee_wallet.balance}시간")
-                
-                # ✅ 잔액 확인
-                if payer_wallet.balance < proposed_hours:
-                    logger.warning(f"  - ❌ 잔액 부족!")
-                    logger.warning(f"    * {payer.nickname}님의 잔액: {payer_wallet.balance}시간")
-                    logger.warning(f"    * 필요 금액: {proposed_hours}시간")
-                    logger.warning(f"    * 부족 금액: {proposed_hours - payer_wallet.balance}시간")
-                    
-                    trade_request.status = 'rejected'
-                    trade_request.save()
-                    
-                    raise rest_serializers.ValidationError(
-                        f"{payer.nickname}님의 잔액이 부족하여 거래가 거절되었습니다. "
-                        f"필요: {proposed_hours}시간, 현재 잔액: {payer_wallet.balance}시간"
-                    )
-                
-                logger.info(f"  - ✅ 잔액 충분! 거래 실행 중...")
-                
-                # 💰 거래 실행
-                payer_wallet.balance -= proposed_hours
-                payee_wallet.balance += proposed_hours
-                
-                payer_wallet.save()
-                payee_wallet.save()
-                
-                logger.info(f"  - 거래 후 잔액:")
-                logger.info(f"    * {payer.nickname}: {payer_wallet.balance}시간 (변경: -{proposed_hours})")
-                logger.info(f"    * {payee.nickname}: {payee_wallet.balance}시간 (변경: +{proposed_hours})")
-                
-                # 📝 거래 내역 기록
-                transaction_note_payer = (
-                    f"[{post.get_type_display()}] 거래 #{trade_request.id}: "
-                    f"{payee.nickname}님에게 {proposed_hours}시간 지불 (게시글: {post.title})"
-                )
-                transaction_note_payee = (
-                    f"[{post.get_type_display()}] 거래 #{trade_request.id}: "
-                    f"{payer.nickname}님으로부터 {proposed_hours}시간 받음 (게시글: {post.title})"
-                )
-                
-                Transaction.objects.create(
-                    wallet=payer_wallet,
-                    transaction_type='withdraw',
-                    amount=proposed_hours,
-                    note=transaction_note_payer
-                )
-                
-                Transaction.objects.create(
-                    wallet=payee_wallet,
-                    transaction_type='deposit',
-                    amount=proposed_hours,
-                    note=transaction_note_payee
-                )
-                
-                logger.info(f"  - 거래 내역 기록 완료")
-                
-                # ✅ 거래 완료 상태로 변경
-                trade_request.status = 'completed'
-                trade_request.save()
-                
-                logger.info(f"[거래 완료] Trade #{trade_request.id} ✅")
-                logger.info(f"  - 상태: completed")
-                logger.info(f"  - 거래 타입: {post.get_type_display()}")
-                logger.info(f"  - {payer.nickname} → {payee.nickname}: {proposed_hours}시간")
-                
-                return True
-                
-            except rest_serializers.ValidationError as e:
-                # 검증 오류는 그대로 전달
-                logger.error(f"  - ❌ 검증 오류: {str(e)}")
+                settle(trade_request)
+                settlement.finish('completed')
+            except ValidationError as e:
+                settlement.finish('rejected')
+                error = e
+            except Exception:
+                settlement.finish('error')
                 raise
-            except Exception as e:
-                # 기타 오류 처리
-                logger.error(f"  - ❌ 거래 처리 실패: {str(e)}", exc_info=True)
-                trade_request.refresh_from_db()
-                if trade_request.status not in ['rejected', 'completed']:
-                    trade_request.status = 'rejected'
-                    trade_request.save()
-                raise rest_serializers.ValidationError(f"거래 처리 중 오류가 발생했습니다: {str(e)}")
-    
-    @sync_to_async
-    def serialize_trade_request(self, trade_request):
-        """거래 요청 직렬화"""
-        fake_request = self._create_fake_request()
-        return TradeRequestSerializer(trade_request, context={'request': fake_request}).data
\ No newline at end of file
+
+        if error is not None:
+            # 정산 실패(거절 처리)는 커밋한 뒤 오류로 알림
+            raise rest_serializers.ValidationError(error.messages)
+        return True
@@ -0,0 +1,51 @@
+"""
+사용자별 거래 히스토리 조회 (TradeHistoryEntry 기반 keyset 페이지네이션)
+
+- 정렬: 거래 요청 생성 시각 최신순, 같은 시각이면 히스토리 행 id 역순
+- 커서: 마지막 행의 (created_at, id)를 담은 불투명(opaque) 문자열
+- (user, created_at, id) 인덱스 범위 스캔이므로 페이지 깊이와 관계없이 같은 비용으로 조회됩니다.
+"""
+import base64
+import json
+
+from django.utils.dateparse import parse_datetime
+
+from .models import TradeHistoryEntry
+
+
+def encode_cursor(entry):
+    position = {'t': entry.created_at.isoformat(), 'i': entry.id}
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_cursor(cursor):
+    """잘못된 커서는 ValueError"""
+    if not cursor:
+        return None
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        created_at, entry_id = parse_datetime(position['t']), int(position['i'])
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+    if created_at is None:
+        raise ValueError("잘못된 커서입니다.")
+    return created_at, entry_id
+
+
+def history_queryset(user, cursor=None):
+    """커서 이후의 히스토리 행 (최신순)"""
+    entries = TradeHistoryEntry.objects.filter(user=user)
+    position = decode_cursor(cursor)
+    if position:
+        # (created_at, id) < 커서: created_at <= t 범위 스캔 후 같은 시각의 이미 본 행 제외
+        created_at, entry_id = position
+        entries = entries.filter(created_at__lte=created_at).exclude(created_at=created_at, id__gte=entry_id)
+    return entries.select_related('trade__post__user', 'trade__requester', 'trade__receiver').order_by('-created_at', '-id')
+
+
+def trade_history_page(user, cursor=None, limit=20):
+    """(거래 요청 목록, 다음 커서) - 다음 페이지가 없으면 커서는 None"""
+    entries = list(history_queryset(user, cursor)[:limit + 1])
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    return [entry.trade for entry in entries], encode_cursor(entries[-1]) if has_more else None
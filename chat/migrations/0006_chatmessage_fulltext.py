@@ -0,0 +1,13 @@
+from django.db import migrations
+
+from TimeMarket_BackEnd.fulltext import create_index_operation
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chat", "0005_roomreadstate"),
+    ]
+
+    operations = [
+        create_index_operation("chat_chatmessage", "chat_chatmessage_fts", ["message"]),
+    ]
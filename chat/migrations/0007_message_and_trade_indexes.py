@@ -0,0 +1,34 @@
+# Generated by Django 5.2.1 on 2026-10-19 12:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0006_chatmessage_fulltext"),
+        ("posts", "0005_timepost_created_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chatmessage",
+            index=models.Index(
+                fields=["room", "timestamp"], name="chat_message_room_ts_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="traderequest",
+            index=models.Index(
+                fields=["room", "-created_at"], name="chat_trade_room_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="traderequest",
+            index=models.Index(
+                fields=["status", "-created_at"], name="chat_trade_status_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:09
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_history(apps, schema_editor):
+    """기존 거래 요청으로 요청자/수신자 거래 히스토리 채우기"""
+    TradeRequest = apps.get_model("chat", "TradeRequest")
+    TradeHistoryEntry = apps.get_model("chat", "TradeHistoryEntry")
+    TradeHistoryEntry.objects.bulk_create(
+        [
+            TradeHistoryEntry(
+                user_id=user_id,
+                trade_id=trade.id,
+                status=trade.status,
+                created_at=trade.created_at,
+                updated_at=trade.updated_at,
+            )
+            for trade in TradeRequest.objects.iterator()
+            for user_id in {trade.requester_id, trade.receiver_id}
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0007_message_and_trade_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TradeHistoryEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기중"),
+                            ("accepted", "수락됨"),
+                            ("rejected", "거절됨"),
+                            ("completed", "완료됨"),
+                            ("cancelled", "취소됨"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "trade",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="history_entries",
+                        to="chat.traderequest",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="trade_history",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["user", "-created_at", "-id"],
+                        name="chat_trade_history_cursor_idx",
+                    )
+                ],
+                "unique_together": {("user", "trade")},
+            },
+        ),
+        migrations.RunPython(populate_history, migrations.RunPython.noop),
+    ]
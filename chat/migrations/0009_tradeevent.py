@@ -0,0 +1,130 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:14
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+TERMINAL_STATUSES = ("completed", "rejected", "cancelled")
+
+
+def populate_events(apps, schema_editor):
+    """기존 거래 요청의 현재 상태를 생성/수락/종료 이벤트로 기록"""
+    TradeRequest = apps.get_model("chat", "TradeRequest")
+    TradeEvent = apps.get_model("chat", "TradeEvent")
+    events = []
+    for trade in TradeRequest.objects.iterator():
+        events.append(
+            TradeEvent(
+                trade_id=trade.id,
+                event_type="created",
+                actor_id=trade.requester_id,
+                status="pending",
+                created_at=trade.created_at,
+            )
+        )
+        for actor_id, accepted in (
+            (trade.requester_id, trade.requester_accepted),
+            (trade.receiver_id, trade.receiver_accepted),
+        ):
+            if accepted:
+                events.append(
+                    TradeEvent(
+                        trade_id=trade.id,
+                        event_type="accepted",
+                        actor_id=actor_id,
+                        status="pending",
+                        created_at=trade.updated_at,
+                    )
+                )
+        if trade.status in TERMINAL_STATUSES:
+            events.append(
+                TradeEvent(
+                    trade_id=trade.id,
+                    event_type=trade.status,
+                    status=trade.status,
+                    created_at=trade.updated_at,
+                )
+            )
+    TradeEvent.objects.bulk_create(events, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0008_tradehistoryentry"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TradeEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event_type",
+                    models.CharField(
+                        choices=[
+                            ("created", "요청"),
+                            ("accepted", "수락"),
+                            ("withdrawn", "수락 취소"),
+                            ("rejected", "거절"),
+                            ("completed", "완료"),
+                            ("failed", "정산 실패"),
+                            ("cancelled", "취소"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기중"),
+                            ("accepted", "수락됨"),
+                            ("rejected", "거절됨"),
+                            ("completed", "완료됨"),
+                            ("cancelled", "취소됨"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("note", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "actor",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "trade",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="events",
+                        to="chat.traderequest",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["trade", "id"], name="chat_trade_event_trade_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_events, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 from posts.models import TimePost
@@ -24,10 +26,78 @@ class ChatMessage(models.Model):
     message = models.TextField()
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 채팅방 메시지 내역 (방별 시간순)
+            models.Index(fields=['room', 'timestamp'], name='chat_message_room_ts_idx'),
+        ]
+
     def __str__(self):
         return f"{self.sender} -> {self.receiver}: {self.message[:20]}"
 
 
+class RoomReadState(models.Model):
+    """
+    채팅방별 사용자 읽음 상태
+    - last_read_message: 마지막으로 읽은 메시지 포인터
+    - unread_count: 메시지 저장/읽음 확인 시 증분 갱신되는 안 읽은 메시지 수
+    """
+    room = models.ForeignKey(Room, on_delete=models.CASCADE, related_name='read_states')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='room_read_states')
+    last_read_message = models.ForeignKey(
+        ChatMessage, on_delete=models.SET_NULL, null=True, blank=True, related_name='+'
+    )
+    unread_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = (('room', 'user'),)
+
+    def __str__(self):
+        return f"Room {self.room_id} / User {self.user_id}: 안 읽음 {self.unread_count}"
+
+    @classmethod
+    def record_new_message(cls, message):
+        """새 메시지 저장 시 수신자의 안 읽은 메시지 수 1 증가"""
+        state, created = cls.objects.get_or_create(
+            room_id=message.room_id,
+            user_id=message.receiver_id,
+            defaults={'unread_count': 1},
+        )
+        if not created:
+            cls.objects.filter(id=state.id).update(
+                unread_count=F('unread_count') + 1,
+                updated_at=timezone.now(),
+            )
+
+    @classmethod
+    def mark_read(cls, room_id, user_id, message_id=None):
+        """
+        읽음 확인 처리 - message_id까지 읽은 것으로 표시 (없으면 방의 최신 메시지)
+        포인터는 뒤로 이동하지 않으며, 갱신된 상태 객체를 반환합니다. (채팅방 참여자가 아니면 None)
+        """
+        if not Room.objects.filter(id=room_id, users__id=user_id).exists():
+            return None
+
+        messages = ChatMessage.objects.filter(room_id=room_id)
+        if message_id is None:
+            message_id = messages.order_by('-id').values_list('id', flat=True).first()
+            if message_id is None:
+                return None
+        elif not messages.filter(id=message_id).exists():
+            return None
+
+        with transaction.atomic():
+            state, _ = cls.objects.select_for_update().get_or_create(room_id=room_id, user_id=user_id)
+            if state.last_read_message_id and state.last_read_message_id >= message_id:
+                return state
+
+            state.last_read_message_id = message_id
+            state.unread_count = messages.filter(receiver_id=user_id, id__gt=message_id).count()
+            state.save(update_fields=['last_read_message', 'unread_count', 'updated_at'])
+            return state
+
+
 class TradeRequest(models.Model):
     TRADE_STATUS_CHOICES = [
         ('pending', '대기중'),
@@ -69,170 +139,123 @@ class TradeRequest(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # 채팅방 거래 요청 목록 (방별 최신순) / 상태별 거래 조회
+            models.Index(fields=['room', '-created_at'], name='chat_trade_room_created_idx'),
+            models.Index(fields=['status', '-created_at'], name='chat_trade_status_created_idx'),
+        ]
+
     def __str__(self):
         return f"거래요청 {self.id}: {self.requester} -> {self.receiver}"
 
     def check_completion(self):
         """양쪽 모두 수락했는지 확인하고 상태 업데이트"""
+        from .trade_state import transition
+
         if self.requester_accepted and self.receiver_accepted and self.status == 'pending':
-            self.status = 'completed'
-            self.save()
+            transition(self, 'completed')
             return True
         return False
     
     def process_trade(self):
         """
-        거래 처리 메서드 - 양쪽 모두 수락했을 때 실제 거래 실행
+        거래 처리 메서드 - 양쪽 모두 수락했을 때 실제 거래 실행 (chat.trade_state.settle)
         Returns: True if successful, raises ValidationError otherwise
         """
-        from wallet.models import Wallet, Transaction
-        
+        from .trade_state import TERMINAL_STATUSES, settle
+
         # ✅ 이미 처리된 거래는 재처리하지 않음
-        if self.status in ['completed', 'rejected', 'cancelled']:
+        if self.status in TERMINAL_STATUSES:
             logger.warning(f"[거래 처리 거부] Trade #{self.id} - 이미 처리된 거래 (상태: {self.status})")
             raise ValidationError(f"이미 처리된 거래입니다 (상태: {self.get_status_display()})")
         
         # 양쪽 모두 수락했는지 확인
         if not (self.requester_accepted and self.receiver_accepted):
             raise ValidationError("양쪽 모두 수락해야 거래를 진행할 수 있습니다.")
-        
-        logger.info(f"[거래 처리 시작] Trade #{self.id}")
-        
-        post = self.post
-        requester = self.requester
-        proposed_hours = self.proposed_hours
-        
-        logger.info(f"  - 게시글 타입: {post.type} ({post.get_type_display()})")
-        logger.info(f"  - 게시글 작성자: {post.user.nickname}")
-        logger.info(f"  - 거래 요청자: {requester.nickname}")
-        logger.info(f"  - 거래 시간: {proposed_hours}시간")
-        
-        # ✅ 게시글 타입에 따라 역할 구분 및 검증
-        if post.type == 'sale':
-            # 판매 글: 게시글 작성자가 판매자, 거래 요청자가 구매자
-            seller = post.user
-            buyer = requester
-            
-            if buyer.id == seller.id:
-                logger.error(f"  - ❌ 검증 실패: 자신의 판매글은 구매할 수 없음")
-                self.status = 'rejected'
-                self.save()
-                raise ValidationError("자신의 판매글은 구매할 수 없습니다.")
-            
-            payer = buyer      # 구매자가 지불
-            payee = seller     # 판매자가 받음
-            
-            logger.info(f"  - [판매 타입] 구매자({payer.nickname})가 판매자({payee.nickname})에게 {proposed_hours}시간 지불")
-            
-        elif post.type == 'request':
-            # 구인 글: 게시글 작성자가 구인자(고용주), 거래 요청자가 지원자(일꾼)
-            employer = post.user
-            worker = requester
-            
-            if worker.id == employer.id:
-                logger.error(f"  - ❌ 검증 실패: 자신의 구인글에는 지원할 수 없음")
-                self.status = 'rejected'
-                self.save()
-                raise ValidationError("자신의 구인글에는 지원할 수 없습니다.")
-            
-            payer = employer   # 구인자가 지불
-            payee = worker     # 지원자가 받음
-            
-            logger.info(f"  - [구인 타입] 구인자({payer.nickname})가 지원자({payee.nickname})에게 {proposed_hours}시간 지불")
-            
-        else:
-            logger.error(f"  - ❌ 알 수 없는 게시글 타입: {post.type}")
-            self.status = 'rejected'
-            self.save()
-            raise ValidationError(f"알 수 없는 게시글 타입: {post.type}")
-        
-        # 🔒 트랜잭션으로 거래 처리
-        try:
-            with transaction.atomic():
-                # 지갑 조회 또는 생성 후 락 걸기
-                payer_wallet, _ = Wallet.objects.get_or_create(user=payer)
-                payee_wallet, _ = Wallet.objects.get_or_create(user=payee)
-                
-                # 락을 걸어서 다시 조회
-                payer_wallet = Wallet.objects.select_for_update().get(id=payer_wallet.id)
-                payee_wallet = Wallet.objects.select_for_update().get(id=payee_wallet.id)
-                
-                logger.info(f"  - 거래 전 잔액:")
-                logger.info(f"    * {payer.nickname} (지불자): {payer_wallet.balance}시간")
-                logger.info(f"    * {payee.nickname} (수령자): {payee_wallet.balance}시간")
-                
-                # ✅ 잔액 확인
-                if payer_wallet.balance < proposed_hours:
-                    logger.warning(f"  - ❌ 잔액 부족!")
-                    logger.warning(f"    * {payer.nickname}님의 잔액: {payer_wallet.balance}시간")
-                    logger.warning(f"    * 필요 금액: {proposed_hours}시간")
-                    
-                    self.status = 'rejected'
-                    self.save()
-                    
-                    raise ValidationError(
-                        f"{payer.nickname}님의 잔액이 부족하여 거래가 거절되었습니다. "
-                        f"필요: {proposed_hours}시간, 현재 잔액: {payer_wallet.balance}시간"
-                    )
-                
-                logger.info(f"  - ✅ 잔액 충분! 거래 실행 중...")
-                
-                # 💰 거래 실행
-                payer_wallet.balance -= proposed_hours
-                payee_wallet.balance += proposed_hours
-                
-                payer_wallet.save()
-                payee_wallet.save()
-                
-                logger.info(f"  - 거래 후 잔액:")
-                logger.info(f"    * {payer.nickname}: {payer_wallet.balance}시간 (변경: -{proposed_hours})")
-                logger.info(f"    * {payee.nickname}: {payee_wallet.balance}시간 (변경: +{proposed_hours})")
-                
-                # 📝 거래 내역 기록
-                transaction_note_payer = (
-                    f"[{post.get_type_display()}] 거래 #{self.id}: "
-                    f"{payee.nickname}님에게 {proposed_hours}시간 지불 (게시글: {post.title})"
-                )
-                transaction_note_payee = (
-                    f"[{post.get_type_display()}] 거래 #{self.id}: "
-                    f"{payer.nickname}님으로부터 {proposed_hours}시간 받음 (게시글: {post.title})"
-                )
-                
-                Transaction.objects.create(
-                    wallet=payer_wallet,
-                    transaction_type='withdraw',
-                    amount=proposed_hours,
-                    note=transaction_note_payer
-                )
-                
-                Transaction.objects.create(
-                    wallet=payee_wallet,
-                    transaction_type='deposit',
-                    amount=proposed_hours,
-                    note=transaction_note_payee
-                )
-                
-                logger.info(f"  - 거래 내역 기록 완료")
-                
-                # ✅ 거래 완료 상태로 변경
-                self.status = 'completed'
-                self.save()
-                
-                logger.info(f"[거래 완료] Trade #{self.id} ✅")
-                logger.info(f"  - 거래 타입: {post.get_type_display()}")
-                logger.info(f"  - {payer.nickname} → {payee.nickname}: {proposed_hours}시간")
-                
-                return True
-                
-        except ValidationError:
-            # ValidationError는 그대로 전달
-            raise
-        except Exception as e:
-            # 기타 오류 처리
-            logger.error(f"  - ❌ 거래 처리 실패: {str(e)}", exc_info=True)
-            self.refresh_from_db()
-            if self.status not in ['rejected', 'completed']:
-                self.status = 'rejected'
-                self.save()
-            raise ValidationError(f"거래 처리 중 오류가 발생했습니다: {str(e)}")
 
+        settle(self)
+        return True
+
+
+class TradeEvent(models.Model):
+    """
+    거래 상태 전이 이벤트 (추가 전용 로그, chat.trade_state.transition에서 기록)
+    status는 이벤트 적용 후의 거래 상태, note는 정산 실패 사유 등입니다.
+    """
+    EVENT_TYPE_CHOICES = [
+        ('created', '요청'),
+        ('accepted', '수락'),
+        ('withdrawn', '수락 취소'),
+        ('rejected', '거절'),
+        ('completed', '완료'),
+        ('failed', '정산 실패'),
+        ('cancelled', '취소'),
+    ]
+
+    trade = models.ForeignKey(TradeRequest, on_delete=models.CASCADE, related_name='events')
+    event_type = models.CharField(max_length=20, choices=EVENT_TYPE_CHOICES)
+    actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    status = models.CharField(max_length=20, choices=TradeRequest.TRADE_STATUS_CHOICES)
+    note = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # 거래별 이벤트 (발생 순)
+            models.Index(fields=['trade', 'id'], name='chat_trade_event_trade_idx'),
+        ]
+
+    def __str__(self):
+        return f"거래요청 {self.trade_id}: {self.event_type} → {self.status}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("거래 이벤트는 수정할 수 없습니다.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("거래 이벤트는 삭제할 수 없습니다.")
+
+
+class TradeHistoryEntry(models.Model):
+    """
+    사용자별 거래 히스토리 (TradeRequest 저장 시 chat.signals에서 요청자/수신자 행을 갱신하는 비정규화 테이블)
+    - (user, created_at, id) 인덱스 범위 스캔으로 최신순 커서 페이지를 조회합니다. (chat.history)
+    - created_at은 거래 요청 생성 시각, status는 거래 상태의 복사본입니다.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='trade_history')
+    trade = models.ForeignKey(TradeRequest, on_delete=models.CASCADE, related_name='history_entries')
+    status = models.CharField(max_length=20, choices=TradeRequest.TRADE_STATUS_CHOICES)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = (('user', 'trade'),)
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-id'], name='chat_trade_history_cursor_idx'),
+        ]
+
+    def __str__(self):
+        return f"User {self.user_id} / 거래요청 {self.trade_id}: {self.status}"
+
+    @classmethod
+    def backfill(cls, trades):
+        """거래 요청들의 요청자/수신자 히스토리 행 생성 (이미 있는 행은 건너뜀, bulk_create 후 호출용)"""
+        cls.objects.bulk_create([
+            cls(user_id=user_id, trade_id=trade.id, status=trade.status,
+                created_at=trade.created_at, updated_at=trade.updated_at)
+            for trade in trades
+            for user_id in {trade.requester_id, trade.receiver_id}
+        ], ignore_conflicts=True)
+
+    @classmethod
+    def record_trade(cls, trade, created=False):
+        """거래 요청 생성 시 히스토리 행 추가, 상태 변경 시 상태 갱신"""
+        if created:
+            cls.backfill([trade])
+            return
+        cls.objects.filter(trade_id=trade.id).exclude(status=trade.status).update(
+            status=trade.status,
+            updated_at=trade.updated_at,
+        )
@@ -0,0 +1,112 @@
+"""
+ChatConsumer 프레임 인코딩
+
+- 기본: JSON 텍스트 프레임 (기존 클라이언트 호환, orjson 설치 시 orjson으로 인코딩)
+- 서브프로토콜 `timemarket.msgpack.v1` 협상 시: 짧은 키 + MessagePack 바이너리 프레임
+
+permessage-deflate 압축은 ASGI 서버(예: uvicorn --ws-per-message-deflate)에서 협상되며,
+여기서는 프레임 본문 크기만 줄입니다.
+"""
+from TimeMarket_BackEnd.renderers import dumps, json_default, loads
+
+# msgpack은 선택적으로 사용합니다. 미설치 시 JSON 프로토콜만 제공합니다.
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+
+MSGPACK_SUBPROTOCOL = 'timemarket.msgpack.v1'
+
+# 긴 키 → 짧은 키 (MessagePack 프로토콜 전용)
+KEY_ALIASES = {
+    # 이벤트 봉투
+    'type': 't',
+    'data': 'd',
+    'message': 'm',
+    'is_completed': 'c',
+    'has_more': 'hm',
+    'user_id': 'ui',
+    'last_read_message_id': 'lr',
+    'trade_request_id': 'tr',
+    'response': 're',
+    'message_id': 'mi',
+    # 채팅 메시지
+    'id': 'i',
+    'room': 'r',
+    'sender': 's',
+    'receiver': 'rv',
+    'timestamp': 'ts',
+    # 사용자
+    'user': 'u',
+    'nickname': 'n',
+    'email': 'e',
+    'profile_image': 'pi',
+    'average_rating': 'ar',
+    'rating_count': 'rc',
+    # 거래 요청
+    'post': 'p',
+    'requester': 'rq',
+    'proposed_price': 'pp',
+    'proposed_hours': 'ph',
+    'status': 'st',
+    'requester_accepted': 'ra',
+    'receiver_accepted': 'rva',
+    'created_at': 'ca',
+    'updated_at': 'ua',
+    # 게시글
+    'title': 'ti',
+    'description': 'de',
+    'latitude': 'la',
+    'longitude': 'lo',
+    'price': 'pr',
+}
+KEY_EXPANSIONS = {short: key for key, short in KEY_ALIASES.items()}
+
+
+def _rename_keys(value, mapping):
+    if isinstance(value, dict):
+        return {mapping.get(k, k): _rename_keys(v, mapping) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_rename_keys(v, mapping) for v in value]
+    return value
+
+
+def shorten_keys(payload):
+    return _rename_keys(payload, KEY_ALIASES)
+
+
+def expand_keys(payload):
+    return _rename_keys(payload, KEY_EXPANSIONS)
+
+
+class JsonCodec:
+    """기본 JSON 텍스트 프레임"""
+    subprotocol = None
+
+    def encode(self, payload):
+        return {'text_data': dumps(payload)}
+
+    def decode(self, text_data=None, bytes_data=None):
+        return loads(text_data if text_data is not None else bytes_data)
+
+
+class MsgPackCodec:
+    """짧은 키를 사용하는 MessagePack 바이너리 프레임"""
+    subprotocol = MSGPACK_SUBPROTOCOL
+
+    def encode(self, payload):
+        return {'bytes_data': msgpack.packb(shorten_keys(payload), use_bin_type=True, default=json_default)}
+
+    def decode(self, text_data=None, bytes_data=None):
+        if bytes_data is None:
+            # 협상 후에도 텍스트 프레임은 JSON으로 허용
+            return expand_keys(loads(text_data))
+        return expand_keys(msgpack.unpackb(bytes_data, raw=False))
+
+
+def select_codec(subprotocols):
+    """클라이언트가 요청한 서브프로토콜 목록에서 사용할 코덱 선택"""
+    if msgpack is not None and MSGPACK_SUBPROTOCOL in (subprotocols or []):
+        return MsgPackCodec()
+    return JsonCodec()
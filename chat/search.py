@@ -0,0 +1,13 @@
+"""채팅 메시지 전문 검색"""
+from TimeMarket_BackEnd.fulltext import FullTextIndex
+from .models import ChatMessage
+
+chat_message_index = FullTextIndex(ChatMessage, ['message'], 'chat_chatmessage_fts')
+
+
+def search_messages(user, query, room_id=None, limit=20, offset=0):
+    """사용자가 참여한 채팅방의 메시지 중 query와 일치하는 메시지를 관련도 순으로 반환"""
+    scope = ChatMessage.objects.filter(room__users=user).select_related('sender')
+    if room_id is not None:
+        scope = scope.filter(room_id=room_id)
+    return chat_message_index.search(scope, query, limit, offset)
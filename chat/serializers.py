@@ -1,8 +1,9 @@
 from rest_framework import serializers
-from .models import ChatMessage, Room, TradeRequest
+from .models import ChatMessage, Room, TradeEvent, TradeRequest
 from users.models import User
 from posts.models import TimePost
 from users.serializers import UserSerializer
+from TimeMarket_BackEnd.fieldsets import SparseFieldsetMixin
 
 # TimePost 정보를 위한 간단한 시리얼라이저 (순환 import 방지)
 class SimpleTimePostSerializer(serializers.ModelSerializer):
@@ -21,8 +22,8 @@ class ChatMessageSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'timestamp', 'sender', 'receiver', 'room']
 
 # ✅ 1. 기본 채팅방 정보를 위한 RoomSerializer를 다시 정의합니다.
-#    MatchRequestView와 ChatRoomDetailView에서 사용됩니다.
-class RoomSerializer(serializers.ModelSerializer):
+#    MatchRequestView와 ChatRoomDetailView에서 사용됩니다. (?fields= / ?expand= 지원)
+class RoomSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     users = UserSerializer(many=True, read_only=True)
     post = SimpleTimePostSerializer(read_only=True)
 
@@ -36,11 +37,13 @@ class RoomSerializer(serializers.ModelSerializer):
 class ChatRoomListSerializer(serializers.ModelSerializer):
     other_user = serializers.SerializerMethodField()
     last_message = serializers.SerializerMethodField()
+    unread_count = serializers.SerializerMethodField()
+    last_read_message_id = serializers.SerializerMethodField()
     post = SimpleTimePostSerializer(read_only=True)
 
     class Meta:
         model = Room
-        fields = ['id', 'post', 'other_user', 'last_message', 'created_at']
+        fields = ['id', 'post', 'other_user', 'last_message', 'unread_count', 'last_read_message_id', 'created_at']
 
     def get_other_user(self, obj):
         user = self.context['request'].user
@@ -51,8 +54,16 @@ class ChatRoomListSerializer(serializers.ModelSerializer):
         last_msg = obj.messages.order_by('-timestamp').first()
         return ChatMessageSerializer(last_msg, context=self.context).data if last_msg else None
 
+    def get_unread_count(self, obj):
+        # MyChatsView에서 annotate된 값을 사용
+        return getattr(obj, 'unread_count', 0)
 
-class TradeRequestSerializer(serializers.ModelSerializer):
+    def get_last_read_message_id(self, obj):
+        return getattr(obj, 'last_read_message_id', None)
+
+
+class TradeRequestSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """거래 요청 (?fields= / ?expand= 로 필요한 필드와 펼칠 관계 선택)"""
     requester = UserSerializer(read_only=True)
     receiver = UserSerializer(read_only=True)
     post = SimpleTimePostSerializer(read_only=True)
@@ -68,6 +79,14 @@ class TradeRequestSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at', 'status']
 
 
+class TradeEventSerializer(serializers.ModelSerializer):
+    """거래 상태 전이 이벤트 (actor는 사용자 id)"""
+
+    class Meta:
+        model = TradeEvent
+        fields = ['id', 'event_type', 'actor', 'status', 'note', 'created_at']
+
+
 class TradeRequestCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = TradeRequest
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import TradeEvent, TradeHistoryEntry, TradeRequest
+
+
+@receiver(post_save, sender=TradeRequest)
+def record_trade_history(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    """✅ 거래 요청 생성/상태 변경 시 요청자·수신자의 거래 히스토리 갱신 (생성 시 'created' 이벤트 기록)"""
+    if raw or (update_fields is not None and 'status' not in update_fields):
+        return
+    if created:
+        TradeEvent.objects.create(
+            trade=instance, event_type='created', actor_id=instance.requester_id,
+            status=instance.status, created_at=instance.created_at,
+        )
+    TradeHistoryEntry.record_trade(instance, created=created)
@@ -0,0 +1,75 @@
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from chat.models import Room, ChatMessage, RoomReadState, TradeRequest
+from posts.models import TimePost
+from review.models import Review
+
+User = get_user_model()
+
+
+class MyChatsConditionalGetTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user1 = User.objects.create_user(nickname='test', email='test@gmail.com', password='test')
+        self.user2 = User.objects.create_user(nickname='admin', email='admin@gmail.com', password='admin')
+        self.post = TimePost.objects.create(user=self.user1, title='컴퓨터 수리', description='설명', type='sale', price=1000)
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.user1, self.user2)
+        self.url = reverse('my-chats')
+        self.client.force_authenticate(user=self.user2)
+
+    def assert_not_modified(self, etag, expected=True):
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304 if expected else 200)
+        return response['ETag']
+
+    def test_unchanged_poll_returns_304(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertEqual(self.assert_not_modified(etag), etag)
+
+    def test_changes_produce_new_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        message = ChatMessage.objects.create(room=self.room, sender=self.user1, receiver=self.user2, message='안녕하세요')
+        RoomReadState.record_new_message(message)
+        etag = self.assert_not_modified(etag, expected=False)
+
+        RoomReadState.mark_read(self.room.id, self.user2.id, message.id)
+        etag = self.assert_not_modified(etag, expected=False)
+
+        self.post.title = '제목 수정'
+        self.post.save()
+        etag = self.assert_not_modified(etag, expected=False)
+
+        self.assert_not_modified(etag)
+
+    def test_member_profile_and_rating_changes_produce_new_etag(self):
+        """상대방의 닉네임 수정, 상대방이 받은 리뷰 추가 시 ETag 갱신"""
+        etag = self.client.get(self.url)['ETag']
+
+        self.user1.nickname = 'renamed'
+        self.user1.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]['other_user']['nickname'], 'renamed')
+        etag = response['ETag']
+
+        trade = TradeRequest.objects.create(
+            room=self.room, post=self.post, requester=self.user2, receiver=self.user1,
+            proposed_price=1000, proposed_hours=1, status='completed',
+        )
+        Review.objects.create(trade=trade, author=self.user2, target=self.user1, rating=Decimal('4.0'))
+        etag = self.assert_not_modified(etag, expected=False)
+
+        self.assert_not_modified(etag)
+
+    def test_etag_is_per_user(self):
+        etag = self.client.get(self.url)['ETag']
+        self.client.force_authenticate(user=self.user1)
+        self.assert_not_modified(etag, expected=False)
@@ -0,0 +1,77 @@
+import json
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from chat import throttling
+from chat.consumers import ChatConsumer
+from chat.models import Room, ChatMessage, RoomReadState
+from chat.tests.websocket import chat_socket
+from posts.models import TimePost
+
+User = get_user_model()
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class ChatConsumerReplayTest(TestCase):
+    def setUp(self):
+        """테스트용 데이터 설정"""
+        throttling.reset_user_buckets()
+        self.user1 = User.objects.create_user(nickname='test', email='test@gmail.com', password='test')
+        self.user2 = User.objects.create_user(nickname='admin', email='admin@gmail.com', password='admin')
+        self.outsider = User.objects.create_user(nickname='other', email='other@gmail.com', password='other')
+        self.post = TimePost.objects.create(
+            user=self.user1, title='컴퓨터 수리 도움', description='컴퓨터 수리 도와드립니다', type='sale', price=10000
+        )
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.user1, self.user2)
+        self.messages = [
+            ChatMessage.objects.create(room=self.room, sender=self.user1, receiver=self.user2, message=f'메시지 {i}')
+            for i in range(3)
+        ]
+
+    def connect_and_receive(self, user, query):
+        async def scenario():
+            async with chat_socket(user, self.room.id, query) as communicator:
+                if await communicator.receive_nothing(timeout=0.2):
+                    return None
+                return json.loads(await communicator.receive_from())
+
+        return async_to_sync(scenario)()
+
+    def test_replays_only_missed_messages(self):
+        """마지막으로 받은 메시지 이후의 메시지만 재전송"""
+        frame = self.connect_and_receive(self.user2, f'last_message_id={self.messages[0].id}')
+
+        self.assertEqual(frame['type'], 'replay')
+        self.assertEqual([m['id'] for m in frame['data']], [self.messages[1].id, self.messages[2].id])
+        self.assertFalse(frame['has_more'])
+
+    def test_replay_limit_sets_has_more(self):
+        """재전송 한도를 넘으면 has_more=True"""
+        original = ChatConsumer.REPLAY_LIMIT
+        ChatConsumer.REPLAY_LIMIT = 1
+        try:
+            frame = self.connect_and_receive(self.user2, 'last_message_id=0')
+        finally:
+            ChatConsumer.REPLAY_LIMIT = original
+
+        self.assertEqual(len(frame['data']), 1)
+        self.assertTrue(frame['has_more'])
+
+    def test_no_replay_without_offset_or_membership(self):
+        """last_message_id가 없거나 채팅방 참여자가 아니면 재전송하지 않음"""
+        self.assertIsNone(self.connect_and_receive(self.user2, ''))
+        self.assertIsNone(self.connect_and_receive(self.outsider, 'last_message_id=0'))
+
+    def test_outsider_read_receipt_is_ignored(self):
+        """채팅방 참여자가 아니면 읽음 상태를 만들거나 read_receipt를 보내지 않음"""
+        async def scenario():
+            async with chat_socket(self.user2, self.room.id) as member:
+                async with chat_socket(self.outsider, self.room.id) as outsider:
+                    await outsider.send_to(text_data=json.dumps({'type': 'read', 'message_id': self.messages[-1].id}))
+                    return not await member.receive_nothing(timeout=0.2)
+
+        self.assertFalse(async_to_sync(scenario)())
+        self.assertFalse(RoomReadState.objects.filter(room=self.room, user=self.outsider).exists())
@@ -0,0 +1,87 @@
+import json
+from decimal import Decimal
+from unittest import mock
+
+from asgiref.sync import SyncToAsync, async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from chat import throttling
+from chat.models import ChatMessage, Room, TradeRequest
+from chat.tests.websocket import chat_socket
+from posts.models import TimePost
+from wallet.models import Wallet
+
+User = get_user_model()
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class ChatConsumerSyncHopTest(TestCase):
+    """이벤트 하나당 sync_to_async 스레드 전환은 한 번 (채팅방/상대방 조회는 연결당 한 번)"""
+
+    def setUp(self):
+        throttling.reset_user_buckets()
+        self.seller = User.objects.create_user(nickname='seller', email='seller@test.com', password='testpass')
+        self.buyer = User.objects.create_user(nickname='buyer', email='buyer@test.com', password='testpass')
+        self.post = TimePost.objects.create(user=self.seller, title='컴퓨터 수리', description='설명', type='sale', price=10000)
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.seller, self.buyer)
+        Wallet.objects.create(user=self.buyer, balance=Decimal('10'))
+        Wallet.objects.create(user=self.seller, balance=Decimal('0'))
+
+    def run_events(self, user, events):
+        """첫 이벤트(채팅방 정보 조회 포함) 이후 이벤트별 (응답 프레임, 스레드 전환 횟수)"""
+        hops = []
+        original_call = SyncToAsync.__call__
+
+        async def counting_call(self, *args, **kwargs):
+            if not self.func.__module__.startswith('channels.testing'):  # 테스트 통신기 자체의 전환은 제외
+                hops.append(self.func)
+            return await original_call(self, *args, **kwargs)
+
+        async def scenario():
+            results = []
+            async with chat_socket(user, self.room.id) as communicator:
+                with mock.patch.object(SyncToAsync, '__call__', counting_call):
+                    for event in events:
+                        hops.clear()
+                        await communicator.send_to(text_data=json.dumps(event))
+                        frame = json.loads(await communicator.receive_from())
+                        results.append((frame, len(hops)))
+            return results
+
+        return async_to_sync(scenario)()
+
+    def test_one_hop_per_event(self):
+        chat = {'type': 'chat', 'message': '안녕하세요'}
+        results = self.run_events(self.buyer, [
+            chat,
+            chat,
+            {'type': 'trade_request', 'proposed_price': '10000', 'proposed_hours': '2'},
+        ])
+
+        (_, first_hops), (message_frame, chat_hops), (trade_frame, trade_hops) = results
+        self.assertEqual(message_frame['type'], 'chat_message')
+        self.assertEqual(message_frame['data']['message'], '안녕하세요')
+        self.assertEqual(trade_frame['type'], 'trade_request')
+        self.assertEqual(chat_hops, 1)
+        self.assertEqual(trade_hops, 1)
+        self.assertGreater(first_hops, 1)
+        self.assertEqual(ChatMessage.objects.filter(room=self.room).count(), 2)
+
+    def test_trade_response_is_one_hop(self):
+        trade = TradeRequest.objects.create(
+            room=self.room, post=self.post, requester=self.buyer, receiver=self.seller,
+            proposed_price=Decimal('10000.00'), proposed_hours=Decimal('2'), requester_accepted=True,
+        )
+        results = self.run_events(self.seller, [
+            {'type': 'trade_response', 'trade_request_id': trade.id, 'response': 'accept'},
+            {'type': 'trade_response', 'trade_request_id': trade.id + 1, 'response': 'accept'},
+        ])
+
+        (status_frame, accept_hops), (error_frame, missing_hops) = results
+        self.assertEqual(status_frame['type'], 'trade_status_update')
+        self.assertTrue(status_frame['is_completed'])
+        self.assertEqual(error_frame, {'type': 'error', 'message': '거래 요청을 찾을 수 없습니다.'})
+        self.assertEqual(accept_hops, 1)
+        self.assertEqual(missing_hops, 1)
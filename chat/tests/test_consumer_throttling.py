@@ -0,0 +1,119 @@
+import json
+from types import SimpleNamespace
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, override_settings
+
+from chat import throttling
+from chat.tests.websocket import chat_socket
+from chat.throttling import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketTest(SimpleTestCase):
+    def test_burst_then_refill(self):
+        """버스트만큼 허용 후 시간이 지나면 다시 채워짐"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+
+        self.assertTrue(bucket.consume())
+        self.assertTrue(bucket.consume())
+        self.assertTrue(bucket.consume())
+        self.assertFalse(bucket.consume())
+
+        clock.now += 0.5  # 0.5초 * 2개/초 = 1개 충전
+        self.assertTrue(bucket.consume())
+        self.assertFalse(bucket.consume())
+
+    def test_capacity_is_upper_bound(self):
+        """오래 쉬어도 capacity 이상 쌓이지 않음"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock)
+        clock.now += 100
+        self.assertTrue(bucket.consume())
+        self.assertTrue(bucket.consume())
+        self.assertFalse(bucket.consume())
+
+    def test_consume_all_spends_nothing_when_one_bucket_is_empty(self):
+        """사용자 버킷이 거절하면 연결 버킷 토큰도 그대로 남음"""
+        clock = FakeClock()
+        connection = TokenBucket(rate=1, capacity=2, clock=clock)
+        user = TokenBucket(rate=1, capacity=1, clock=clock)
+
+        self.assertTrue(throttling.consume_all(connection, user))
+        self.assertFalse(throttling.consume_all(connection, user))
+        self.assertEqual(connection.tokens, 1)
+        self.assertEqual(user.tokens, 0)
+
+        clock.now += 1
+        self.assertTrue(throttling.consume_all(connection, user))
+        self.assertEqual(connection.tokens, 1)
+
+
+@override_settings(
+    CHAT_WEBSOCKET_LIMITS={
+        'CONNECTION_RATE': 0.001, 'CONNECTION_BURST': 2,
+        'USER_RATE': 0.001, 'USER_BURST': 100,
+        'MAX_VIOLATIONS': 3,
+    },
+    CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}},
+)
+class ChatConsumerRateLimitTest(SimpleTestCase):
+    def setUp(self):
+        throttling.reset_user_buckets()
+        throttling.reset_dropped_frame_counts()
+        self.user = SimpleNamespace(id=999, nickname='tester')
+
+    def test_frames_over_limit_are_dropped_and_connection_closed(self):
+        """버스트 초과 프레임은 드롭되고, 누적 초과 시 연결이 종료됨"""
+        async def scenario():
+            async with chat_socket(self.user, 1) as communicator:
+                # 알 수 없는 타입의 프레임은 처리 없이 토큰만 소비
+                for _ in range(2):
+                    await communicator.send_to(text_data=json.dumps({'type': 'noop'}))
+
+                await communicator.send_to(text_data=json.dumps({'type': 'noop'}))
+                error = json.loads(await communicator.receive_from())
+                self.assertEqual(error['type'], 'error')
+
+                await communicator.send_to(text_data=json.dumps({'type': 'noop'}))
+                await communicator.send_to(text_data=json.dumps({'type': 'noop'}))
+                closed = await communicator.receive_output()
+                self.assertEqual(closed['type'], 'websocket.close')
+                self.assertEqual(closed['code'], 4029)
+
+        async_to_sync(scenario)()
+        self.assertEqual(throttling.get_dropped_frame_counts()['rate_limited'], 3)
+
+    def test_user_bucket_shared_across_connections(self):
+        """같은 사용자의 연결들은 사용자 버킷을 공유하고, 마지막 연결이 끊기면 버킷을 해제"""
+        bucket = throttling.acquire_user_bucket(self.user.id)
+        self.assertIs(bucket, throttling.acquire_user_bucket(self.user.id))
+        self.assertIsNot(bucket, throttling.acquire_user_bucket(1000))
+
+        throttling.release_user_bucket(self.user.id)
+        self.assertIs(bucket, throttling.acquire_user_bucket(self.user.id))
+        for _ in range(2):
+            throttling.release_user_bucket(self.user.id)
+        throttling.release_user_bucket(self.user.id)
+        self.assertIsNot(bucket, throttling.acquire_user_bucket(self.user.id))
+
+    def test_anonymous_connections_do_not_share_bucket(self):
+        """익명 연결(user.id=None)은 연결마다 별도 버킷이며 보관되지 않음"""
+        self.assertIsNot(throttling.acquire_user_bucket(None), throttling.acquire_user_bucket(None))
+        self.assertEqual(throttling.user_bucket_count(), 0)
+
+    def test_bucket_released_on_disconnect(self):
+        async def scenario():
+            async with chat_socket(self.user, 1):
+                self.assertEqual(throttling.user_bucket_count(), 1)
+
+        async_to_sync(scenario)()
+        self.assertEqual(throttling.user_bucket_count(), 0)
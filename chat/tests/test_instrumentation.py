@@ -0,0 +1,87 @@
+import json
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from chat import throttling
+from chat.models import Room
+from chat.tests.websocket import chat_socket
+from posts.models import TimePost
+from TimeMarket_BackEnd import instrumentation
+
+User = get_user_model()
+
+MY_CHATS_URL = '/api/chat/match/my-chats/'
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class InstrumentationTest(TestCase):
+    def setUp(self):
+        instrumentation.reset_stats()
+        throttling.reset_user_buckets()
+        self.client = APIClient()
+        self.user1 = User.objects.create_user(nickname='test', email='test@gmail.com', password='test')
+        self.user2 = User.objects.create_user(nickname='admin', email='admin@gmail.com', password='admin')
+        self.post = TimePost.objects.create(user=self.user1, title='컴퓨터 수리', description='설명', type='sale', price=10000)
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.user1, self.user2)
+
+    def test_http_request_recorded_by_route(self):
+        """✅ HTTP 요청이 URL 패턴 단위로 쿼리 수/시간과 함께 기록됨"""
+        self.client.force_authenticate(user=self.user1)
+        self.client.get(MY_CHATS_URL)
+        self.client.get(MY_CHATS_URL)
+
+        entry = instrumentation.get_stats()['GET api/chat/match/my-chats/']
+        self.assertEqual(entry['count'], 2)
+        self.assertGreater(entry['avg_queries'], 0)
+        self.assertGreater(entry['avg_serialization_ms'], 0)
+        self.assertEqual(entry['over_budget'], 0)
+
+    def test_install_leaves_drf_serializers_untouched(self):
+        """계측 설치가 DRF 시리얼라이저 클래스를 바꾸지 않음"""
+        instrumentation.install()
+        self.assertEqual(serializers.BaseSerializer.data.fget.__qualname__, 'BaseSerializer.data')
+
+    def test_query_budget_exceeded_logs_warning(self):
+        """❌ 쿼리 예산을 넘으면 경고 로그와 over_budget 집계"""
+        self.client.force_authenticate(user=self.user1)
+        with override_settings(INSTRUMENTATION={'QUERY_BUDGET': 0}):
+            with self.assertLogs('TimeMarket_BackEnd.instrumentation', 'WARNING') as logs:
+                self.client.get(MY_CHATS_URL)
+
+        self.assertIn('쿼리 예산 초과', logs.output[0])
+        self.assertEqual(instrumentation.get_stats()['GET api/chat/match/my-chats/']['over_budget'], 1)
+
+    def test_websocket_event_recorded_by_type(self):
+        """✅ WebSocket 이벤트가 메시지 타입 단위로 기록됨"""
+        async def scenario():
+            async with chat_socket(self.user1, self.room.id) as communicator:
+                await communicator.send_to(text_data=json.dumps({'type': 'chat', 'message': '안녕하세요'}))
+                await communicator.receive_from()
+
+        async_to_sync(scenario)()
+
+        stats = instrumentation.get_stats()
+        self.assertIn('ws websocket.connect', stats)
+        self.assertGreater(stats['ws websocket.receive:chat']['avg_queries'], 0)
+
+    def test_internal_stats_endpoint_requires_staff(self):
+        url = reverse('internal-stats')
+        self.client.force_authenticate(user=self.user1)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.user2.is_staff = True
+        self.user2.save()
+        self.client.force_authenticate(user=self.user2)
+        self.client.get(MY_CHATS_URL)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('GET api/chat/match/my-chats/', response.data['routes'])
+
+        self.assertEqual(self.client.delete(url).status_code, 204)
+        self.assertNotIn('GET api/chat/match/my-chats/', instrumentation.get_stats())
@@ -0,0 +1,66 @@
+import datetime
+import unittest
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from chat.models import Room, TradeRequest
+from chat.protocol import JsonCodec
+from posts.models import TimePost
+from TimeMarket_BackEnd.renderers import ORJSONRenderer, orjson
+
+User = get_user_model()
+
+
+@unittest.skipIf(orjson is None, 'orjson 미설치')
+class ORJSONRenderingTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user1 = User.objects.create_user(nickname='test', email='test@gmail.com', password='test')
+        self.user2 = User.objects.create_user(nickname='admin', email='admin@gmail.com', password='admin')
+        self.post = TimePost.objects.create(user=self.user1, title='컴퓨터 수리', description='설명', type='sale', price=10000)
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.user1, self.user2)
+        for hours in ('1.5', '2', '0.25'):
+            TradeRequest.objects.create(
+                room=self.room, post=self.post, requester=self.user1, receiver=self.user2,
+                proposed_price=Decimal('10000.00'), proposed_hours=Decimal(hours), message='거래 요청',
+            )
+
+    def test_trade_history_matches_drf_renderer(self):
+        """✅ 거래 히스토리 응답이 DRF 기본 렌더러와 바이트 단위로 같음"""
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(reverse('trade-history'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+    def test_special_types_match_drf_encoder(self):
+        data = {
+            'balance': Decimal('12.50'),
+            'now': timezone.now(),
+            'naive': datetime.datetime(2024, 1, 1, 9, 30, 0, 5),
+            'date': datetime.date(2024, 1, 1),
+            'duration': datetime.timedelta(minutes=90),
+            1: '숫자 키',
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_parser_accepts_json_and_rejects_malformed(self):
+        self.client.force_authenticate(user=self.user2)
+        url = reverse('trade-create', kwargs={'room_id': self.room.id})
+        response = self.client.post(url, {'proposed_price': '5000', 'proposed_hours': '1.5', 'message': '요청'}, format='json')
+        self.assertEqual(response.status_code, 201)
+
+        response = self.client.post(url, '{"proposed_price": ', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_consumer_codec_encodes_decimals_and_datetimes(self):
+        frame = JsonCodec().encode({'type': 'trade', 'hours': Decimal('1.5'), 'at': datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)})
+        self.assertEqual(frame['text_data'], '{"type":"trade","hours":1.5,"at":"2024-01-01T00:00:00Z"}')
+        self.assertEqual(JsonCodec().decode(text_data=frame['text_data'])['hours'], 1.5)
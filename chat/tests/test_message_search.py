@@ -0,0 +1,66 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from chat.models import Room, ChatMessage
+from posts.models import TimePost
+
+User = get_user_model()
+
+
+class ChatMessageSearchTest(TestCase):
+    def setUp(self):
+        """테스트용 데이터 설정"""
+        self.client = APIClient()
+        self.user1 = User.objects.create_user(nickname='test', email='test@gmail.com', password='test')
+        self.user2 = User.objects.create_user(nickname='admin', email='admin@gmail.com', password='admin')
+        self.user3 = User.objects.create_user(nickname='other', email='other@gmail.com', password='other')
+        self.post = TimePost.objects.create(
+            user=self.user1, title='컴퓨터 수리 도움', description='컴퓨터 수리 도와드립니다', type='sale', price=10000
+        )
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.user1, self.user2)
+        self.other_room = Room.objects.create(post=self.post)
+        self.other_room.users.add(self.user1, self.user3)
+
+        self.hit = ChatMessage.objects.create(room=self.room, sender=self.user1, receiver=self.user2, message='컴퓨터 수리 거래를 원합니다')
+        ChatMessage.objects.create(room=self.room, sender=self.user2, receiver=self.user1, message='안녕하세요')
+        ChatMessage.objects.create(room=self.other_room, sender=self.user3, receiver=self.user1, message='컴퓨터 거래 문의')
+
+        self.url = reverse('chat-message-search')
+
+    def test_search_is_scoped_to_my_rooms(self):
+        """내가 참여한 채팅방의 메시지만 검색됨 (접두어 일치)"""
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.get(self.url, {'q': '거래'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([m['id'] for m in response.data['results']], [self.hit.id])
+        self.assertIsNone(response.data['next_offset'])
+
+    def test_search_pagination_and_room_filter(self):
+        """limit/offset 페이지네이션과 room_id 필터"""
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(self.url, {'q': '컴퓨터', 'limit': 1})
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['next_offset'], 1)
+
+        response = self.client.get(self.url, {'q': '컴퓨터', 'room_id': self.other_room.id})
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['room'], self.other_room.id)
+
+    def test_index_follows_updates_and_deletes(self):
+        """메시지 수정/삭제 시 색인도 갱신됨"""
+        self.client.force_authenticate(user=self.user2)
+        self.hit.message = '일정 변경'
+        self.hit.save()
+        self.assertEqual(self.client.get(self.url, {'q': '거래'}).data['results'], [])
+        self.assertEqual(len(self.client.get(self.url, {'q': '일정'}).data['results']), 1)
+
+        self.hit.delete()
+        self.assertEqual(self.client.get(self.url, {'q': '일정'}).data['results'], [])
+
+    def test_empty_query_rejected(self):
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(self.url, {'q': ' '})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,111 @@
+from decimal import Decimal
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from chat import throttling
+from chat.models import Room, TradeRequest
+from chat.tests.websocket import chat_socket
+from posts.models import TimePost
+from TimeMarket_BackEnd import metrics
+from wallet.models import Wallet
+
+User = get_user_model()
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class PrometheusMetricsTest(TestCase):
+    def setUp(self):
+        throttling.reset_user_buckets()
+        self.client = APIClient()
+        self.user1 = User.objects.create_user(nickname='test', email='test@gmail.com', password='test')
+        self.user2 = User.objects.create_user(nickname='admin', email='admin@gmail.com', password='admin')
+        self.post = TimePost.objects.create(user=self.user1, title='컴퓨터 수리', description='설명', type='sale', price=10000)
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.user1, self.user2)
+
+    def scrape(self, **headers):
+        response = self.client.get('/metrics', **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], metrics.CONTENT_TYPE)
+        return response.content.decode()
+
+    def test_http_request_histogram_per_view(self):
+        """✅ DRF 뷰별 응답 시간 히스토그램이 노출됨"""
+        self.client.force_authenticate(user=self.user1)
+        self.client.get(reverse('my-chats'))
+
+        body = self.scrape()
+        labels = 'view="chat.views.MyChatsView",method="GET",status="200"'
+        self.assertIn(f'timemarket_http_request_duration_seconds_bucket{{{labels},le="+Inf"}}', body)
+        self.assertIn(f'timemarket_http_request_duration_seconds_count{{{labels}}}', body)
+        self.assertIn('# TYPE timemarket_db_connections gauge', body)
+        self.assertIn('timemarket_db_connections{alias="default"}', body)
+
+    @override_settings(METRICS={'BEARER_TOKEN': 'secret'})
+    def test_bearer_token_required_when_configured(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.scrape(HTTP_AUTHORIZATION='Bearer secret')
+
+    def test_websocket_connection_and_group_gauges(self):
+        """✅ 연결 중에는 활성 연결/그룹 크기에 포함되고, 종료 후 제외됨 (채팅방별 시계열은 내보내지 않음)"""
+        group = f'chat_{self.room.id}'
+        before = metrics.websocket_connections.get()
+
+        async def scenario():
+            async with chat_socket(self.user1, self.room.id):
+                return metrics.websocket_connections.get(), metrics.get_group_size(group), await sync_to_async(self.scrape)()
+
+        connections, group_size, body = async_to_sync(scenario)()
+        self.assertEqual((connections, group_size), (before + 1, 1))
+        self.assertIn('timemarket_channel_groups 1', body)
+        self.assertIn('timemarket_channel_group_size_bucket{le="1"} 1', body)
+        self.assertNotIn(f'group="{group}"', body)
+        self.assertEqual(metrics.websocket_connections.get(), before)
+        self.assertEqual(metrics.get_group_size(group), 0)
+        self.assertIn('timemarket_channel_groups 0', self.scrape())
+
+    @override_settings(METRICS={'PER_GROUP_GAUGE': True})
+    def test_per_group_gauge_is_opt_in(self):
+        group = f'chat_{self.room.id}'
+
+        async def scenario():
+            async with chat_socket(self.user1, self.room.id):
+                return await sync_to_async(self.scrape)()
+
+        self.assertIn(f'timemarket_channel_group_connections{{group="{group}"}} 1', async_to_sync(scenario)())
+
+    def accept_trade(self, balance):
+        Wallet.objects.update_or_create(user=self.user2, defaults={'balance': Decimal(balance)})
+        trade = TradeRequest.objects.create(
+            room=self.room, post=self.post, requester=self.user2, receiver=self.user1,
+            proposed_price=Decimal('10000.00'), proposed_hours=Decimal('2'), requester_accepted=True,
+        )
+        self.client.force_authenticate(user=self.user1)
+        return self.client.patch(reverse('trade-detail', kwargs={'trade_id': trade.id}), {'receiver_accepted': True}, format='json')
+
+    def test_trade_settlement_latency_and_outcomes(self):
+        """✅ 정산 결과(completed / rejected)별 횟수와 소요 시간이 기록됨"""
+        completed = metrics.trade_settlements.get(path='http', outcome='completed')
+        rejected = metrics.trade_settlements.get(path='http', outcome='rejected')
+        observed = metrics.trade_settlement_duration.get(path='http')['count']
+
+        self.assertEqual(self.accept_trade('10').status_code, 200)
+        self.assertEqual(self.accept_trade('1').status_code, 400)  # 잔액 부족
+
+        self.assertEqual(metrics.trade_settlements.get(path='http', outcome='completed'), completed + 1)
+        self.assertEqual(metrics.trade_settlements.get(path='http', outcome='rejected'), rejected + 1)
+        self.assertEqual(metrics.trade_settlement_duration.get(path='http')['count'], observed + 2)
+        self.assertIn('timemarket_trade_settlements_total{path="http",outcome="completed"}', self.scrape())
+
+    def test_text_format_escapes_labels(self):
+        registry = metrics.Registry()
+        counter = registry.counter('demo_total', '예시', ('name',))
+        counter.inc(2, name='a"b\\c\nd')
+        self.assertEqual(
+            registry.render(),
+            '# HELP demo_total 예시\n# TYPE demo_total counter\ndemo_total{name="a\\"b\\\\c\\nd"} 2\n',
+        )
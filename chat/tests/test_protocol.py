@@ -0,0 +1,65 @@
+import json
+import unittest
+from types import SimpleNamespace
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, override_settings
+
+from chat import throttling
+from chat.protocol import (
+    JsonCodec, MsgPackCodec, MSGPACK_SUBPROTOCOL, expand_keys, msgpack, select_codec, shorten_keys,
+)
+from chat.tests.websocket import chat_communicator
+
+
+class KeyAliasTest(SimpleTestCase):
+    def test_shorten_and_expand_round_trip(self):
+        """중첩된 사용자 객체까지 짧은 키로 변환 후 원래대로 복원"""
+        payload = {
+            'type': 'chat_message',
+            'data': {'id': 1, 'sender': {'id': 2, 'nickname': 'test'}, 'message': '안녕', 'extra': [{'room': 3}]},
+        }
+        short = shorten_keys(payload)
+        self.assertEqual(short['t'], 'chat_message')
+        self.assertEqual(short['d']['s']['n'], 'test')
+        self.assertEqual(short['d']['extra'][0]['r'], 3)
+        self.assertEqual(expand_keys(short), payload)
+
+    def test_json_is_default(self):
+        """서브프로토콜 요청이 없으면 JSON"""
+        self.assertIsInstance(select_codec([]), JsonCodec)
+        self.assertIsInstance(select_codec(None), JsonCodec)
+        self.assertEqual(JsonCodec().encode({'type': 'error'}), {'text_data': '{"type":"error"}'})
+
+
+@unittest.skipUnless(msgpack, 'msgpack 미설치')
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class MsgPackProtocolTest(SimpleTestCase):
+    def setUp(self):
+        throttling.reset_user_buckets()
+
+    def test_codec_round_trip_is_smaller_than_json(self):
+        codec = select_codec(['foo', MSGPACK_SUBPROTOCOL])
+        self.assertIsInstance(codec, MsgPackCodec)
+
+        payload = {'type': 'chat_message', 'data': {'id': 1, 'message': '안녕하세요', 'timestamp': '2025-01-01T00:00:00Z'}}
+        frame = codec.encode(payload)['bytes_data']
+        self.assertLess(len(frame), len(json.dumps(payload).encode()))
+        self.assertEqual(codec.decode(bytes_data=frame), payload)
+
+    def test_consumer_negotiates_msgpack(self):
+        """서브프로토콜 협상 후 바이너리 프레임으로 응답"""
+        async def scenario():
+            communicator = chat_communicator(SimpleNamespace(id=1), 1, subprotocols=[MSGPACK_SUBPROTOCOL])
+            connected, subprotocol = await communicator.connect()
+            self.assertTrue(connected)
+            self.assertEqual(subprotocol, MSGPACK_SUBPROTOCOL)
+
+            await communicator.send_to(bytes_data=b'\xc1')  # 잘못된 msgpack 바이트
+            frame = await communicator.receive_from()
+            await communicator.disconnect()
+            return frame
+
+        frame = async_to_sync(scenario)()
+        self.assertIsInstance(frame, bytes)
+        self.assertEqual(msgpack.unpackb(frame)['t'], 'error')
@@ -0,0 +1,75 @@
+import unittest
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from chat.history import encode_cursor, history_queryset
+from chat.models import ChatMessage, TradeHistoryEntry, TradeRequest
+from map.models import TimeMarker
+from posts.models import TimePost
+from push_notice.models import DeviceToken
+from review.models import Review
+from wallet.models import Transaction
+
+
+def query_plan(queryset):
+    """EXPLAIN QUERY PLAN 결과의 detail 열 목록"""
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+@unittest.skipUnless(connection.vendor == 'sqlite', 'EXPLAIN QUERY PLAN은 SQLite 전용')
+class HotQueryIndexTest(TestCase):
+    """자주 실행되는 조회가 복합/부분 인덱스를 사용하고 별도 정렬(TEMP B-TREE) 없이 처리되는지 확인"""
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = query_plan(queryset)
+        self.assertTrue(any(index_name in step for step in plan), f'{index_name} 미사용: {plan}')
+        self.assertFalse(any('TEMP B-TREE' in step for step in plan), f'별도 정렬 발생: {plan}')
+
+    def test_chat_message_history(self):
+        # ChatMessageListCreateView
+        self.assertUsesIndex(ChatMessage.objects.filter(room__id=1).order_by('timestamp'), 'chat_message_room_ts_idx')
+
+    def test_room_trade_requests(self):
+        # TradeRequestListView
+        queryset = TradeRequest.objects.filter(room__id=1, room__users=1).select_related(
+            'post__user', 'requester', 'receiver'
+        ).order_by('-created_at')
+        self.assertUsesIndex(queryset, 'chat_trade_room_created_idx')
+
+    def test_trade_history_pages(self):
+        # TradeHistoryView: 첫 페이지와 커서 이후 페이지 모두 (user, created_at, id) 범위 스캔
+        self.assertUsesIndex(history_queryset(1), 'chat_trade_history_cursor_idx')
+        cursor = encode_cursor(TradeHistoryEntry(id=10, created_at=timezone.now()))
+        self.assertUsesIndex(history_queryset(1, cursor), 'chat_trade_history_cursor_idx')
+
+    def test_trade_requests_by_status(self):
+        self.assertUsesIndex(TradeRequest.objects.filter(status='pending').order_by('-created_at'), 'chat_trade_status_created_idx')
+
+    def test_wallet_transactions(self):
+        # TransactionListView
+        self.assertUsesIndex(Transaction.objects.filter(wallet=1).order_by('-timestamp'), 'wallet_tx_wallet_ts_idx')
+
+    def test_received_reviews(self):
+        # UserReviewListView (Meta.ordering = -created_at)
+        self.assertUsesIndex(Review.objects.filter(target_id=1), 'review_target_created_idx')
+
+    def test_board_posts(self):
+        # BoardTimePostList
+        self.assertUsesIndex(TimePost.objects.select_related('user').order_by('-created_at'), 'posts_created_idx')
+
+    def test_posts_by_type(self):
+        self.assertUsesIndex(TimePost.objects.filter(type='sale').order_by('-created_at'), 'posts_type_created_idx')
+
+    def test_active_device_tokens(self):
+        # send_push_to_user: 테이블을 읽지 않는 커버링 인덱스
+        queryset = DeviceToken.objects.filter(user=1, is_active=True).values_list('token', flat=True)
+        self.assertUsesIndex(queryset, 'push_token_user_active_idx')
+        self.assertTrue(any('COVERING INDEX' in step for step in query_plan(queryset)))
+
+    def test_active_markers_by_recency(self):
+        self.assertUsesIndex(TimeMarker.objects.filter(is_active=True).order_by('-created_at'), 'map_marker_active_created')
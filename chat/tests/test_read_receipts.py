@@ -0,0 +1,79 @@
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from chat.models import Room, ChatMessage, RoomReadState
+from posts.models import TimePost
+
+User = get_user_model()
+
+
+class RoomReadStateTest(TestCase):
+    def setUp(self):
+        """테스트용 데이터 설정"""
+        self.user1 = User.objects.create_user(nickname='test', email='test@gmail.com', password='test')
+        self.user2 = User.objects.create_user(nickname='admin', email='admin@gmail.com', password='admin')
+        self.post = TimePost.objects.create(
+            user=self.user1, title='컴퓨터 수리 도움', description='컴퓨터 수리 도와드립니다', type='sale', price=10000
+        )
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.user1, self.user2)
+        self.client = APIClient()
+
+    def send(self, sender, receiver, text):
+        message = ChatMessage.objects.create(room=self.room, sender=sender, receiver=receiver, message=text)
+        RoomReadState.record_new_message(message)
+        return message
+
+    def test_unread_count_incremented_on_insert(self):
+        """메시지 저장 시 수신자의 안 읽은 수 증가"""
+        self.send(self.user1, self.user2, '안녕하세요')
+        self.send(self.user1, self.user2, '거래 가능하신가요?')
+
+        state = RoomReadState.objects.get(room=self.room, user=self.user2)
+        self.assertEqual(state.unread_count, 2)
+        self.assertFalse(RoomReadState.objects.filter(room=self.room, user=self.user1).exists())
+
+    def test_mark_read_moves_pointer_forward_only(self):
+        """읽음 확인 시 포인터 이동 및 남은 안 읽은 수 재계산, 뒤로는 이동하지 않음"""
+        first = self.send(self.user1, self.user2, '1')
+        second = self.send(self.user1, self.user2, '2')
+        self.send(self.user1, self.user2, '3')
+
+        state = RoomReadState.mark_read(self.room.id, self.user2.id, second.id)
+        self.assertEqual(state.last_read_message_id, second.id)
+        self.assertEqual(state.unread_count, 1)
+
+        state = RoomReadState.mark_read(self.room.id, self.user2.id, first.id)
+        self.assertEqual(state.last_read_message_id, second.id)
+
+        state = RoomReadState.mark_read(self.room.id, self.user2.id)
+        self.assertEqual(state.unread_count, 0)
+
+    def test_mark_read_requires_membership(self):
+        """채팅방 참여자가 아니면 읽음 상태를 만들지 않음"""
+        outsider = User.objects.create_user(nickname='other', email='other@gmail.com', password='other')
+        message = self.send(self.user1, self.user2, '안녕하세요')
+
+        self.assertIsNone(RoomReadState.mark_read(self.room.id, outsider.id, message.id))
+        self.assertFalse(RoomReadState.objects.filter(room=self.room, user=outsider).exists())
+
+    def test_my_chats_includes_unread_count(self):
+        """내 채팅방 목록에 안 읽은 메시지 수 포함"""
+        self.send(self.user1, self.user2, '안녕하세요')
+        self.client.force_authenticate(user=self.user2)
+
+        response = self.client.get(reverse('my-chats'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]['unread_count'], 1)
+
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(reverse('my-chats'))
+        self.assertEqual(response.data[0]['unread_count'], 0)
+
+    def test_rest_message_create_updates_unread(self):
+        """REST로 메시지 전송 시에도 안 읽은 수 갱신"""
+        self.client.force_authenticate(user=self.user2)
+        response = self.client.post(reverse('chat-messages', kwargs={'room_id': self.room.id}), {'message': '문의드립니다'})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(RoomReadState.objects.get(room=self.room, user=self.user1).unread_count, 1)
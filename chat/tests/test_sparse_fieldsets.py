@@ -0,0 +1,71 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from chat.models import Room, TradeRequest
+from posts.models import TimePost
+
+User = get_user_model()
+
+
+class SparseFieldsetTest(TestCase):
+    def setUp(self):
+        """테스트용 데이터 설정"""
+        self.client = APIClient()
+        self.user1 = User.objects.create_user(nickname='test', email='test@gmail.com', password='test')
+        self.user2 = User.objects.create_user(nickname='admin', email='admin@gmail.com', password='admin')
+        self.post = TimePost.objects.create(
+            user=self.user1, title='컴퓨터 수리 도움', description='컴퓨터 수리 도와드립니다', type='sale', price=10000
+        )
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.user1, self.user2)
+        for _ in range(3):
+            TradeRequest.objects.create(
+                room=self.room, post=self.post, requester=self.user2, receiver=self.user1,
+                proposed_price=10000, proposed_hours=2,
+            )
+        self.client.force_authenticate(user=self.user1)
+        self.trades_url = reverse('trade-list', kwargs={'room_id': self.room.id})
+
+    def get(self, url, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_default_response_is_unchanged(self):
+        response, _ = self.get(self.trades_url)
+        trade = response.data[0]
+        self.assertEqual(trade['requester']['nickname'], 'admin')
+        self.assertEqual(trade['post']['user']['nickname'], 'test')
+
+    def test_expand_collapses_other_relations_to_ids(self):
+        full, full_queries = self.get(self.trades_url)
+        response, queries = self.get(self.trades_url, {'expand': 'post'})
+        trade = response.data[0]
+        self.assertEqual(trade['requester'], self.user2.id)
+        self.assertEqual(trade['receiver'], self.user1.id)
+        self.assertEqual(trade['post']['title'], '컴퓨터 수리 도움')
+        self.assertEqual(trade['post']['user'], self.user1.id)
+
+        response, _ = self.get(self.trades_url, {'expand': 'post.user'})
+        self.assertEqual(response.data[0]['post']['user']['nickname'], 'test')
+
+        # 중첩 사용자 평점 집계 쿼리가 빠짐
+        _, id_only_queries = self.get(self.trades_url, {'expand': ''})
+        self.assertLess(queries, full_queries)
+        self.assertLess(id_only_queries, full_queries)
+
+    def test_fields_selects_top_level_and_nested_fields(self):
+        response, _ = self.get(self.trades_url, {'fields': 'id,status,requester.nickname', 'expand': 'requester'})
+        self.assertEqual(set(response.data[0]), {'id', 'status', 'requester'})
+        self.assertEqual(response.data[0]['requester'], {'nickname': 'admin'})
+
+    def test_room_serializer_supports_fieldsets(self):
+        url = reverse('chat-room-detail', kwargs={'room_id': self.room.id})
+        response, _ = self.get(url, {'fields': 'id,users', 'expand': ''})
+        self.assertEqual(response.data['id'], self.room.id)
+        self.assertCountEqual(response.data['users'], [self.user1.id, self.user2.id])
+        self.assertNotIn('post', response.data)
@@ -0,0 +1,81 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from chat.models import Room, TradeHistoryEntry, TradeRequest
+from posts.models import TimePost
+
+User = get_user_model()
+
+
+class TradeHistoryTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = User.objects.create_user(nickname='seller', email='seller@test.com', password='testpass')
+        self.buyer = User.objects.create_user(nickname='buyer', email='buyer@test.com', password='testpass')
+        self.other = User.objects.create_user(nickname='other', email='other@test.com', password='testpass')
+        self.post = TimePost.objects.create(user=self.seller, title='컴퓨터 수리', description='설명', type='sale', price=10000)
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.seller, self.buyer)
+        self.trades = [self.create_trade(self.buyer, self.seller) for _ in range(5)]
+        self.url = reverse('trade-history')
+
+    def create_trade(self, requester, receiver):
+        return TradeRequest.objects.create(
+            room=self.room, post=self.post, requester=requester, receiver=receiver,
+            proposed_price=Decimal('10000.00'), proposed_hours=Decimal('1'),
+        )
+
+    def test_trade_creation_adds_history_for_both_parties(self):
+        self.assertEqual(TradeHistoryEntry.objects.filter(user=self.buyer).count(), 5)
+        self.assertEqual(TradeHistoryEntry.objects.filter(user=self.seller).count(), 5)
+        self.assertFalse(TradeHistoryEntry.objects.filter(user=self.other).exists())
+
+    def test_status_change_updates_history(self):
+        trade = self.trades[0]
+        trade.status = 'rejected'
+        trade.save()
+        statuses = set(TradeHistoryEntry.objects.filter(trade=trade).values_list('status', flat=True))
+        self.assertEqual(statuses, {'rejected'})
+
+    def test_cursor_pages_cover_history_once_in_order(self):
+        # 같은 created_at이어도 id로 순서가 정해져 중복/누락 없이 이어짐
+        TradeRequest.objects.filter(id__in=[t.id for t in self.trades[:3]]).update(created_at=self.trades[0].created_at)
+        TradeHistoryEntry.objects.filter(trade__in=self.trades[:3]).update(created_at=self.trades[0].created_at)
+
+        self.client.force_authenticate(user=self.buyer)
+        seen, cursor = [], None
+        while True:
+            params = {'limit': 2, **({'cursor': cursor} if cursor else {})}
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 200)
+            seen.extend(trade['id'] for trade in response.data['results'])
+            cursor = response.data['next_cursor']
+            if cursor is None:
+                break
+
+        expected = list(TradeHistoryEntry.objects.filter(user=self.buyer).order_by('-created_at', '-id').values_list('trade_id', flat=True))
+        self.assertEqual(seen, expected)
+        self.assertEqual(sorted(seen), sorted(t.id for t in self.trades))
+
+    def test_invalid_cursor_is_rejected(self):
+        self.client.force_authenticate(user=self.buyer)
+        response = self.client.get(self.url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_trades_mount_serves_history(self):
+        self.client.force_authenticate(user=self.other)
+        response = self.client.get('/api/trades/history/', {'limit': 20})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'results': [], 'next_cursor': None})
+
+    def test_unpaginated_request_keeps_array_shape(self):
+        """limit/cursor 없는 기존 요청은 전체 목록 배열 (최신순)"""
+        self.client.force_authenticate(user=self.buyer)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        expected = list(TradeHistoryEntry.objects.filter(user=self.buyer).order_by('-created_at', '-id').values_list('trade_id', flat=True))
+        self.assertEqual([trade['id'] for trade in response.data], expected)
@@ -0,0 +1,140 @@
+import json
+from decimal import Decimal
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from chat import throttling
+from chat.models import Room, TradeEvent, TradeHistoryEntry, TradeRequest
+from chat.tests.websocket import chat_socket
+from chat.trade_state import InvalidTransition, transition
+from posts.models import TimePost
+from wallet.models import Wallet
+
+User = get_user_model()
+
+
+class TradeStateMachineTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = User.objects.create_user(nickname='seller', email='seller@test.com', password='testpass')
+        self.buyer = User.objects.create_user(nickname='buyer', email='buyer@test.com', password='testpass')
+        self.post = TimePost.objects.create(user=self.seller, title='컴퓨터 수리', description='설명', type='sale', price=10000)
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.seller, self.buyer)
+        self.trade = TradeRequest.objects.create(
+            room=self.room, post=self.post, requester=self.buyer, receiver=self.seller,
+            proposed_price=Decimal('10000.00'), proposed_hours=Decimal('2'),
+        )
+
+    def events(self):
+        return list(TradeEvent.objects.filter(trade=self.trade).order_by('id').values_list('event_type', 'status'))
+
+    def test_transition_is_one_narrow_update_and_one_event(self):
+        with CaptureQueriesContext(connection) as queries:
+            transition(self.trade, 'accepted', actor_id=self.buyer.id)
+
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"requester_accepted"', updates[0])
+        self.assertNotIn('"proposed_price"', updates[0])
+        self.assertEqual(self.events(), [('created', 'pending'), ('accepted', 'pending')])
+        self.trade.refresh_from_db()
+        self.assertTrue(self.trade.requester_accepted)
+
+    def test_terminal_and_stale_trades_cannot_transition(self):
+        stale = TradeRequest.objects.get(id=self.trade.id)
+        transition(self.trade, 'rejected', actor_id=self.seller.id)
+
+        with self.assertRaises(InvalidTransition):
+            transition(self.trade, 'accepted', actor_id=self.buyer.id)
+        # 다른 요청이 먼저 거절한 뒤의 오래된 객체 (compare-and-set 실패)
+        with self.assertRaises(InvalidTransition):
+            transition(stale, 'accepted', actor_id=self.buyer.id)
+        self.assertEqual(set(TradeHistoryEntry.objects.filter(trade=self.trade).values_list('status', flat=True)), {'rejected'})
+
+    def test_non_participant_cannot_accept(self):
+        other = User.objects.create_user(nickname='other', email='other@test.com', password='testpass')
+        with self.assertRaises(InvalidTransition):
+            transition(self.trade, 'accepted', actor_id=other.id)
+
+    def test_events_are_append_only(self):
+        event = TradeEvent.objects.filter(trade=self.trade).get()
+        with self.assertRaises(ValueError):
+            event.save()
+        with self.assertRaises(ValueError):
+            event.delete()
+
+    def accept_both(self):
+        transition(self.trade, 'accepted', actor_id=self.buyer.id)
+        self.client.force_authenticate(user=self.seller)
+        return self.client.patch(reverse('trade-detail', kwargs={'trade_id': self.trade.id}), {'receiver_accepted': True}, format='json')
+
+    def test_settlement_completes_and_logs_events(self):
+        Wallet.objects.create(user=self.buyer, balance=Decimal('5'))
+        response = self.accept_both()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'completed')
+        self.assertEqual(Wallet.objects.get(user=self.seller).balance, Decimal('2'))
+        self.assertEqual(self.events(), [
+            ('created', 'pending'), ('accepted', 'pending'), ('accepted', 'pending'), ('completed', 'completed'),
+        ])
+
+        response = self.client.get(reverse('trade-events', kwargs={'trade_id': self.trade.id}))
+        self.assertEqual([event['event_type'] for event in response.data], ['created', 'accepted', 'accepted', 'completed'])
+        self.assertEqual(response.data[1]['actor'], self.buyer.id)
+
+    def test_failed_settlement_is_recorded(self):
+        """잔액 부족으로 정산이 실패해도 거절 상태와 사유가 커밋됨"""
+        Wallet.objects.create(user=self.buyer, balance=Decimal('1'))
+        response = self.accept_both()
+
+        self.assertEqual(response.status_code, 400)
+        self.trade.refresh_from_db()
+        self.assertEqual(self.trade.status, 'rejected')
+        event = TradeEvent.objects.filter(trade=self.trade).last()
+        self.assertEqual((event.event_type, event.status), ('failed', 'rejected'))
+        self.assertIn('잔액이 부족', event.note)
+        self.assertEqual(Wallet.objects.get(user=self.buyer).balance, Decimal('1'))
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class TradeResponseValidationTest(TestCase):
+    def setUp(self):
+        throttling.reset_user_buckets()
+        self.seller = User.objects.create_user(nickname='seller', email='seller@test.com', password='testpass')
+        self.buyer = User.objects.create_user(nickname='buyer', email='buyer@test.com', password='testpass')
+        self.post = TimePost.objects.create(user=self.seller, title='컴퓨터 수리', description='설명', type='sale', price=10000)
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.seller, self.buyer)
+        Wallet.objects.create(user=self.buyer, balance=Decimal('10'))
+        Wallet.objects.create(user=self.seller, balance=Decimal('0'))
+        self.trade = TradeRequest.objects.create(
+            room=self.room, post=self.post, requester=self.buyer, receiver=self.seller,
+            proposed_price=Decimal('10000.00'), proposed_hours=Decimal('2'), requester_accepted=True,
+        )
+
+    def test_unknown_response_does_not_settle(self):
+        """'accept'/'reject' 외의 응답은 에러 프레임만 보내고 거래/지갑을 바꾸지 않음"""
+        async def scenario():
+            frames = []
+            async with chat_socket(self.seller, self.room.id) as communicator:
+                for response in ('acept', None):
+                    event = {'type': 'trade_response', 'trade_request_id': self.trade.id, 'response': response}
+                    await communicator.send_to(text_data=json.dumps(event))
+                    frames.append(json.loads(await communicator.receive_from()))
+            return frames
+
+        for frame in async_to_sync(scenario)():
+            self.assertEqual(frame['type'], 'error')
+        self.trade.refresh_from_db()
+        self.assertEqual(self.trade.status, 'pending')
+        self.assertFalse(self.trade.receiver_accepted)
+        self.assertEqual(Wallet.objects.get(user=self.buyer).balance, Decimal('10'))
+        self.assertEqual(Wallet.objects.get(user=self.seller).balance, Decimal('0'))
@@ -0,0 +1,85 @@
+import json
+from decimal import Decimal
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from chat import throttling
+from chat.models import Room, TradeRequest
+from chat.tests.websocket import chat_socket
+from posts.models import TimePost
+from wallet.models import Wallet
+
+User = get_user_model()
+
+# 거래 행 1 (수락) + 지갑 2 (차감/입금) + 거래 행 1 (완료) + 거래 히스토리 1 (상태)
+MAX_UPDATES_PER_SETTLED_ACCEPTANCE = 5
+
+
+def updates(queries):
+    return [query['sql'] for query in queries if query['sql'].startswith('UPDATE')]
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class TradeAcceptanceWriteTest(TestCase):
+    """거래 수락 한 번에 실행되는 UPDATE 문 수 상한 (전체 행 save() 반복 회귀 방지)"""
+
+    def setUp(self):
+        throttling.reset_user_buckets()
+        self.seller = User.objects.create_user(nickname='seller', email='seller@test.com', password='testpass')
+        self.buyer = User.objects.create_user(nickname='buyer', email='buyer@test.com', password='testpass')
+        self.post = TimePost.objects.create(user=self.seller, title='컴퓨터 수리', description='설명', type='sale', price=10000)
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.seller, self.buyer)
+        Wallet.objects.create(user=self.buyer, balance=Decimal('10'))
+        Wallet.objects.create(user=self.seller, balance=Decimal('0'))
+        self.trade = TradeRequest.objects.create(
+            room=self.room, post=self.post, requester=self.buyer, receiver=self.seller,
+            proposed_price=Decimal('10000.00'), proposed_hours=Decimal('2'), requester_accepted=True,
+        )
+
+    def assertSettled(self):
+        self.trade.refresh_from_db()
+        self.assertEqual(self.trade.status, 'completed')
+        self.assertEqual(Wallet.objects.get(user=self.buyer).balance, Decimal('8'))
+        self.assertEqual(Wallet.objects.get(user=self.seller).balance, Decimal('2'))
+
+    def test_http_acceptance(self):
+        client = APIClient()
+        client.force_authenticate(user=self.seller)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.patch(reverse('trade-detail', kwargs={'trade_id': self.trade.id}), {'receiver_accepted': True}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertSettled()
+        self.assertLessEqual(len(updates(queries)), MAX_UPDATES_PER_SETTLED_ACCEPTANCE, updates(queries))
+
+    def test_websocket_acceptance(self):
+        async def scenario():
+            async with chat_socket(self.seller, self.room.id) as communicator:
+                await communicator.send_to(text_data=json.dumps({
+                    'type': 'trade_response', 'trade_request_id': self.trade.id, 'response': 'accept',
+                }))
+                return json.loads(await communicator.receive_from())
+
+        # 연결/종료는 UPDATE를 실행하지 않으므로 대화 전체를 캡처
+        with CaptureQueriesContext(connection) as queries:
+            frame = async_to_sync(scenario)()
+        self.assertEqual(frame['type'], 'trade_status_update')
+        self.assertSettled()
+        self.assertLessEqual(len(updates(queries)), MAX_UPDATES_PER_SETTLED_ACCEPTANCE, updates(queries))
+
+    def test_updates_touch_only_changed_columns(self):
+        client = APIClient()
+        client.force_authenticate(user=self.seller)
+        with CaptureQueriesContext(connection) as queries:
+            client.patch(reverse('trade-detail', kwargs={'trade_id': self.trade.id}), {'receiver_accepted': True}, format='json')
+
+        for sql in updates(queries):
+            self.assertNotIn('"proposed_price"', sql)
+            self.assertNotIn('"user_id" =', sql.split('WHERE')[0])
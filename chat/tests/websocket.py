@@ -0,0 +1,33 @@
+"""ChatConsumer WebSocket 테스트 공용 헬퍼"""
+from contextlib import asynccontextmanager
+
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+
+from chat.routing import websocket_urlpatterns
+
+
+def with_user(inner, user):
+    """테스트용 미들웨어: scope에 사용자 주입"""
+    async def app(scope, receive, send):
+        scope = dict(scope, user=user)
+        return await inner(scope, receive, send)
+    return app
+
+
+def chat_communicator(user, room_id, query='', **kwargs):
+    """/ws/chat/<room_id>/ 에 user로 접속하는 통신기 (연결 전)"""
+    path = f'/ws/chat/{room_id}/' + (f'?{query}' if query else '')
+    return WebsocketCommunicator(with_user(URLRouter(websocket_urlpatterns), user), path, **kwargs)
+
+
+@asynccontextmanager
+async def chat_socket(user, room_id, query='', **kwargs):
+    """연결된 통신기 - 블록이 끝나면 연결 종료"""
+    communicator = chat_communicator(user, room_id, query, **kwargs)
+    connected, _ = await communicator.connect()
+    assert connected, f'/ws/chat/{room_id}/ 연결 실패'
+    try:
+        yield communicator
+    finally:
+        await communicator.disconnect()
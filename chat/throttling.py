@@ -0,0 +1,137 @@
+"""
+ChatConsumer 수신 프레임 속도 제한 및 드롭 지표
+
+- TokenBucket: 연결(connection) 단위 / 사용자(user) 단위 토큰 버킷 (consume_all로 두 버킷을 함께 소비)
+- 사용자 버킷은 워커 프로세스 내에서 같은 사용자의 모든 소켓이 공유하며, 마지막 소켓이 끊기면 해제됩니다.
+  (익명 연결은 사용자 id가 없으므로 연결마다 별도 버킷)
+- 드롭된 프레임 수는 사유별로 집계되어 get_dropped_frame_counts()로 조회할 수 있습니다.
+"""
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+
+
+DEFAULT_CHAT_WEBSOCKET_LIMITS = {
+    'CONNECTION_RATE': 5,      # 연결당 초당 허용 프레임 수
+    'CONNECTION_BURST': 10,    # 연결당 순간 허용 프레임 수
+    'USER_RATE': 10,           # 사용자당 초당 허용 프레임 수 (모든 연결 합산)
+    'USER_BURST': 20,          # 사용자당 순간 허용 프레임 수
+    'SEND_QUEUE_SIZE': 100,    # 연결당 송신 대기열 최대 길이
+    'MAX_VIOLATIONS': 20,      # 연속 제한 초과 시 연결을 끊는 기준
+}
+
+
+def get_limits():
+    """settings.CHAT_WEBSOCKET_LIMITS 값을 기본값과 병합하여 반환"""
+    limits = dict(DEFAULT_CHAT_WEBSOCKET_LIMITS)
+    limits.update(getattr(settings, 'CHAT_WEBSOCKET_LIMITS', {}))
+    return limits
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self._clock = clock
+        self._updated_at = clock()
+
+    def _refill(self):
+        now = self._clock()
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def available(self, tokens=1):
+        """토큰을 소비하지 않고 tokens개가 남아 있는지 확인"""
+        self._refill()
+        return self.tokens >= tokens
+
+    def consume(self, tokens=1):
+        """토큰을 소비할 수 있으면 True, 부족하면 False"""
+        if self.available(tokens):
+            self.tokens -= tokens
+            return True
+        return False
+
+
+def consume_all(*buckets, tokens=1):
+    """모든 버킷에 토큰이 있을 때만 함께 소비 (하나라도 부족하면 어느 버킷도 소비하지 않음)"""
+    if not all(bucket.available(tokens) for bucket in buckets):
+        return False
+    for bucket in buckets:
+        bucket.tokens -= tokens
+    return True
+
+
+# 사용자 id → [버킷, 이 버킷을 쓰는 연결 수]
+_user_buckets = {}
+_user_buckets_lock = threading.Lock()
+
+
+def _new_user_bucket():
+    limits = get_limits()
+    return TokenBucket(limits['USER_RATE'], limits['USER_BURST'])
+
+
+def acquire_user_bucket(user_id):
+    """연결 시 사용자별 공유 토큰 버킷 획득 (연결 종료 시 release_user_bucket 호출)"""
+    if user_id is None:
+        return _new_user_bucket()
+    with _user_buckets_lock:
+        entry = _user_buckets.get(user_id)
+        if entry is None:
+            entry = _user_buckets[user_id] = [_new_user_bucket(), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def release_user_bucket(user_id):
+    """연결 종료 시 호출 - 사용자의 마지막 연결이면 버킷 삭제"""
+    if user_id is None:
+        return
+    with _user_buckets_lock:
+        entry = _user_buckets.get(user_id)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _user_buckets[user_id]
+
+
+def user_bucket_count():
+    """현재 보관 중인 사용자 버킷 수"""
+    with _user_buckets_lock:
+        return len(_user_buckets)
+
+
+def reset_user_buckets():
+    """테스트 등에서 사용자 버킷 초기화"""
+    with _user_buckets_lock:
+        _user_buckets.clear()
+
+
+# 📊 드롭된 프레임 지표 (사유별 누적 카운트)
+_dropped_frames = Counter()
+_dropped_frames_lock = threading.Lock()
+
+
+def record_dropped_frame(reason):
+    with _dropped_frames_lock:
+        _dropped_frames[reason] += 1
+
+
+def get_dropped_frame_counts():
+    """사유별 드롭 프레임 수 스냅샷 반환"""
+    with _dropped_frames_lock:
+        return dict(_dropped_frames)
+
+
+def reset_dropped_frame_counts():
+    with _dropped_frames_lock:
+        _dropped_frames.clear()
@@ -0,0 +1,182 @@
+"""
+거래 요청 상태 머신
+
+- 상태/수락 여부 변경은 모두 transition()을 거칩니다.
+  전이마다 TradeRequest에 바뀌는 필드만 담은 UPDATE 한 번과 TradeEvent(추가 전용 로그) INSERT 한 번을 실행합니다.
+- UPDATE는 현재 상태를 조건으로 거는 compare-and-set이므로, 다른 요청이 먼저 종료 상태로 바꿨다면 InvalidTransition
+- settle(): 양쪽 수락 후 지갑 이동과 'completed' 전이를 처리하고, 정산 불가(잔액 부족 등)는 'failed' 전이로 기록합니다.
+
+이벤트       바뀌는 필드
+created      (TradeRequest 생성 시 chat.signals에서 기록)
+accepted     <역할>_accepted = True
+withdrawn    <역할>_accepted = False
+rejected     status = rejected, <역할>_accepted = False
+completed    status = completed
+failed       status = rejected (사유는 이벤트 note)
+cancelled    status = cancelled
+"""
+import logging
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from .models import TradeEvent, TradeHistoryEntry, TradeRequest
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ('completed', 'rejected', 'cancelled')
+
+# 이벤트 → 바뀌는 상태 (None이면 상태 유지)
+EVENT_STATUS = {
+    'accepted': None,
+    'withdrawn': None,
+    'rejected': 'rejected',
+    'completed': 'completed',
+    'failed': 'rejected',
+    'cancelled': 'cancelled',
+}
+
+# 이벤트 → 행위자 역할의 수락 여부 (행위자가 거래 당사자여야 하는 이벤트)
+EVENT_ACCEPTANCE = {
+    'accepted': True,
+    'withdrawn': False,
+    'rejected': False,
+}
+
+
+class InvalidTransition(ValidationError):
+    """현재 상태에서 허용되지 않는 전이"""
+
+
+def participant_role(trade, user_id):
+    """'requester' / 'receiver' / None (거래 당사자가 아님)"""
+    if user_id == trade.requester_id:
+        return 'requester'
+    if user_id == trade.receiver_id:
+        return 'receiver'
+    return None
+
+
+def transition(trade, event_type, actor_id=None, note=''):
+    """
+    거래 상태 전이 - 바뀌는 필드만 UPDATE하고 이벤트를 추가합니다. (trade 객체에도 반영)
+    종료 상태의 거래나, 조회 후 다른 요청이 상태를 바꾼 거래는 InvalidTransition
+    """
+    if trade.status in TERMINAL_STATUSES:
+        raise InvalidTransition(f"이미 처리된 거래입니다 (상태: {trade.get_status_display()})")
+
+    changes = {}
+    if event_type in EVENT_ACCEPTANCE:
+        role = participant_role(trade, actor_id)
+        if role is None:
+            raise InvalidTransition("이 거래 요청에 대한 권한이 없습니다.")
+        changes[f'{role}_accepted'] = EVENT_ACCEPTANCE[event_type]
+    if EVENT_STATUS[event_type]:
+        changes['status'] = EVENT_STATUS[event_type]
+    changes['updated_at'] = timezone.now()
+
+    updated = TradeRequest.objects.filter(id=trade.id, status=trade.status).update(**changes)
+    if not updated:
+        raise InvalidTransition("다른 요청이 먼저 거래 상태를 변경했습니다.")
+    for field, value in changes.items():
+        setattr(trade, field, value)
+
+    TradeEvent.objects.create(trade=trade, event_type=event_type, actor_id=actor_id, status=trade.status, note=note)
+    if 'status' in changes:
+        TradeHistoryEntry.record_trade(trade)
+    return trade
+
+
+def initial_events(trade):
+    """기존(일괄 생성된) 거래 요청의 현재 상태를 설명하는 저장 전 이벤트 목록"""
+    events = [TradeEvent(trade=trade, event_type='created', actor_id=trade.requester_id, status='pending', created_at=trade.created_at)]
+    for role in ('requester', 'receiver'):
+        if getattr(trade, f'{role}_accepted'):
+            events.append(TradeEvent(
+                trade=trade, event_type='accepted', actor_id=getattr(trade, f'{role}_id'),
+                status='pending', created_at=trade.updated_at,
+            ))
+    if trade.status in TERMINAL_STATUSES:
+        events.append(TradeEvent(trade=trade, event_type=trade.status, status=trade.status, created_at=trade.updated_at))
+    return events
+
+
+def _payer_and_payee(trade):
+    """게시글 타입에 따른 (지불자, 수령자) - 정산할 수 없는 거래면 ValidationError"""
+    post = trade.post
+    if post.type == 'sale':
+        # 판매 글: 게시글 작성자가 판매자, 거래 요청자가 구매자(지불)
+        if trade.requester_id == post.user_id:
+            raise ValidationError("자신의 판매글은 구매할 수 없습니다.")
+        return trade.requester, post.user
+    if post.type == 'request':
+        # 구인 글: 게시글 작성자가 구인자(지불), 거래 요청자가 지원자
+        if trade.requester_id == post.user_id:
+            raise ValidationError("자신의 구인글에는 지원할 수 없습니다.")
+        return post.user, trade.requester
+    raise ValidationError(f"알 수 없는 게시글 타입: {post.type}")
+
+
+def settle(trade):
+    """
+    양쪽 모두 수락한 거래 정산 (trade 행은 호출하는 쪽에서 select_for_update로 잠근 상태)
+    - 성공: 지갑 이동 + 거래 내역 2건 + 'completed' 전이
+    - 실패: 'failed' 전이(status=rejected) 후 ValidationError
+      호출하는 쪽 트랜잭션이 롤백되면 실패 기록도 사라지므로, 예외는 트랜잭션 밖에서 다시 올려야 합니다.
+    """
+    from wallet.models import Transaction, Wallet
+
+    logger.info(f"[거래 처리 시작] Trade #{trade.id}")
+    proposed_hours = trade.proposed_hours
+    try:
+        payer, payee = _payer_and_payee(trade)
+        post = trade.post
+
+        # 🔒 지갑 이동은 세이브포인트 안에서 처리 (실패 시 지갑/내역 변경만 되돌림)
+        with transaction.atomic():
+            payer_wallet, _ = Wallet.objects.get_or_create(user=payer)
+            payee_wallet, _ = Wallet.objects.get_or_create(user=payee)
+
+            # 💰 거래 실행 - 잔액 확인과 차감을 조건부 UPDATE 한 번으로 (balance 열만 갱신)
+            if not Wallet.debit(payer_wallet.id, proposed_hours):
+                payer_wallet.refresh_from_db(fields=['balance'])
+                raise ValidationError(
+                    f"{payer.nickname}님의 잔액이 부족하여 거래가 거절되었습니다. "
+                    f"필요: {proposed_hours}시간, 현재 잔액: {payer_wallet.balance}시간"
+                )
+            Wallet.credit(payee_wallet.id, proposed_hours)
+
+            # 📝 거래 내역 기록
+            Transaction.objects.create(
+                wallet=payer_wallet,
+                transaction_type='withdraw',
+                amount=proposed_hours,
+                note=(
+                    f"[{post.get_type_display()}] 거래 #{trade.id}: "
+                    f"{payee.nickname}님에게 {proposed_hours}시간 지불 (게시글: {post.title})"
+                ),
+            )
+            Transaction.objects.create(
+                wallet=payee_wallet,
+                transaction_type='deposit',
+                amount=proposed_hours,
+                note=(
+                    f"[{post.get_type_display()}] 거래 #{trade.id}: "
+                    f"{payer.nickname}님으로부터 {proposed_hours}시간 받음 (게시글: {post.title})"
+                ),
+            )
+            transition(trade, 'completed')
+    except InvalidTransition:
+        raise
+    except ValidationError as e:
+        logger.warning(f"  - ❌ 정산 불가: {' '.join(e.messages)}")
+        transition(trade, 'failed', note=' '.join(e.messages))
+        raise
+    except Exception as e:
+        logger.error(f"  - ❌ 거래 처리 실패: {str(e)}", exc_info=True)
+        transition(trade, 'failed', note=str(e))
+        raise ValidationError(f"거래 처리 중 오류가 발생했습니다: {str(e)}")
+
+    logger.info(f"[거래 완료] Trade #{trade.id} ✅ {payer.nickname} → {payee.nickname}: {proposed_hours}시간")
+    return trade
@@ -7,11 +7,13 @@ urlpatterns = [
     path('match/my-chats/', views.MyChatsView.as_view(), name='my-chats'), #내 채팅방 목록
     path('match/chat/<int:room_id>/', views.ChatRoomDetailView.as_view(), name='chat-room-detail'), #채팅방 상세
     path('match/chat/<int:room_id>/messages/', views.ChatMessageListCreateView.as_view(), name='chat-messages'), #채팅 메시지 목록(읽기 전용)
+    path('search/messages/', views.ChatMessageSearchView.as_view(), name='chat-message-search'), #채팅 메시지 검색
     
     # 거래 관련
     path('match/chat/<int:room_id>/trades/', views.TradeRequestListView.as_view(), name='trade-list'), #거래 요청 목록
     path('match/chat/<int:room_id>/trades/create/', views.TradeRequestCreateView.as_view(), name='trade-create'), #거래 요청 생성
     path('match/trades/<int:trade_id>/', views.TradeRequestDetailView.as_view(), name='trade-detail'), #거래 요청 상세/수정
+    path('match/trades/<int:trade_id>/events/', views.TradeEventListView.as_view(), name='trade-events'), #거래 상태 변경 이력
     
     # 거래 히스토리 (전체)
     path('history/', views.TradeHistoryView.as_view(), name='trade-history'), #전체 거래 히스토리
@@ -2,15 +2,25 @@ from rest_framework import generics, status, serializers
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from .models import Room, ChatMessage, TradeRequest
+from .models import Room, ChatMessage, TradeRequest, TradeEvent, RoomReadState
 from .serializers import (
     RoomSerializer, ChatMessageSerializer, ChatRoomListSerializer,
-    TradeRequestSerializer, TradeRequestCreateSerializer
+    TradeRequestSerializer, TradeRequestCreateSerializer, TradeEventSerializer
 )
 from users.models import User
 from posts.models import TimePost
 from django.http import Http404
+from django.db import transaction
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from push_notice.services import send_push_to_user
+from .search import search_messages
+from .history import history_queryset, trade_history_page
+from .trade_state import TERMINAL_STATUSES, InvalidTransition, participant_role, settle, transition
+from TimeMarket_BackEnd.conditional import conditional_get
+from TimeMarket_BackEnd import metrics
+from TimeMarket_BackEnd.replicas import ReplicaReadMixin
 
 
 class MatchRequestView(APIView):
@@ -62,12 +72,39 @@ class MatchRequestView(APIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+def my_chats_version(request):
+    """
+    내 채팅방 목록 ETag 버전: 방 추가, 새 메시지, 게시글 수정, 읽음 상태 변경 시 바뀜
+    목록에 포함된 참여자(상대방/게시글 작성자)의 프로필 수정과 평점 변화(받은 리뷰 추가/삭제)도 반영
+    """
+    version = Room.objects.filter(users=request.user).aggregate(
+        room_count=Count('id', distinct=True),
+        last_room_id=Max('id'),
+        last_message_id=Max('messages__id'),
+        post_updated_at=Max('post__updated_at'),
+    )
+    version.update(RoomReadState.objects.filter(user=request.user).aggregate(read_updated_at=Max('updated_at')))
+    members = User.objects.filter(id__in=Room.users.through.objects.filter(room__users=request.user).values('user_id'))
+    version.update(members.aggregate(
+        users_updated_at=Max('updated_at'),
+        review_count=Count('received_reviews'),
+        last_review_id=Max('received_reviews__id'),
+    ))
+    return sorted(version.items())
+
+
+@conditional_get(my_chats_version)
 class MyChatsView(generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ChatRoomListSerializer
 
     def get_queryset(self):
-        return Room.objects.filter(users=self.request.user).select_related('post__user').prefetch_related('users', 'messages')
+        # 📬 안 읽은 메시지 수는 RoomReadState (room, user) 인덱스 한 번 조회로 가져옵니다.
+        read_state = RoomReadState.objects.filter(room=OuterRef('pk'), user=self.request.user)
+        return Room.objects.filter(users=self.request.user).select_related('post__user').prefetch_related('users', 'messages').annotate(
+            unread_count=Coalesce(Subquery(read_state.values('unread_count')[:1]), Value(0)),
+            last_read_message_id=Subquery(read_state.values('last_read_message_id')[:1]),
+        )
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -105,11 +142,13 @@ class ChatMessageListCreateView(generics.ListCreateAPIView):
         if not receiver:
             raise serializers.ValidationError("상대방을 찾을 수 없습니다.")
 
-        serializer.save(
-            room=room,
-            sender=self.request.user,
-            receiver=receiver
-        )
+        with transaction.atomic():
+            message = serializer.save(
+                room=room,
+                sender=self.request.user,
+                receiver=receiver
+            )
+            RoomReadState.record_new_message(message)
 
 
 class TradeRequestListView(generics.ListAPIView):
@@ -123,7 +162,7 @@ class TradeRequestListView(generics.ListAPIView):
         return TradeRequest.objects.filter(
             room__id=room_id,
             room__users=self.request.user
-        ).order_by('-created_at')
+        ).select_related('post__user', 'requester', 'receiver').order_by('-created_at')
 
 
 class TradeRequestCreateView(generics.CreateAPIView):
@@ -173,9 +212,11 @@ class TradeRequestDetailView(generics.RetrieveUpdateAPIView):
         )
 
     def perform_update(self, serializer):
-        from django.db import transaction
-        from django.core.exceptions import ValidationError as DjangoValidationError
-        
+        """
+        자신의 수락 여부(requester_accepted / receiver_accepted)만 변경 가능 - 상태 머신(chat.trade_state) 전이로 처리
+        양쪽 모두 수락하면 정산하며, 정산 실패(거절 처리)는 커밋한 뒤 400으로 응답합니다.
+        """
+        error = None
         with transaction.atomic():
             # 🔒 락을 걸어서 거래 요청 조회
             trade_request = TradeRequest.objects.select_for_update().select_related(
@@ -183,48 +224,105 @@ class TradeRequestDetailView(generics.RetrieveUpdateAPIView):
             ).get(id=self.kwargs['trade_id'])
             
             # ✅ 이미 처리된 거래는 수정 불가
-            if trade_request.status in ['completed', 'rejected', 'cancelled']:
+            if trade_request.status in TERMINAL_STATUSES:
                 raise serializers.ValidationError(f"이미 처리된 거래는 수정할 수 없습니다 (상태: {trade_request.get_status_display()})")
             
-            # 사용자가 요청자인지 수신자인지 확인
-            if trade_request.requester == self.request.user:
-                # 요청자는 자신의 수락 상태만 변경 가능
-                if 'requester_accepted' in self.request.data:
-                    serializer.save(requester_accepted=self.request.data['requester_accepted'])
-            elif trade_request.receiver == self.request.user:
-                # 수신자는 자신의 수락 상태만 변경 가능
-                if 'receiver_accepted' in self.request.data:
-                    serializer.save(receiver_accepted=self.request.data['receiver_accepted'])
-            else:
+            # 사용자가 요청자인지 수신자인지 확인 (각자 자신의 수락 상태만 변경 가능)
+            role = participant_role(trade_request, self.request.user.id)
+            if role is None:
                 raise serializers.ValidationError("이 거래 요청에 대한 권한이 없습니다.")
-            
-            # 거래 완료 확인 (객체를 새로고침하고 확인)
-            trade_request.refresh_from_db()
-            
+
+            field = f'{role}_accepted'
+            if field in self.request.data:
+                accepted = serializers.BooleanField().to_internal_value(self.request.data[field])
+                try:
+                    transition(trade_request, 'accepted' if accepted else 'withdrawn', actor_id=self.request.user.id)
+                except InvalidTransition as e:
+                    raise serializers.ValidationError(e.messages)
+
             # 양쪽 모두 수락했는지 확인하고 거래 처리
-            if trade_request.requester_accepted and trade_request.receiver_accepted and trade_request.status == 'pending':
+            if trade_request.requester_accepted and trade_request.receiver_accepted:
                 try:
-                    # ✅ 모델의 process_trade 메서드를 사용하여 거래 처리
-                    trade_request.process_trade()
+                    with metrics.track_settlement('http'):
+                        settle(trade_request)
                 except DjangoValidationError as e:
-                    # Django ValidationError를 DRF ValidationError로 변환
-                    raise serializers.ValidationError(str(e))
+                    error = e
+
+        if error is not None:
+            # Django ValidationError를 DRF ValidationError로 변환 (거절 처리는 커밋된 상태)
+            raise serializers.ValidationError(error.messages)
+        serializer.instance = trade_request
 
 
-class TradeHistoryView(generics.ListAPIView):
-    """사용자의 전체 거래 히스토리 조회"""
+class TradeEventListView(generics.ListAPIView):
+    """거래 요청의 상태 전이 이벤트 로그 (발생 순)"""
     permission_classes = [IsAuthenticated]
-    serializer_class = TradeRequestSerializer
+    serializer_class = TradeEventSerializer
 
     def get_queryset(self):
-        # 사용자가 참여한 모든 채팅방의 거래 요청을 조회
-        return TradeRequest.objects.filter(
-            room__users=self.request.user
-        ).select_related(
-            'room', 'post', 'post__user', 'requester', 'receiver'
-        ).order_by('-created_at')
+        return TradeEvent.objects.filter(
+            trade_id=self.kwargs['trade_id'],
+            trade__room__users=self.request.user
+        ).order_by('id')
+
+
+class TradeHistoryView(ReplicaReadMixin, APIView):
+    """
+    사용자의 전체 거래 히스토리 조회 (최신순)
+    - ?limit= 또는 ?cursor=가 있으면 {'results', 'next_cursor'} 페이지 응답
+    - 둘 다 없으면 기존 클라이언트와 호환되는 전체 목록 배열
+    """
+    permission_classes = [IsAuthenticated]
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        context.update({"request": self.request})
-        return context
\ No newline at end of file
+    def get(self, request):
+        if 'limit' not in request.query_params and 'cursor' not in request.query_params:
+            trades = [entry.trade for entry in history_queryset(request.user)]
+            return Response(TradeRequestSerializer(trades, many=True, context={'request': request}).data)
+
+        try:
+            limit = max(min(int(request.query_params.get('limit', self.DEFAULT_LIMIT)), self.MAX_LIMIT), 1)
+            trades, next_cursor = trade_history_page(
+                request.user, cursor=request.query_params.get('cursor'), limit=limit
+            )
+        except ValueError as e:
+            return Response({"error": f"잘못된 조회 조건입니다: {e}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = TradeRequestSerializer(trades, many=True, context={'request': request})
+        return Response({
+            'results': serializer.data,
+            'next_cursor': next_cursor,
+        })
+
+
+class ChatMessageSearchView(APIView):
+    """내가 참여한 채팅방의 메시지 전문 검색 (?q=검색어&room_id=&limit=&offset=)"""
+    permission_classes = [IsAuthenticated]
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({"error": "검색어(q)를 입력해주세요."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            room_id = request.query_params.get('room_id')
+            room_id = int(room_id) if room_id else None
+            limit = min(int(request.query_params.get('limit', self.DEFAULT_LIMIT)), self.MAX_LIMIT)
+            offset = max(int(request.query_params.get('offset', 0)), 0)
+        except ValueError:
+            return Response({"error": "room_id, limit, offset은 정수여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        limit = max(limit, 1)
+
+        # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+        messages = search_messages(request.user, query, room_id=room_id, limit=limit + 1, offset=offset)
+        has_more = len(messages) > limit
+        messages = messages[:limit]
+
+        serializer = ChatMessageSerializer(messages, many=True, context={'request': request})
+        return Response({
+            'results': serializer.data,
+            'next_offset': offset + limit if has_more else None,
+        })
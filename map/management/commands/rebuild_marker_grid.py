@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from map.models import MarkerGridCell
+
+
+class Command(BaseCommand):
+    help = "활성 마커 전체로 클러스터 격자 집계(MarkerGridCell)를 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        count = MarkerGridCell.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"✅ 격자 집계 재계산 완료: {count}개 셀"))
@@ -0,0 +1,87 @@
+# Generated by Django 5.2.1 on 2026-10-19 12:06
+
+from math import asinh, pi, radians, tan
+
+from django.db import migrations, models
+
+# 마이그레이션 시점의 격자 계산 (map.tiles가 바뀌어도 이 마이그레이션의 결과는 그대로 유지)
+CLUSTER_MAX_ZOOM = 15
+CELL_SUBDIVISION = 3
+MAX_LATITUDE = 85.05112878
+
+
+def lat_lng_to_tile(lat, lng, zoom):
+    n = 2**zoom
+    lat = max(min(lat, MAX_LATITUDE), -MAX_LATITUDE)
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1.0 - asinh(tan(radians(lat))) / pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def grid_levels():
+    return range(CELL_SUBDIVISION, CLUSTER_MAX_ZOOM + CELL_SUBDIVISION + 1)
+
+
+def populate_grid(apps, schema_editor):
+    """기존 활성 마커로 격자 집계 채우기"""
+    TimeMarker = apps.get_model("map", "TimeMarker")
+    MarkerGridCell = apps.get_model("map", "MarkerGridCell")
+    cells = {}
+    for marker in TimeMarker.objects.filter(is_active=True).iterator():
+        for level in grid_levels():
+            key = (level, *lat_lng_to_tile(marker.latitude, marker.longitude, level))
+            cell = cells.setdefault(key, [0, 0, 0.0, 0.0])
+            cell[0] += 1
+            cell[1] += 1 if marker.is_help_request else 0
+            cell[2] += marker.latitude
+            cell[3] += marker.longitude
+    MarkerGridCell.objects.bulk_create(
+        [
+            MarkerGridCell(
+                level=level,
+                cell_x=x,
+                cell_y=y,
+                marker_count=count,
+                help_request_count=help_count,
+                latitude_sum=lat_sum,
+                longitude_sum=lng_sum,
+            )
+            for (level, x, y), (count, help_count, lat_sum, lng_sum) in cells.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("map", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MarkerGridCell",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("level", models.PositiveSmallIntegerField()),
+                ("cell_x", models.PositiveIntegerField()),
+                ("cell_y", models.PositiveIntegerField()),
+                ("marker_count", models.IntegerField(default=0)),
+                ("help_request_count", models.IntegerField(default=0)),
+                ("latitude_sum", models.FloatField(default=0)),
+                ("longitude_sum", models.FloatField(default=0)),
+            ],
+            options={
+                "unique_together": {("level", "cell_x", "cell_y")},
+            },
+        ),
+        migrations.RunPython(populate_grid, migrations.RunPython.noop),
+    ]
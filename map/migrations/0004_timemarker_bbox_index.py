@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-19 12:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("map", "0003_markergridcell"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="timemarker",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["latitude", "longitude"],
+                name="map_marker_active_lat_lng",
+            ),
+        ),
+    ]
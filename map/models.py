@@ -1,5 +1,13 @@
-from django.db import models
+from functools import reduce
+from operator import or_
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Q
 from django.conf import settings
+from .tiles import grid_levels, lat_lng_to_tile
+
+# 격자 집계에 영향을 주는 마커 필드
+GRID_FIELDS = ('latitude', 'longitude', 'is_active', 'is_help_request')
 
 class TimeMarker(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
@@ -11,5 +19,118 @@ class TimeMarker(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)  # 거래 완료 시 False
 
+    class Meta:
+        indexes = [
+            # 지도 화면 bbox 조회: 활성 마커만 담는 부분(partial) 인덱스 (위도 범위 → 경도 범위)
+            models.Index(
+                fields=['latitude', 'longitude'], condition=Q(is_active=True), name='map_marker_active_lat_lng'
+            ),
+            # 활성 마커 최신순 목록 (타일 마커 목록 정렬)
+            models.Index(fields=['-created_at'], condition=Q(is_active=True), name='map_marker_active_created'),
+        ]
+
     def __str__(self):
         return f"{self.title} ({'도움요청' if self.is_help_request else '판매'})"
+
+    def save(self, *args, **kwargs):
+        # 🗺️ 클러스터 격자 집계를 함께 갱신 (이전 상태를 빼고 새 상태를 더함)
+        update_fields = kwargs.get('update_fields')
+        if self.pk and update_fields is not None and not set(update_fields) & set(GRID_FIELDS):
+            return super().save(*args, **kwargs)
+        with transaction.atomic():
+            previous = None
+            if self.pk:
+                previous = TimeMarker.objects.filter(pk=self.pk).values(*GRID_FIELDS).first()
+            super().save(*args, **kwargs)
+            if previous == {field: getattr(self, field) for field in GRID_FIELDS}:
+                # 위치/상태가 그대로면 격자 집계도 그대로
+                return
+            if previous and previous['is_active']:
+                MarkerGridCell.apply(previous['latitude'], previous['longitude'], previous['is_help_request'], -1)
+            if self.is_active:
+                MarkerGridCell.apply(self.latitude, self.longitude, self.is_help_request, +1)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            if self.is_active:
+                MarkerGridCell.apply(self.latitude, self.longitude, self.is_help_request, -1)
+            return super().delete(*args, **kwargs)
+
+
+class MarkerGridCell(models.Model):
+    """
+    활성 마커의 격자 집계 (낮은 줌 클러스터용)
+    level: 격자 줌 레벨 (클러스터 줌 + CELL_SUBDIVISION), cell_x/cell_y: 해당 레벨의 타일 좌표
+    """
+    level = models.PositiveSmallIntegerField()
+    cell_x = models.PositiveIntegerField()
+    cell_y = models.PositiveIntegerField()
+    marker_count = models.IntegerField(default=0)
+    help_request_count = models.IntegerField(default=0)
+    latitude_sum = models.FloatField(default=0)
+    longitude_sum = models.FloatField(default=0)
+
+    class Meta:
+        unique_together = (('level', 'cell_x', 'cell_y'),)
+
+    def __str__(self):
+        return f"Cell {self.level}/{self.cell_x}/{self.cell_y}: {self.marker_count}"
+
+    @classmethod
+    def apply(cls, latitude, longitude, is_help_request, sign):
+        """마커 하나를 모든 격자 레벨에 더하거나(sign=+1) 뺌(sign=-1)"""
+        touched = []
+        for level in grid_levels():
+            cell_x, cell_y = lat_lng_to_tile(latitude, longitude, level)
+            cell = cls.objects.filter(level=level, cell_x=cell_x, cell_y=cell_y)
+            changes = dict(
+                marker_count=F('marker_count') + sign,
+                help_request_count=F('help_request_count') + (sign if is_help_request else 0),
+                latitude_sum=F('latitude_sum') + sign * latitude,
+                longitude_sum=F('longitude_sum') + sign * longitude,
+            )
+            touched.append(Q(level=level, cell_x=cell_x, cell_y=cell_y))
+            if cell.update(**changes) or sign < 0:
+                continue
+            try:
+                # 세이브포인트: 같은 칸의 첫 마커가 동시에 생성되어 unique 충돌이 나도 마커 저장은 유지
+                with transaction.atomic():
+                    cls.objects.create(
+                        level=level, cell_x=cell_x, cell_y=cell_y,
+                        marker_count=1,
+                        help_request_count=1 if is_help_request else 0,
+                        latitude_sum=latitude,
+                        longitude_sum=longitude,
+                    )
+            except IntegrityError:
+                # 다른 요청이 먼저 만든 칸에 증분으로 합산
+                cell.update(**changes)
+        if sign < 0:
+            # 이번에 갱신한 칸 중 빈 칸만 삭제 (unique 인덱스 조회)
+            cls.objects.filter(reduce(or_, touched), marker_count__lte=0).delete()
+
+    @classmethod
+    def rebuild(cls):
+        """활성 마커 전체로 격자 집계를 다시 계산"""
+        cells = {}
+        markers = TimeMarker.objects.filter(is_active=True).values_list('latitude', 'longitude', 'is_help_request')
+        for latitude, longitude, is_help_request in markers.iterator():
+            for level in grid_levels():
+                key = (level, *lat_lng_to_tile(latitude, longitude, level))
+                cell = cells.setdefault(key, [0, 0, 0.0, 0.0])
+                cell[0] += 1
+                cell[1] += 1 if is_help_request else 0
+                cell[2] += latitude
+                cell[3] += longitude
+
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(
+                [
+                    cls(level=level, cell_x=x, cell_y=y, marker_count=count, help_request_count=help_count,
+                        latitude_sum=lat_sum, longitude_sum=lng_sum)
+                    for (level, x, y), (count, help_count, lat_sum, lng_sum) in cells.items()
+                ],
+                batch_size=1000,
+            )
+        return len(cells)
@@ -1,3 +1,209 @@
+from unittest import mock
+
+from django.db.models import QuerySet
 from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from .models import TimeMarker, MarkerGridCell
+from .tiles import CELL_SUBDIVISION, CLUSTER_MAX_ZOOM, grid_levels, lat_lng_to_tile, tile_bounds
+
+User = get_user_model()
+
+SEOUL = (37.5665, 126.9780)
+BUSAN = (35.1587, 129.1604)
+
+
+class TileMathTest(TestCase):
+    def test_point_is_inside_its_tile(self):
+        for zoom in (0, 5, 12, 17):
+            x, y = lat_lng_to_tile(*SEOUL, zoom)
+            south, west, north, east = tile_bounds(zoom, x, y)
+            self.assertTrue(south <= SEOUL[0] < north)
+            self.assertTrue(west <= SEOUL[1] < east)
+
+
+class MarkerTileViewTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(nickname='mapper', email='mapper@test.com', password='testpass')
+
+    def create_marker(self, lat, lng, **kwargs):
+        return TimeMarker.objects.create(
+            user=self.user, title='마커', description='설명', latitude=lat, longitude=lng, **kwargs
+        )
+
+    def get_tile(self, zoom, lat, lng):
+        x, y = lat_lng_to_tile(lat, lng, zoom)
+        return self.client.get(reverse('marker-tile', kwargs={'z': zoom, 'x': x, 'y': y}))
+
+    def test_low_zoom_returns_clusters(self):
+        """낮은 줌에서는 가까운 마커가 하나의 클러스터로 합쳐짐"""
+        self.create_marker(*SEOUL)
+        self.create_marker(SEOUL[0] + 0.001, SEOUL[1] + 0.001, is_help_request=True)
+        self.create_marker(*BUSAN)
+
+        response = self.get_tile(5, *SEOUL)
+        self.assertEqual(response.data['mode'], 'cluster')
+        counts = sorted(cluster['count'] for cluster in response.data['clusters'])
+        self.assertIn(2, counts)
+        seoul_cluster = next(c for c in response.data['clusters'] if c['count'] == 2)
+        self.assertEqual(seoul_cluster['help_request_count'], 1)
+        self.assertAlmostEqual(seoul_cluster['latitude'], SEOUL[0] + 0.0005)
+
+    def test_high_zoom_returns_active_markers_only(self):
+        active = self.create_marker(*SEOUL)
+        self.create_marker(SEOUL[0] + 0.0001, SEOUL[1] + 0.0001, is_active=False)
+
+        response = self.get_tile(CLUSTER_MAX_ZOOM + 2, *SEOUL)
+        self.assertEqual(response.data['mode'], 'markers')
+        self.assertEqual([m['id'] for m in response.data['markers']], [active.id])
+        self.assertFalse(response.data['truncated'])
+
+    def test_grid_follows_marker_updates(self):
+        """비활성화/이동/삭제 시 격자 집계가 갱신됨"""
+        marker = self.create_marker(*SEOUL)
+        level = CLUSTER_MAX_ZOOM + CELL_SUBDIVISION
+        self.assertEqual(MarkerGridCell.objects.filter(level=level).count(), 1)
+
+        marker.latitude, marker.longitude = BUSAN
+        marker.save()
+        cell_x, cell_y = lat_lng_to_tile(*BUSAN, level)
+        self.assertEqual(MarkerGridCell.objects.get(level=level).cell_x, cell_x)
+
+        marker.is_active = False
+        marker.save()
+        self.assertFalse(MarkerGridCell.objects.exists())
+
+        marker.is_active = True
+        marker.save()
+        marker.delete()
+        self.assertFalse(MarkerGridCell.objects.exists())
+
+    def test_save_without_position_change_skips_grid(self):
+        """제목/설명만 수정하면 격자 집계를 건드리지 않음"""
+        marker = self.create_marker(*SEOUL)
+        cells = list(MarkerGridCell.objects.values_list('level', 'cell_x', 'cell_y', 'marker_count', 'latitude_sum'))
+
+        marker.title = '제목 수정'
+        with self.assertNumQueries(4):  # 세이브포인트 + 이전 상태 조회 + UPDATE + 해제
+            marker.save()
+        with self.assertNumQueries(1):
+            marker.save(update_fields=['description'])
+        self.assertEqual(
+            list(MarkerGridCell.objects.values_list('level', 'cell_x', 'cell_y', 'marker_count', 'latitude_sum')), cells
+        )
+
+    def test_rebuild_matches_incremental(self):
+        self.create_marker(*SEOUL)
+        self.create_marker(*BUSAN, is_help_request=True)
+        before = set(MarkerGridCell.objects.values_list('level', 'cell_x', 'cell_y', 'marker_count', 'help_request_count'))
+        MarkerGridCell.rebuild()
+        after = set(MarkerGridCell.objects.values_list('level', 'cell_x', 'cell_y', 'marker_count', 'help_request_count'))
+        self.assertEqual(before, after)
+
+    def test_concurrent_first_marker_in_cell_is_merged(self):
+        """같은 칸의 첫 마커가 동시에 생성돼 unique 충돌이 나도 마커는 저장되고 집계는 합산됨"""
+        # 다른 요청이 먼저 만든 칸 (이 요청의 첫 UPDATE 시점에는 보이지 않았던 상황)
+        MarkerGridCell.objects.bulk_create([
+            MarkerGridCell(level=level, cell_x=x, cell_y=y, marker_count=1, latitude_sum=SEOUL[0], longitude_sum=SEOUL[1])
+            for level in grid_levels() for x, y in [lat_lng_to_tile(*SEOUL, level)]
+        ])
+        update = QuerySet.update
+        missed = set()
+
+        def update_missing_first(queryset, **changes):
+            if queryset.model is MarkerGridCell and str(queryset.query) not in missed:
+                missed.add(str(queryset.query))
+                return 0
+            return update(queryset, **changes)
+
+        with mock.patch.object(QuerySet, 'update', autospec=True, side_effect=update_missing_first):
+            marker = self.create_marker(*SEOUL)
+
+        self.assertTrue(TimeMarker.objects.filter(id=marker.id).exists())
+        self.assertEqual(set(MarkerGridCell.objects.values_list('marker_count', flat=True)), {2})
+
+    def test_removal_deletes_only_touched_empty_cells(self):
+        marker = self.create_marker(*SEOUL)
+        stale = MarkerGridCell.objects.create(level=CELL_SUBDIVISION, cell_x=0, cell_y=0, marker_count=0)
+
+        marker.delete()
+        self.assertEqual(list(MarkerGridCell.objects.all()), [stale])
+
+    def test_invalid_tile(self):
+        response = self.client.get(reverse('marker-tile', kwargs={'z': 2, 'x': 4, 'y': 0}))
+        self.assertEqual(response.status_code, 400)
+
+
+class MarkerBBoxTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(nickname='bbox', email='bbox@test.com', password='testpass')
+        self.url = reverse('timemarker-list')
+
+    def create_marker(self, lat, lng, **kwargs):
+        return TimeMarker.objects.create(
+            user=self.user, title='마커', description='설명', latitude=lat, longitude=lng, **kwargs
+        )
+
+    def test_bbox_filters_visible_active_markers(self):
+        inside = self.create_marker(*SEOUL)
+        self.create_marker(SEOUL[0] + 0.001, SEOUL[1], is_active=False)
+        self.create_marker(*BUSAN)
+
+        response = self.client.get(self.url, {'bbox': '126.9,37.5,127.1,37.6'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([m['id'] for m in response.data], [inside.id])
+        self.assertEqual(response['X-Markers-Sampled'], 'false')
+
+    def test_dense_bbox_is_sampled_under_cap(self):
+        from map.views import TimeMarkerViewSet
+
+        for i in range(10):
+            for j in range(10):
+                self.create_marker(37.5 + i * 0.01, 126.9 + j * 0.01)
+
+        original = TimeMarkerViewSet.MAX_BBOX_MARKERS
+        TimeMarkerViewSet.MAX_BBOX_MARKERS = 16
+        try:
+            response = self.client.get(self.url, {'bbox': '126.9,37.5,127.0,37.6'})
+        finally:
+            TimeMarkerViewSet.MAX_BBOX_MARKERS = original
+
+        self.assertLessEqual(len(response.data), 16)
+        self.assertGreater(len(response.data), 4)
+        self.assertEqual(response['X-Markers-Total'], '100')
+        self.assertEqual(response['X-Markers-Sampled'], 'true')
+
+    def test_markers_on_bbox_edges_stay_within_grid(self):
+        """동쪽/북쪽 경계 위의 마커도 side x side 격자 안에서 샘플링됨"""
+        from map.views import sample_markers
+
+        offsets = (0.01, 0.035, 0.06, 0.085, 0.1)  # 마지막 값은 경계 위
+        for lat_offset in offsets:
+            for lng_offset in offsets:
+                self.create_marker(37.5 + lat_offset, 126.9 + lng_offset)
+
+        queryset = TimeMarker.objects.filter(is_active=True)
+        self.assertEqual(sample_markers(queryset, (126.9, 37.5, 127.0, 37.6), 16).count(), 16)
+        # 폭이 0인 bbox는 0으로 나누지 않고 한 칸으로 처리
+        self.assertEqual(sample_markers(queryset, (126.9, 37.5, 126.9, 37.6), 16).count(), 4)
+
+    def test_bbox_query_uses_index(self):
+        from django.db import connection
+
+        queryset = TimeMarker.objects.filter(
+            is_active=True, latitude__gte=37.5, latitude__lte=37.6, longitude__gte=126.9, longitude__lte=127.1
+        )
+        if connection.vendor != 'sqlite':
+            self.skipTest('EXPLAIN QUERY PLAN은 SQLite 전용')
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            plan = ' '.join(str(row) for row in cursor.fetchall())
+        self.assertIn('map_marker_active_lat_lng', plan)
 
-# Create your tests here.
+    def test_invalid_bbox(self):
+        response = self.client.get(self.url, {'bbox': '127,37'})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,41 @@
+"""
+웹 메르카토르(slippy map) 타일 좌표 계산
+
+z/x/y 타일 규약은 네이버/카카오/구글 지도와 같습니다.
+"""
+from math import asinh, atan, degrees, pi, radians, sinh, tan
+
+# 이 줌 이하에서는 클러스터, 초과하면 개별 마커를 반환
+CLUSTER_MAX_ZOOM = 15
+# 타일 하나를 2^CELL_SUBDIVISION x 2^CELL_SUBDIVISION 격자로 나눠 클러스터링 (8x8)
+CELL_SUBDIVISION = 3
+MAX_LATITUDE = 85.05112878
+
+
+def lat_lng_to_tile(lat, lng, zoom):
+    """위도/경도가 속한 타일 좌표 (x, y)"""
+    n = 2 ** zoom
+    lat = max(min(lat, MAX_LATITUDE), -MAX_LATITUDE)
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1.0 - asinh(tan(radians(lat))) / pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tile_bounds(zoom, x, y):
+    """타일의 (south, west, north, east) 경계"""
+    n = 2 ** zoom
+    west = x / n * 360.0 - 180.0
+    east = (x + 1) / n * 360.0 - 180.0
+    north = degrees(atan(sinh(pi * (1 - 2 * y / n))))
+    south = degrees(atan(sinh(pi * (1 - 2 * (y + 1) / n))))
+    return south, west, north, east
+
+
+def grid_levels():
+    """미리 집계하는 격자 레벨 목록 (클러스터 줌 0..CLUSTER_MAX_ZOOM 각각에 대응)"""
+    return range(CELL_SUBDIVISION, CLUSTER_MAX_ZOOM + CELL_SUBDIVISION + 1)
+
+
+def is_valid_tile(zoom, x, y):
+    n = 2 ** zoom
+    return 0 <= zoom <= 22 and 0 <= x < n and 0 <= y < n
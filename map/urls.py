@@ -1,10 +1,11 @@
 from rest_framework.routers import DefaultRouter
 from django.urls import path, include
-from .views import TimeMarkerViewSet
+from .views import TimeMarkerViewSet, MarkerTileView
 
 router = DefaultRouter()
 router.register(r'markers', TimeMarkerViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('tiles/<int:z>/<int:x>/<int:y>/', MarkerTileView.as_view(), name='marker-tile'),
 ]
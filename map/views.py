@@ -1,11 +1,141 @@
-from rest_framework import viewsets, permissions
-from .models import TimeMarker
+from math import isqrt
+from rest_framework import viewsets, permissions, serializers, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from django.db.models import F, Min, Value
+from django.db.models.functions import Floor, Least
+from .models import TimeMarker, MarkerGridCell
 from .serializers import TimeMarkerSerializer
+from .tiles import CELL_SUBDIVISION, CLUSTER_MAX_ZOOM, is_valid_tile, tile_bounds
+
+
+def parse_bbox(value):
+    """bbox=west,south,east,north (경도/위도) 파싱"""
+    try:
+        west, south, east, north = (float(v) for v in value.split(','))
+    except ValueError:
+        raise serializers.ValidationError({"bbox": "bbox는 west,south,east,north 형식이어야 합니다."})
+    if not (-180 <= west < east <= 180 and -90 <= south < north <= 90):
+        raise serializers.ValidationError({"bbox": "bbox 범위가 올바르지 않습니다."})
+    return west, south, east, north
+
+
+def sample_markers(queryset, bbox, limit):
+    """
+    bbox를 격자로 나눠 격자 칸마다 마커 하나(가장 먼저 등록된 것)만 선택
+    결과 수가 limit을 넘지 않고, 화면 전체에 고르게 분포합니다.
+    """
+    west, south, east, north = bbox
+    side = max(isqrt(limit), 1)
+
+    def cell_index(field, origin, extent):
+        # 동쪽/북쪽 경계 위의 마커는 마지막 칸으로 (side x side 격자 유지), 폭이 0인 bbox는 한 칸
+        if extent <= 0:
+            return Value(0)
+        return Least(Floor((F(field) - origin) / (extent / side)), Value(float(side - 1)))
+
+    sampled_ids = (
+        queryset.order_by()
+        .annotate(
+            cell_x=cell_index('longitude', west, east - west),
+            cell_y=cell_index('latitude', south, north - south),
+        )
+        .values('cell_x', 'cell_y')
+        .annotate(sample_id=Min('id'))
+        .values_list('sample_id', flat=True)
+    )
+    return queryset.filter(id__in=list(sampled_ids))
+
 
 class TimeMarkerViewSet(viewsets.ModelViewSet):
     queryset = TimeMarker.objects.all()
     serializer_class = TimeMarkerSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    # bbox 조회 시 최대 반환 수 (초과하면 격자 샘플링)
+    MAX_BBOX_MARKERS = 500
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        bbox = self.request.query_params.get('bbox')
+        if self.action == 'list' and bbox:
+            west, south, east, north = parse_bbox(bbox)
+            # 활성 마커 부분 인덱스 (latitude, longitude) WHERE is_active 사용 (map_marker_active_lat_lng)
+            queryset = queryset.filter(
+                is_active=True,
+                latitude__gte=south, latitude__lte=north,
+                longitude__gte=west, longitude__lte=east,
+            )
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        bbox = request.query_params.get('bbox')
+        if not bbox:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.get_queryset()
+        total = queryset.count()
+        sampled = total > self.MAX_BBOX_MARKERS
+        if sampled:
+            queryset = sample_markers(queryset, parse_bbox(bbox), self.MAX_BBOX_MARKERS)
+
+        serializer = self.get_serializer(queryset, many=True)
+        response = Response(serializer.data)
+        response['X-Markers-Total'] = str(total)
+        response['X-Markers-Sampled'] = 'true' if sampled else 'false'
+        return response
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
+
+
+class MarkerTileView(APIView):
+    """
+    지도 타일(z/x/y) 단위 마커 조회
+    - z <= CLUSTER_MAX_ZOOM: 미리 집계된 격자(타일당 최대 8x8)의 클러스터
+    - z > CLUSTER_MAX_ZOOM: 타일 안의 활성 마커 (최대 MAX_TILE_MARKERS개)
+    """
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    MAX_TILE_MARKERS = 200
+
+    def get(self, request, z, x, y):
+        if not is_valid_tile(z, x, y):
+            return Response({"error": "잘못된 타일 좌표입니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if z <= CLUSTER_MAX_ZOOM:
+            return Response({'z': z, 'x': x, 'y': y, 'mode': 'cluster', 'clusters': self.get_clusters(z, x, y)})
+
+        markers, truncated = self.get_markers(z, x, y)
+        return Response({
+            'z': z, 'x': x, 'y': y, 'mode': 'markers',
+            'markers': TimeMarkerSerializer(markers, many=True, context={'request': request}).data,
+            'truncated': truncated,
+        })
+
+    def get_clusters(self, z, x, y):
+        scale = 2 ** CELL_SUBDIVISION
+        cells = MarkerGridCell.objects.filter(
+            level=z + CELL_SUBDIVISION,
+            cell_x__gte=x * scale, cell_x__lt=(x + 1) * scale,
+            cell_y__gte=y * scale, cell_y__lt=(y + 1) * scale,
+            marker_count__gt=0,
+        )
+        return [
+            {
+                'latitude': cell.latitude_sum / cell.marker_count,
+                'longitude': cell.longitude_sum / cell.marker_count,
+                'count': cell.marker_count,
+                'help_request_count': cell.help_request_count,
+            }
+            for cell in cells
+        ]
+
+    def get_markers(self, z, x, y):
+        south, west, north, east = tile_bounds(z, x, y)
+        markers = list(
+            TimeMarker.objects.filter(
+                is_active=True,
+                latitude__gte=south, latitude__lt=north,
+                longitude__gte=west, longitude__lt=east,
+            ).order_by('-created_at')[:self.MAX_TILE_MARKERS + 1]
+        )
+        return markers[:self.MAX_TILE_MARKERS], len(markers) > self.MAX_TILE_MARKERS
@@ -0,0 +1,128 @@
+"""
+공개 게시글 피드(게시판/근처 목록) 응답 캐시
+
+- Django 캐시 프레임워크 사용 (settings.POST_FEED_CACHE['ALIAS']로 백엔드 선택, 기본은 로컬 메모리)
+- 캐시 키: 피드 종류 + 정규화된 조회 조건(위치 격자, type, 커서) + 세대(generation) 번호
+- 게시글 생성/수정/삭제 시그널(posts.signals)에서 세대 번호를 올려 기존 키를 한 번에 무효화합니다.
+- 적중/미적중 횟수는 프로세스 단위로 집계되어 get_feed_cache_stats()로 조회할 수 있습니다.
+
+작성자 정보(닉네임/평점)와 time_ago는 TIMEOUT 동안 이전 값이 보일 수 있습니다.
+bulk_create/QuerySet.update는 시그널을 보내지 않으므로 필요하면 invalidate_feeds()를 직접 호출하세요.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+DEFAULT_POST_FEED_CACHE = {
+    'ALIAS': 'default',    # 사용할 CACHES 별칭 (여러 워커가 공유하려면 Redis/Memcached 등으로 지정)
+    'TIMEOUT': 30,         # 응답 캐시 유지 시간(초)
+    'CELL_SIZE': 0.005,    # 위치 격자 크기(도, 약 500m) - 같은 격자의 요청은 격자 중심 기준으로 응답
+}
+
+GENERATION_KEY = 'posts:feed:generation'
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def get_config():
+    """settings.POST_FEED_CACHE 값을 기본값과 병합하여 반환"""
+    config = dict(DEFAULT_POST_FEED_CACHE)
+    config.update(getattr(settings, 'POST_FEED_CACHE', {}))
+    return config
+
+
+def get_cache():
+    return caches[get_config()['ALIAS']]
+
+
+def get_generation():
+    """현재 세대 번호 (없으면 현재 시각 기반으로 새로 시작해 이전 세대와 겹치지 않게 함)"""
+    cache = get_cache()
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        generation = int(time.time() * 1000)
+        cache.add(GENERATION_KEY, generation, timeout=None)
+        generation = cache.get(GENERATION_KEY, generation)
+    return generation
+
+
+def _bump_generation():
+    try:
+        get_cache().incr(GENERATION_KEY)
+    except ValueError:
+        # 키가 만료/삭제된 경우 새 세대로 시작
+        get_generation()
+
+
+def invalidate_feeds():
+    """
+    모든 피드 캐시 무효화
+    트랜잭션 커밋 전 다른 요청이 이전 데이터를 새 세대로 캐시할 수 있으므로 커밋 후에 한 번 더 무효화합니다.
+    """
+    _bump_generation()
+    transaction.on_commit(_bump_generation)
+
+
+def snap_to_cell(lat, lng):
+    """좌표를 격자 중심 좌표로 변환"""
+    cell_size = get_config()['CELL_SIZE']
+    return (
+        round((int(lat // cell_size) + 0.5) * cell_size, 6),
+        round((int(lng // cell_size) + 0.5) * cell_size, 6),
+    )
+
+
+def feed_cache_key(feed, request, params):
+    """피드 종류, 요청 호스트(프로필 이미지 절대 URL), 정규화된 조회 조건으로 캐시 키 생성"""
+    host = f"{request.scheme}://{request.get_host()}" if request else ''
+    normalized = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.sha1(f"{host}|{normalized}".encode()).hexdigest()
+    return f"posts:feed:{get_generation()}:{feed}:{digest}"
+
+
+def get_or_build(feed, request, params, build):
+    """
+    캐시된 응답 데이터를 반환하고, 없으면 build()로 만들어 저장
+    Returns: (data, hit)
+    """
+    cache = get_cache()
+    key = feed_cache_key(feed, request, params)
+    data = cache.get(key)
+    if data is not None:
+        _record('hits')
+        return data, True
+
+    _record('misses')
+    data = build()
+    cache.set(key, data, get_config()['TIMEOUT'])
+    return data, False
+
+
+def _record(outcome):
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def get_feed_cache_stats():
+    """피드 캐시 적중 지표 {'hits', 'misses', 'hit_rate'}"""
+    with _stats_lock:
+        hits, misses = _stats['hits'], _stats['misses']
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else 0.0,
+    }
+
+
+def reset_feed_cache_stats():
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,13 @@
+from django.db import migrations
+
+from TimeMarket_BackEnd.fulltext import create_index_operation
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("posts", "0002_initial"),
+    ]
+
+    operations = [
+        create_index_operation("posts_timepost", "posts_timepost_fts", ["title", "description"]),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+from django.db.models import F
+
+from TimeMarket_BackEnd.fulltext import restore_triggers_operation
+
+
+def backfill_updated_at(apps, schema_editor):
+    TimePost = apps.get_model("posts", "TimePost")
+    TimePost.objects.update(updated_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0003_timepost_fulltext"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="timepost",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        # SQLite는 AddField 시 테이블을 재생성하므로 전문 검색 트리거를 다시 만듭니다.
+        restore_triggers_operation(
+            "posts_timepost", "posts_timepost_fts", ["title", "description"]
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
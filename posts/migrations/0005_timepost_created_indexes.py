@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-19 12:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0004_timepost_updated_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="timepost",
+            index=models.Index(fields=["-created_at"], name="posts_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="timepost",
+            index=models.Index(
+                fields=["type", "-created_at"], name="posts_type_created_idx"
+            ),
+        ),
+    ]
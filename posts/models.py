@@ -14,8 +14,15 @@ class TimePost(models.Model):
     latitude = models.FloatField(null=True, blank=True)
     longitude = models.FloatField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     price = models.IntegerField(default=0)  # 가격 필드 추가 (필요에 따라 옵션 조정)
 
+    class Meta:
+        indexes = [
+            # 게시판 최신순 목록 / 타입별 최신순 목록
+            models.Index(fields=['-created_at'], name='posts_created_idx'),
+            models.Index(fields=['type', '-created_at'], name='posts_type_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.get_type_display()})"
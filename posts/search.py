@@ -0,0 +1,106 @@
+"""
+TimePost 전문 검색 + 패싯 필터
+
+- 제목/설명 전문 검색 (TimeMarket_BackEnd.fulltext)
+- 필터: type, 가격 범위, 반경(km)
+- 정렬: 검색어가 있으면 관련도 순(같으면 id 역순), 없으면 최신순(같은 시각이면 id 역순)
+- 커서: 마지막 게시글의 (관련도, id) 또는 (created_at, id)를 담은 불투명(opaque) 문자열
+- keyset 조건으로 다음 페이지를 조회하므로 페이지 깊이와 관계없이 앞선 행을 건너뛰는 비용이 없습니다.
+"""
+import base64
+import json
+from math import cos, radians
+
+from django.db.models import Count, F
+from django.utils.dateparse import parse_datetime
+
+from TimeMarket_BackEnd.fulltext import FullTextIndex
+from .models import TimePost
+
+time_post_index = FullTextIndex(TimePost, ['title', 'description'], 'posts_timepost_fts')
+
+KM_PER_DEGREE = 111.32
+
+
+def encode_cursor(post, ranked):
+    """ranked: 관련도 순 결과면 (search_rank, id), 아니면 (created_at, id)"""
+    if ranked:
+        position = {'r': getattr(post, 'search_rank', None), 'i': post.id}
+    else:
+        position = {'t': post.created_at.isoformat(), 'i': post.id}
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_cursor(cursor, ranked):
+    """커서의 (search_rank, id) 또는 (created_at, id) - 잘못된 커서는 ValueError"""
+    if not cursor:
+        return None
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        post_id = int(position['i'])
+        if ranked:
+            rank = position['r']
+            key = None if rank is None else float(rank)
+        else:
+            key = parse_datetime(position['t'])
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+    if not ranked and key is None:
+        raise ValueError("잘못된 커서입니다.")
+    return key, post_id
+
+
+def filter_by_radius(queryset, lat, lng, radius_km):
+    """
+    반경 필터 - 바운딩 박스로 먼저 좁힌 뒤 등장방형(equirectangular) 근사 거리로 거름
+    삼각함수를 DB에서 쓰지 않아 SQLite/PostgreSQL 모두 같은 식으로 동작합니다.
+    """
+    cos_lat = max(cos(radians(lat)), 1e-6)
+    dlat = radius_km / KM_PER_DEGREE
+    dlng = dlat / cos_lat
+
+    dy = F('latitude') - lat
+    dx = (F('longitude') - lng) * cos_lat
+    return queryset.filter(
+        latitude__range=(lat - dlat, lat + dlat),
+        longitude__range=(lng - dlng, lng + dlng),
+    ).alias(distance_sq=dy * dy + dx * dx).filter(distance_sq__lte=dlat * dlat)
+
+
+def apply_filters(queryset, min_price=None, max_price=None, lat=None, lng=None, radius_km=None):
+    if min_price is not None:
+        queryset = queryset.filter(price__gte=min_price)
+    if max_price is not None:
+        queryset = queryset.filter(price__lte=max_price)
+    if radius_km is not None and lat is not None and lng is not None:
+        queryset = filter_by_radius(queryset, lat, lng, radius_km)
+    return queryset
+
+
+def search_posts(query='', post_type=None, cursor=None, limit=20, **filters):
+    """
+    검색 실행
+    Returns: (게시글 목록, 다음 커서 또는 None, 패싯)
+    패싯의 type별 개수는 type 필터를 제외한 나머지 조건으로 계산합니다.
+    """
+    ranked = bool(query)
+    position = decode_cursor(cursor, ranked)
+    base = apply_filters(TimePost.objects.select_related('user'), **filters)
+    scope = base.filter(type=post_type) if post_type else base
+
+    if ranked:
+        posts = time_post_index.search(scope, query, limit + 1, after=position)
+        matched = time_post_index.filter(base, query)
+    else:
+        if position:
+            # (created_at, id) < 커서: created_at <= t 범위 스캔 후 같은 시각의 이미 본 행 제외
+            created_at, post_id = position
+            scope = scope.filter(created_at__lte=created_at).exclude(created_at=created_at, id__gte=post_id)
+        posts = list(scope.order_by('-created_at', '-id')[:limit + 1])
+        matched = base
+
+    has_more = len(posts) > limit
+    posts = posts[:limit]
+    type_counts = dict(matched.order_by().values_list('type').annotate(count=Count('id')))
+    facets = {'type': {value: type_counts.get(value, 0) for value, _ in TimePost.POST_TYPE_CHOICES}}
+    return posts, encode_cursor(posts[-1], ranked) if has_more else None, facets
@@ -1,14 +1,84 @@
 from rest_framework import serializers
 from .models import TimePost
-from users.serializers import UserSerializer
+from users.serializers import UserSerializer, serialize_users_bulk
 from django.utils import timezone
 from datetime import datetime
+from functools import lru_cache
 import math
 
 
+TYPE_DISPLAY = dict(TimePost.POST_TYPE_CHOICES)
+STATUS_COLORS = {
+    'sale': '#4CAF50',  # 초록색 (시간 판매)
+    'request': '#2196F3'  # 파란색 (구인)
+}
+DEFAULT_STATUS_COLOR = '#757575'
+
+
+def get_request_origin(request):
+    """요청 쿼리의 lat/lng를 (float, float)로 반환, 없거나 잘못되면 None"""
+    if not request:
+        return None
+    query_params = getattr(request, 'query_params', None)
+    if query_params is None:
+        return None
+    user_lat = query_params.get('lat')
+    user_lng = query_params.get('lng')
+    if not (user_lat and user_lng):
+        return None
+    try:
+        return float(user_lat), float(user_lng)
+    except (TypeError, ValueError):
+        return None
+
+
+def format_distance(origin, latitude, longitude):
+    """origin으로부터의 거리 (Haversine, km 단위) 표시 문자열"""
+    if not (origin and latitude and longitude):
+        return None
+    lat1, lon1, lat2, lon2 = map(math.radians, [origin[0], origin[1], latitude, longitude])
+    dlon = lon2 - lon1
+    dlat = lat2 - lat1
+    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
+    c = 2 * math.asin(math.sqrt(a))
+    distance = 6371 * c  # 지구 반지름 (km)
+
+    if distance < 1:
+        return f"{int(distance * 1000)}m"
+    else:
+        return f"{distance:.1f}km"
+
+
+def format_time_ago(diff):
+    """경과 시간(timedelta)을 상대적 시간으로 표시"""
+    if diff.days > 0:
+        return f"{diff.days}일 전"
+    elif diff.seconds > 3600:
+        hours = diff.seconds // 3600
+        return f"{hours}시간 전"
+    elif diff.seconds > 60:
+        minutes = diff.seconds // 60
+        return f"{minutes}분 전"
+    else:
+        return "방금 전"
+
+
+@lru_cache(maxsize=1024)
+def format_price(price):
+    """가격을 포맷팅하여 표시"""
+    if price == 0:
+        return "무료"
+    elif price >= 10000:
+        return f"{price // 10000}만원"
+    elif price >= 1000:
+        return f"{price // 1000}천원"
+    else:
+        return f"{price:,}원"
+
+
 class TimePostSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
-    
+
     # UI 친화적인 추가 필드들
     distance = serializers.SerializerMethodField()
     time_ago = serializers.SerializerMethodField()
@@ -16,82 +86,35 @@ class TimePostSerializer(serializers.ModelSerializer):
     type_display = serializers.SerializerMethodField()
     status_color = serializers.SerializerMethodField()
     is_urgent = serializers.SerializerMethodField()
-    
+
     class Meta:
         model = TimePost
         fields = '__all__'
         read_only_fields = ['id', 'created_at', 'user']
-    
+
     def get_distance(self, obj):
         """사용자 위치로부터의 거리 계산 (km 단위)"""
-        request = self.context.get('request')
-        if not request:
-            return None
-            
-        user_lat = request.query_params.get('lat')
-        user_lng = request.query_params.get('lng')
-        
-        if not (user_lat and user_lng and obj.latitude and obj.longitude):
-            return None
-            
         try:
-            user_lat = float(user_lat)
-            user_lng = float(user_lng)
-            
-            # Haversine 공식으로 거리 계산
-            lat1, lon1, lat2, lon2 = map(math.radians, [user_lat, user_lng, obj.latitude, obj.longitude])
-            dlon = lon2 - lon1
-            dlat = lat2 - lat1
-            a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-            c = 2 * math.asin(math.sqrt(a))
-            distance = 6371 * c  # 지구 반지름 (km)
-            
-            if distance < 1:
-                return f"{int(distance * 1000)}m"
-            else:
-                return f"{distance:.1f}km"
+            return format_distance(get_request_origin(self.context.get('request')), obj.latitude, obj.longitude)
         except:
             return None
-    
+
     def get_time_ago(self, obj):
         """게시물 작성 시간을 상대적 시간으로 표시"""
-        now = timezone.now()
-        diff = now - obj.created_at
-        
-        if diff.days > 0:
-            return f"{diff.days}일 전"
-        elif diff.seconds > 3600:
-            hours = diff.seconds // 3600
-            return f"{hours}시간 전"
-        elif diff.seconds > 60:
-            minutes = diff.seconds // 60
-            return f"{minutes}분 전"
-        else:
-            return "방금 전"
-    
+        return format_time_ago(timezone.now() - obj.created_at)
+
     def get_formatted_price(self, obj):
         """가격을 포맷팅하여 표시"""
-        if obj.price == 0:
-            return "무료"
-        elif obj.price >= 10000:
-            return f"{obj.price // 10000}만원"
-        elif obj.price >= 1000:
-            return f"{obj.price // 1000}천원"
-        else:
-            return f"{obj.price:,}원"
-    
+        return format_price(obj.price)
+
     def get_type_display(self, obj):
         """게시물 타입을 한글로 표시"""
         return obj.get_type_display()
-    
+
     def get_status_color(self, obj):
         """게시물 타입에 따른 상태 색상"""
-        colors = {
-            'sale': '#4CAF50',  # 초록색 (시간 판매)
-            'request': '#2196F3'  # 파란색 (구인)
-        }
-        return colors.get(obj.type, '#757575')
-    
+        return STATUS_COLORS.get(obj.type, DEFAULT_STATUS_COLOR)
+
     def get_is_urgent(self, obj):
         """긴급 게시물 여부 (1시간 이내 작성된 게시물)"""
         now = timezone.now()
@@ -99,12 +122,55 @@ class TimePostSerializer(serializers.ModelSerializer):
         return diff.total_seconds() < 3600  # 1시간 = 3600초
 
 
+def serialize_time_posts(posts, request=None, origin=None):
+    """
+    목록용 고속 직렬화 - TimePostSerializer(many=True).data와 같은 결과
+    - 요청 단위 상수(현재 시각, 요청 위치)는 한 번만 계산
+    - 작성자 정보/평점은 serialize_users_bulk로 한 번에 조회
+    - origin(lat, lng)을 주면 요청 쿼리의 lat/lng 대신 거리 계산 기준으로 사용
+    게시글의 user는 select_related('user')로 미리 가져와 두세요.
+    """
+    posts = list(posts)
+    now = timezone.now()
+    if origin is None:
+        origin = get_request_origin(request)
+    users = serialize_users_bulk([post.user for post in posts], request)
+    datetime_to_representation = serializers.DateTimeField().to_representation
+
+    data = []
+    for post in posts:
+        age = now - post.created_at
+        try:
+            distance = format_distance(origin, post.latitude, post.longitude)
+        except Exception:
+            distance = None
+        data.append({
+            'id': post.id,
+            'user': users.get(post.user_id),
+            'distance': distance,
+            'time_ago': format_time_ago(age),
+            'formatted_price': format_price(post.price),
+            'type_display': TYPE_DISPLAY.get(post.type, post.type),
+            'status_color': STATUS_COLORS.get(post.type, DEFAULT_STATUS_COLOR),
+            'is_urgent': age.total_seconds() < 3600,
+            'title': post.title,
+            'description': post.description,
+            'type': post.type,
+            'latitude': post.latitude,
+            'longitude': post.longitude,
+            'created_at': datetime_to_representation(post.created_at),
+            'updated_at': datetime_to_representation(post.updated_at),
+            'price': post.price,
+        })
+    return data
+
+
 class TimePostCreateSerializer(serializers.ModelSerializer):
     """게시물 생성용 시리얼라이저 (간소화된 필드)"""
     class Meta:
         model = TimePost
         fields = ['title', 'description', 'type', 'latitude', 'longitude', 'price']
-        
+
     def validate_price(self, value):
         """가격 유효성 검사"""
         if value < 0:
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_feeds
+from .models import TimePost
+
+
+@receiver(post_save, sender=TimePost)
+@receiver(post_delete, sender=TimePost)
+def invalidate_post_feeds(sender, **kwargs):
+    """✅ 게시글 생성/수정/삭제 시 피드 캐시 무효화"""
+    invalidate_feeds()
@@ -0,0 +1,40 @@
+from datetime import timedelta
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from posts.models import TimePost
+
+User = get_user_model()
+
+
+class TimePostDetailConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(nickname='etag', email='etag@test.com', password='testpass')
+        self.client = APIClient()
+        self.post = TimePost.objects.create(user=self.user, title='청소', description='원룸 청소', type='sale', price=1000)
+        self.url = reverse('timepost-detail', args=[self.post.id])
+
+    def test_not_modified_until_post_changes(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        self.client.force_authenticate(user=self.user)
+        self.client.patch(self.url, {'title': '청소 (수정)'}, format='json')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['title'] == '청소 (수정)'
+        assert response['ETag'] != etag
+
+    def test_relative_time_change_produces_new_etag(self):
+        """time_ago 표시가 바뀌면 본문이 달라지므로 ETag도 바뀜"""
+        etag = self.client.get(self.url)['ETag']
+        TimePost.objects.filter(pk=self.post.pk).update(created_at=self.post.created_at - timedelta(hours=2))
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['time_ago'] == '2시간 전'
+
+    def test_missing_post_is_404(self):
+        response = self.client.get(reverse('timepost-detail', args=[self.post.id + 100]))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
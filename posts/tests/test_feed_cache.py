@@ -0,0 +1,67 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from django.contrib.auth import get_user_model
+from posts.models import TimePost
+from posts.cache import get_cache, get_feed_cache_stats, reset_feed_cache_stats
+
+User = get_user_model()
+
+
+class PostFeedCacheTests(APITestCase):
+    def setUp(self):
+        get_cache().clear()
+        reset_feed_cache_stats()
+        self.user = User.objects.create_user(nickname='feeder', email='feeder@test.com', password='testpass')
+        self.client = APIClient()
+        self.post = TimePost.objects.create(
+            user=self.user, title='청소 도와드립니다', description='원룸 청소',
+            type='sale', price=10000, latitude=37.5665, longitude=126.9780,
+        )
+        self.board_url = reverse('timepost-board')
+        self.nearby_url = reverse('timepost-nearby-list')
+
+    def test_board_is_served_from_cache(self):
+        first = self.client.get(self.board_url)
+        self.assertEqual(first['X-Cache'], 'MISS')
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(self.board_url)
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(get_feed_cache_stats(), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+
+    def test_post_changes_invalidate_feeds(self):
+        self.client.get(self.board_url)
+
+        other = TimePost.objects.create(
+            user=self.user, title='새 글', description='설명', type='request', price=0,
+        )
+        response = self.client.get(self.board_url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertIn(other.id, [post['id'] for post in response.data])
+
+        self.post.title = '제목 수정'
+        self.post.save()
+        response = self.client.get(self.board_url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertIn('제목 수정', [post['title'] for post in response.data])
+
+        other.delete()
+        response = self.client.get(self.board_url)
+        self.assertNotIn(other.id, [post['id'] for post in response.data])
+
+    def test_nearby_key_uses_grid_cell_and_type(self):
+        self.assertEqual(self.client.get(self.nearby_url, {'lat': '37.5661', 'lng': '126.9771'})['X-Cache'], 'MISS')
+        # 같은 격자 안의 다른 좌표는 캐시 공유
+        self.assertEqual(self.client.get(self.nearby_url, {'lat': '37.5662', 'lng': '126.9772'})['X-Cache'], 'HIT')
+        self.assertEqual(
+            self.client.get(self.nearby_url, {'lat': '37.5662', 'lng': '126.9772', 'type': 'sale'})['X-Cache'], 'MISS'
+        )
+        self.assertEqual(self.client.get(self.nearby_url, {'lat': '35.1587', 'lng': '129.1604'})['X-Cache'], 'MISS')
+
+        response = self.client.get(self.nearby_url, {'lat': '37.5662', 'lng': '126.9772'})
+        self.assertEqual([post['id'] for post in response.data], [self.post.id])
+        self.assertTrue(response.data[0]['distance'].endswith('m'))
@@ -0,0 +1,103 @@
+from django.urls import reverse
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from posts.models import TimePost
+
+User = get_user_model()
+
+
+class TimePostSearchTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(nickname='searcher', email="searcher@test.com", password='testpass')
+        self.client = APIClient()
+        self.url = reverse('timepost-search')
+
+        # 서울 시청 근처 / 부산
+        self.near_sale = TimePost.objects.create(
+            user=self.user, title="이사 도와드립니다", description="짐 옮기기 1시간",
+            type="sale", price=10000, latitude=37.5665, longitude=126.9780,
+        )
+        self.near_request = TimePost.objects.create(
+            user=self.user, title="이사 도우미 구합니다", description="주말 이사",
+            type="request", price=30000, latitude=37.5700, longitude=126.9820,
+        )
+        self.far_sale = TimePost.objects.create(
+            user=self.user, title="부산 이사 지원", description="해운대 근처",
+            type="sale", price=5000, latitude=35.1587, longitude=129.1604,
+        )
+        TimePost.objects.create(
+            user=self.user, title="영어 과외", description="회화 위주",
+            type="sale", price=20000, latitude=37.5665, longitude=126.9780,
+        )
+
+    def ids(self, response):
+        return {post['id'] for post in response.data['results']}
+
+    def test_text_search_with_type_facets(self):
+        response = self.client.get(self.url, {'q': '이사'})
+        assert response.status_code == status.HTTP_200_OK
+        assert self.ids(response) == {self.near_sale.id, self.near_request.id, self.far_sale.id}
+        assert response.data['facets']['type'] == {'sale': 2, 'request': 1}
+
+        response = self.client.get(self.url, {'q': '이사', 'type': 'sale'})
+        assert self.ids(response) == {self.near_sale.id, self.far_sale.id}
+        # 패싯은 type 필터와 무관하게 계산
+        assert response.data['facets']['type'] == {'sale': 2, 'request': 1}
+
+    def test_price_and_radius_filters(self):
+        response = self.client.get(self.url, {'q': '이사', 'min_price': 6000, 'max_price': 20000})
+        assert self.ids(response) == {self.near_sale.id}
+
+        response = self.client.get(self.url, {'q': '이사', 'lat': 37.5665, 'lng': 126.9780, 'radius': 5})
+        assert self.ids(response) == {self.near_sale.id, self.near_request.id}
+        assert all(post['distance'] for post in response.data['results'])
+
+    def test_cursor_pagination(self):
+        first = self.client.get(self.url, {'q': '이사', 'limit': 2})
+        assert len(first.data['results']) == 2
+        assert first.data['next_cursor']
+
+        second = self.client.get(self.url, {'q': '이사', 'limit': 2, 'cursor': first.data['next_cursor']})
+        assert len(second.data['results']) == 1
+        assert second.data['next_cursor'] is None
+        assert not self.ids(first) & self.ids(second)
+
+    def collect_pages(self, params):
+        ids, cursor = [], None
+        while True:
+            response = self.client.get(self.url, {**params, 'limit': 1, **({'cursor': cursor} if cursor else {})})
+            ids += [post['id'] for post in response.data['results']]
+            cursor = response.data['next_cursor']
+            if not cursor:
+                return ids
+
+    def test_cursor_walks_ranked_results_once(self):
+        """관련도가 같은 게시글이 있어도 (관련도, id) 커서로 누락/중복 없이 순회"""
+        ids = self.collect_pages({'q': '이사'})
+        assert sorted(ids) == sorted([self.near_sale.id, self.near_request.id, self.far_sale.id])
+
+    def test_cursor_is_keyset_not_offset(self):
+        """첫 페이지 이후 새 게시글이 생겨도 다음 페이지가 밀리지 않음"""
+        first = self.client.get(self.url, {'type': 'sale', 'limit': 2})
+        TimePost.objects.create(user=self.user, title="새 게시글", description="설명", type="sale", price=1000)
+        second = self.client.get(self.url, {'type': 'sale', 'limit': 2, 'cursor': first.data['next_cursor']})
+        assert [post['id'] for post in second.data['results']] == [self.near_sale.id]
+        assert second.data['next_cursor'] is None
+
+    def test_index_follows_update_and_delete(self):
+        self.near_sale.title = "청소 도와드립니다"
+        self.near_sale.description = "원룸 청소"
+        self.near_sale.save()
+        assert self.near_sale.id not in self.ids(self.client.get(self.url, {'q': '이사'}))
+        assert self.ids(self.client.get(self.url, {'q': '청소'})) == {self.near_sale.id}
+
+        self.near_sale.delete()
+        assert self.ids(self.client.get(self.url, {'q': '청소'})) == set()
+
+    def test_filters_without_query_and_bad_input(self):
+        response = self.client.get(self.url, {'type': 'request'})
+        assert self.ids(response) == {self.near_request.id}
+
+        assert self.client.get(self.url, {'cursor': 'invalid'}).status_code == status.HTTP_400_BAD_REQUEST
+        assert self.client.get(self.url, {'type': 'unknown'}).status_code == status.HTTP_400_BAD_REQUEST
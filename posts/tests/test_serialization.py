@@ -0,0 +1,73 @@
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase, APIRequestFactory
+from rest_framework.request import Request
+from django.contrib.auth import get_user_model
+from posts.models import TimePost
+from posts.serializers import TimePostSerializer, serialize_time_posts
+from review.models import Review
+from chat.models import Room, TradeRequest
+
+User = get_user_model()
+
+
+class TimePostFastSerializationTests(APITestCase):
+    def setUp(self):
+        self.seller = User.objects.create_user(nickname='seller', email='seller@test.com', password='testpass')
+        self.buyer = User.objects.create_user(nickname='buyer', email='buyer@test.com', password='testpass')
+        self.seller.profile_image = 'profile_images/seller.png'
+        self.seller.save()
+
+        now = timezone.now()
+        self.posts = [
+            TimePost.objects.create(user=self.seller, title='가까운 판매', description='설명', type='sale',
+                                    price=15000, latitude=37.5665, longitude=126.9780),
+            TimePost.objects.create(user=self.buyer, title='먼 구인', description='설명', type='request',
+                                    price=500, latitude=35.1587, longitude=129.1604),
+            TimePost.objects.create(user=self.buyer, title='위치 없음', description='설명', type='sale', price=0),
+        ]
+        room = Room.objects.create(post=self.posts[0])
+        room.users.add(self.seller, self.buyer)
+        for rating in ('4.5', '3.0'):
+            trade = TradeRequest.objects.create(
+                room=room, post=self.posts[0], requester=self.buyer, receiver=self.seller,
+                proposed_price=15000, proposed_hours=1, status='completed'
+            )
+            Review.objects.create(trade=trade, author=self.buyer, target=self.seller, rating=rating)
+
+        TimePost.objects.filter(pk=self.posts[1].pk).update(created_at=now - timedelta(hours=5))
+        TimePost.objects.filter(pk=self.posts[2].pk).update(created_at=now - timedelta(days=2))
+
+    def make_request(self, params=None):
+        return Request(APIRequestFactory().get('/api/posts/', params or {}))
+
+    def assert_same_as_serializer(self, request):
+        posts = TimePost.objects.select_related('user').order_by('id')
+        expected = TimePostSerializer(posts, many=True, context={'request': request}).data
+        self.assertEqual(serialize_time_posts(posts, request), [dict(item) for item in expected])
+
+    def test_matches_serializer_output(self):
+        self.assert_same_as_serializer(self.make_request({'lat': '37.5700', 'lng': '126.9820'}))
+        self.assert_same_as_serializer(self.make_request())
+        self.assert_same_as_serializer(self.make_request({'lat': 'abc', 'lng': '126.9'}))
+        self.assert_same_as_serializer(None)
+
+    def test_user_ratings_loaded_in_one_query(self):
+        posts = list(TimePost.objects.select_related('user'))
+        with CaptureQueriesContext(connection) as queries:
+            data = serialize_time_posts(posts, self.make_request())
+        self.assertEqual(len(queries), 1)
+        seller = next(item['user'] for item in data if item['user']['id'] == self.seller.id)
+        self.assertEqual(seller['average_rating'], 3.75)
+        self.assertEqual(seller['rating_count'], 2)
+
+    def test_board_list_uses_fast_path(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('timepost-board'))
+        self.assertEqual(len(queries), 2)
+        self.assertIsInstance(response.data, list)
+        # 최신순 정렬 유지
+        self.assertEqual([post['id'] for post in response.data], [post.id for post in self.posts])
@@ -6,4 +6,5 @@ urlpatterns = [
     path('create/', views.TimePostCreate.as_view(), name="timepost-create"),       # POST (글 등록)
     path('<int:pk>/', views.TimePostDetail.as_view(), name="timepost-detail"),     # GET, PATCH, DELETE
     path('board/', views.BoardTimePostList.as_view(), name="timepost-board"),      # GET (게시판형)
+    path('search/', views.TimePostSearchView.as_view(), name="timepost-search"),   # GET (검색)
 ]
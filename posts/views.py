@@ -1,10 +1,16 @@
 from rest_framework import generics, permissions
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django.db.models import Q
+from django.db.models import Q, Count, Max
+from django.utils import timezone
 from rest_framework.exceptions import PermissionDenied
 from .models import TimePost
-from .serializers import TimePostSerializer
+from .serializers import TimePostSerializer, serialize_time_posts, get_request_origin, format_time_ago
+from .cache import get_or_build, snap_to_cell
+from .search import search_posts
+from TimeMarket_BackEnd.conditional import conditional_get
+from TimeMarket_BackEnd.replicas import ReplicaReadMixin
 from math import radians, cos, sin, asin, sqrt
 
 def haversine(lat1, lon1, lat2, lon2):
@@ -17,24 +23,40 @@ def haversine(lat1, lon1, lat2, lon2):
     r = 6371  # 지구 반지름 (km)
     return c * r
 
-class NearbyTimePostList(APIView):
+def cached_feed_response(feed, request, params, build):
+    """피드 응답 캐시 적용 (X-Cache: HIT/MISS 헤더 포함)"""
+    data, hit = get_or_build(feed, request, params, build)
+    response = Response(data)
+    response['X-Cache'] = 'HIT' if hit else 'MISS'
+    return response
+
+
+class NearbyTimePostList(ReplicaReadMixin, APIView):
     def get(self, request):
         lat = float(request.query_params.get('lat', 0))
         lng = float(request.query_params.get('lng', 0))
         post_type = request.query_params.get('type', None)
 
-        posts = TimePost.objects.all()
+        # 같은 격자 안의 요청은 격자 중심 기준으로 정렬/거리 계산하여 응답을 공유
+        origin = get_request_origin(request)
+        if origin:
+            lat, lng = origin = snap_to_cell(*origin)
+
+        def build():
+            posts = TimePost.objects.select_related('user')
+
+            if post_type:
+                posts = posts.filter(type=post_type)
 
-        if post_type:
-            posts = posts.filter(type=post_type)
+            posts = sorted(
+                posts,
+                key=lambda post: haversine(lat, lng, post.latitude or 0, post.longitude or 0)
+            )
 
-        posts = sorted(
-            posts,
-            key=lambda post: haversine(lat, lng, post.latitude or 0, post.longitude or 0)
-        )
+            # 목록은 고속 직렬화 경로 사용 (TimePostSerializer와 같은 응답 형식)
+            return serialize_time_posts(posts[:30], request, origin=origin)
 
-        serializer = TimePostSerializer(posts[:30], many=True, context={'request': request})  # context 추가
-        return Response(serializer.data)
+        return cached_feed_response('nearby', request, {'cell': (lat, lng), 'origin': bool(origin), 'type': post_type}, build)
 
 class TimePostCreate(generics.CreateAPIView):
     queryset = TimePost.objects.all()
@@ -44,6 +66,19 @@ class TimePostCreate(generics.CreateAPIView):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+def time_post_version(request, pk):
+    """게시글 상세 ETag 버전: 수정 시각 + 작성자 평점 변화 + 상대 시간(time_ago/is_urgent) 구간"""
+    row = TimePost.objects.filter(pk=pk).values('created_at', 'updated_at').annotate(
+        review_count=Count('user__received_reviews'),
+        last_review_id=Max('user__received_reviews__id'),
+    ).order_by('created_at').first()
+    if row is None:
+        return None
+    age = timezone.now() - row['created_at']
+    return (row['updated_at'], row['review_count'], row['last_review_id'],
+            format_time_ago(age), age.total_seconds() < 3600)
+
+@conditional_get(time_post_version)
 class TimePostDetail(generics.RetrieveUpdateDestroyAPIView):
     queryset = TimePost.objects.all()
     serializer_class = TimePostSerializer
@@ -59,6 +94,71 @@ class TimePostDetail(generics.RetrieveUpdateDestroyAPIView):
             raise PermissionDenied("삭제 권한이 없습니다.")
         instance.delete()
 
-class BoardTimePostList(generics.ListAPIView):
-    queryset = TimePost.objects.all().order_by('-created_at')
+class BoardTimePostList(ReplicaReadMixin, generics.ListAPIView):
+    queryset = TimePost.objects.select_related('user').order_by('-created_at')
     serializer_class = TimePostSerializer
+
+    def list(self, request, *args, **kwargs):
+        origin = get_request_origin(request)
+        if origin:
+            origin = snap_to_cell(*origin)
+
+        def build():
+            queryset = self.filter_queryset(self.get_queryset())
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                return self.get_paginated_response(serialize_time_posts(page, request, origin=origin)).data
+            return serialize_time_posts(queryset, request, origin=origin)
+
+        return cached_feed_response('board', request, {'cell': origin, 'page': self.get_page_params()}, build)
+
+    def get_page_params(self):
+        """페이지네이션 설정 시 페이지/커서 쿼리 값 (캐시 키용)"""
+        if self.paginator is None:
+            return {}
+        names = [
+            getattr(self.paginator, attr, None)
+            for attr in ('page_query_param', 'page_size_query_param', 'cursor_query_param',
+                         'limit_query_param', 'offset_query_param')
+        ]
+        return {name: self.request.query_params.get(name) for name in names if name}
+
+
+class TimePostSearchView(APIView):
+    """
+    게시글 검색 (제목/설명 전문 검색 + 필터)
+    쿼리: q, type, min_price, max_price, lat, lng, radius(km), cursor, limit
+    """
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+
+    def get(self, request):
+        params = request.query_params
+        post_type = params.get('type') or None
+        if post_type and post_type not in dict(TimePost.POST_TYPE_CHOICES):
+            return Response({"error": f"알 수 없는 게시글 타입: {post_type}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            filters = {
+                'min_price': int(params['min_price']) if params.get('min_price') else None,
+                'max_price': int(params['max_price']) if params.get('max_price') else None,
+                'lat': float(params['lat']) if params.get('lat') else None,
+                'lng': float(params['lng']) if params.get('lng') else None,
+                'radius_km': float(params['radius']) if params.get('radius') else None,
+            }
+            limit = max(min(int(params.get('limit', self.DEFAULT_LIMIT)), self.MAX_LIMIT), 1)
+            posts, next_cursor, facets = search_posts(
+                query=params.get('q', '').strip(),
+                post_type=post_type,
+                cursor=params.get('cursor'),
+                limit=limit,
+                **filters
+            )
+        except ValueError as e:
+            return Response({"error": f"잘못된 검색 조건입니다: {e}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            'results': serialize_time_posts(posts, request),
+            'next_cursor': next_cursor,
+            'facets': facets,
+        })
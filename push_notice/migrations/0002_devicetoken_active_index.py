@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-19 12:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("push_notice", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="devicetoken",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["user", "token", "is_active"],
+                name="push_token_user_active_idx",
+            ),
+        ),
+    ]
@@ -15,5 +15,15 @@ class DeviceToken(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # 푸시 발송 대상 토큰 조회: 활성 토큰만 담는 부분 인덱스
+            # token, is_active까지 담아 테이블을 읽지 않는 커버링 인덱스로 사용됩니다. (SQLite는 조건 컬럼도 인덱스에 있어야 함)
+            models.Index(
+                fields=['user', 'token', 'is_active'], condition=models.Q(is_active=True),
+                name='push_token_user_active_idx',
+            ),
+        ]
+
     def __str__(self):
         return f"{self.user.nickname} - {self.platform}"
@@ -12,6 +12,7 @@ except Exception:  # pragma: no cover
 
 from .models import DeviceToken
 from users.models import User
+from TimeMarket_BackEnd import metrics
 
 
 _initialized = False
@@ -42,6 +43,7 @@ def send_push_to_tokens(tokens: List[str], title: str, body: str, data: Optional
     if not tokens:
         return {"success": 0, "failure": 0, "message": "no tokens"}
     if not initialize_firebase() or messaging is None:
+        metrics.record_push_results(skipped=len(tokens))
         return {"success": 0, "failure": len(tokens), "message": "firebase not configured"}
 
     message = messaging.MulticastMessage(
@@ -49,7 +51,9 @@ def send_push_to_tokens(tokens: List[str], title: str, body: str, data: Optional
         data={k: str(v) for k, v in (data or {}).items()},
         tokens=tokens,
     )
-    response = messaging.send_multicast(message)
+    with metrics.track_push(len(tokens)):
+        response = messaging.send_multicast(message)
+    metrics.record_push_results(success=response.success_count, failure=response.failure_count)
     return {"success": response.success_count, "failure": response.failure_count}
 
 
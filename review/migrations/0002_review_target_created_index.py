@@ -0,0 +1,22 @@
+# Generated by Django 5.2.1 on 2026-10-19 12:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0007_message_and_trade_indexes"),
+        ("review", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["target", "-created_at"], name="review_target_created_idx"
+            ),
+        ),
+    ]
@@ -24,6 +24,10 @@ class Review(models.Model):
     class Meta:
         unique_together = (('trade', 'author'),)
         ordering = ['-created_at']
+        indexes = [
+            # 사용자가 받은 리뷰 목록 (최신순) / 평점 집계
+            models.Index(fields=['target', '-created_at'], name='review_target_created_idx'),
+        ]
 
     def __str__(self):
         return f"Review {self.id} - {self.author} -> {self.target} : {self.rating}"
@@ -2,11 +2,12 @@ from rest_framework import serializers
 from .models import Review
 from chat.models import TradeRequest
 from django.contrib.auth import get_user_model
+from users.serializers import UserRatingFieldsMixin
 
 User = get_user_model()
 
 
-class SimpleUserSerializer(serializers.ModelSerializer):
+class SimpleUserSerializer(UserRatingFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'nickname', 'profile_image', 'average_rating', 'rating_count']
@@ -191,3 +191,65 @@ class ReviewValidationTest(TestCase):
             print(f"  별점 {rating}: {response.status_code}")
             print(f"  응답: {response.data}")
             self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ReviewListConditionalGetTest(TestCase):
+    def setUp(self):
+        self.user1 = User.objects.create_user(email='etag1@test.com', nickname='etag1', password='testpass123')
+        self.user2 = User.objects.create_user(email='etag2@test.com', nickname='etag2', password='testpass123')
+        self.post = TimePost.objects.create(user=self.user1, title='테스트 포스트', description='테스트 내용', type='sale', price=10000)
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(self.user1, self.user2)
+        self.client = APIClient()
+
+    def create_review(self, rating):
+        trade = TradeRequest.objects.create(
+            room=self.room, post=self.post, requester=self.user1, receiver=self.user2,
+            proposed_price=10000, proposed_hours=5, status='completed'
+        )
+        return Review.objects.create(trade=trade, author=self.user1, target=self.user2, rating=Decimal(rating))
+
+    def test_review_lists_return_304_until_reviews_change(self):
+        """✅ 리뷰가 추가/삭제되기 전까지 304 응답"""
+        review = self.create_review('4.0')
+        for url in ('/api/reviews/', f'/api/reviews/user/{self.user2.id}/'):
+            etag = self.client.get(url)['ETag']
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+            new_review = self.create_review('5.0')
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.data), 2)
+
+            new_review.delete()
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+        review.delete()
+
+    def test_author_profile_change_produces_new_etag(self):
+        """✅ 목록에 포함된 작성자의 닉네임 수정 시 ETag 갱신"""
+        self.create_review('4.0')
+        for url in ('/api/reviews/', f'/api/reviews/user/{self.user2.id}/'):
+            etag = self.client.get(url)['ETag']
+            self.user1.nickname = f'{self.user1.nickname}x'
+            self.user1.save()
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data[0]['author']['nickname'], self.user1.nickname)
+
+    def test_user_review_list_ignores_unrelated_reviews(self):
+        """✅ 목록과 관계없는 사용자가 받은 리뷰는 특정 사용자 리뷰 목록의 ETag를 바꾸지 않음"""
+        self.create_review('4.0')
+        url = f'/api/reviews/user/{self.user2.id}/'
+        etag = self.client.get(url)['ETag']
+
+        outsider = User.objects.create_user(email='etag3@test.com', nickname='etag3', password='testpass123')
+        trade = TradeRequest.objects.create(
+            room=self.room, post=self.post, requester=self.user2, receiver=outsider,
+            proposed_price=10000, proposed_hours=5, status='completed'
+        )
+        Review.objects.create(trade=trade, author=self.user2, target=outsider, rating=Decimal('3.0'))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # 목록 작성자(user1)가 받은 리뷰는 작성자 평점을 바꾸므로 ETag 갱신
+        Review.objects.create(trade=trade, author=outsider, target=self.user1, rating=Decimal('2.0'))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
@@ -1,9 +1,32 @@
 from rest_framework import generics, permissions
+from django.db.models import Count, Max, Q
+from users.models import User
 from .models import Review
 from .serializers import ReviewSerializer, CreateReviewSerializer
+from TimeMarket_BackEnd.conditional import conditional_get
+from TimeMarket_BackEnd.replicas import ReplicaReadMixin
 
 
-class ReviewListView(generics.ListAPIView):
+def review_version(request, *args, **kwargs):
+    """
+    리뷰 목록 ETag 버전 (user_id가 있으면 해당 사용자가 받은 리뷰 목록 범위)
+    목록에 포함된 작성자/대상자의 평점은 그들이 받은 다른 리뷰에도 영향을 받으므로
+    목록 사용자들이 받은 리뷰 전체와 사용자 프로필 수정 시각을 함께 반영
+    """
+    reviews = Review.objects.all()
+    if 'user_id' in kwargs:
+        reviews = reviews.filter(target_id=kwargs['user_id'])
+    users = User.objects.filter(Q(id__in=reviews.values('author_id')) | Q(id__in=reviews.values('target_id')))
+    version = users.aggregate(
+        count=Count('received_reviews'),
+        last_id=Max('received_reviews__id'),
+        users_updated_at=Max('updated_at'),
+    )
+    return sorted(version.items())
+
+
+@conditional_get(review_version)
+class ReviewListView(ReplicaReadMixin, generics.ListAPIView):
     """리뷰 목록 조회"""
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
@@ -36,7 +59,8 @@ class ReviewDetailView(generics.RetrieveDestroyAPIView):
         return super().delete(request, *args, **kwargs)
 
 
-class UserReviewListView(generics.ListAPIView):
+@conditional_get(review_version)
+class UserReviewListView(ReplicaReadMixin, generics.ListAPIView):
     """특정 사용자가 받은 리뷰 목록"""
     serializer_class = ReviewSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
@@ -0,0 +1,111 @@
+"""
+요청 단위 사용자 프로필 로더 (dataloader)
+
+UserSerializer가 게시글/채팅방/메시지/거래/리뷰 안에 중첩되면 사용자마다 평점 집계
+(average_rating, rating_count) 쿼리가 따로 실행되고, 같은 사용자도 여러 번 조회됩니다.
+
+UserProfileLoader는
+- 첫 조회 시 최상위 시리얼라이저의 instance(이미 불러온 객체와 select_related/prefetch 캐시)를 훑어
+  응답에 등장할 사용자 id를 모으고,
+- 아직 불러오지 않은 사용자 FK 객체와 평점 집계를 한 번의 쿼리로 가져온 뒤,
+- 결과를 요청(request) 단위로 기억합니다.
+"""
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, QuerySet, Sum
+
+# 캐시된 관계를 따라가는 최대 깊이 (예: TradeRequest → post → user)
+MAX_COLLECT_DEPTH = 3
+
+
+def average_from_total(total, count):
+    """User.average_rating과 같은 방식으로 계산 (Decimal 평균 → 소수 둘째 자리)"""
+    if not count:
+        return 0.00
+    return float((Decimal(str(total)) / count).quantize(Decimal('0.01')))
+
+
+class UserProfileLoader:
+    """사용자 평점 집계를 모아서 한 번에 조회하고 기억하는 로더"""
+
+    def __init__(self):
+        self.ratings = {}          # {user_id: (average_rating, rating_count)}
+        self._collected_roots = set()
+
+    def get_ratings(self, user, root=None):
+        """(average_rating, rating_count) 반환, 처음 보는 사용자면 root에서 함께 등장하는 사용자까지 일괄 조회"""
+        if user.pk not in self.ratings:
+            pending = {}
+            if root is not None and id(root) not in self._collected_roots:
+                self._collected_roots.add(id(root))
+                pending = self.collect(root)
+            self.load([user.pk, *pending.keys()], pending)
+        return self.ratings[user.pk]
+
+    def collect(self, root):
+        """
+        root 객체(들)와 캐시된 관계를 훑어 사용자 id를 수집
+        Returns: {user_id: [(instance, field), ...]} - 아직 불러오지 않은 사용자 FK는 (instance, field)로 기록
+        """
+        User = get_user_model()
+        found = {}
+        seen = set()
+
+        def visit(objects, depth):
+            for obj in objects:
+                if obj is None or id(obj) in seen or not hasattr(obj, '_state'):
+                    continue
+                seen.add(id(obj))
+                if isinstance(obj, User):
+                    found.setdefault(obj.pk, [])
+                if depth >= MAX_COLLECT_DEPTH:
+                    continue
+                for field in obj._meta.concrete_fields:
+                    if field.is_relation and field.related_model is User and not field.is_cached(obj):
+                        user_id = getattr(obj, field.attname)
+                        if user_id is not None:
+                            found.setdefault(user_id, []).append((obj, field))
+                visit(obj._state.fields_cache.values(), depth + 1)
+                for related in getattr(obj, '_prefetched_objects_cache', {}).values():
+                    visit(_loaded(related), depth + 1)
+
+        visit(_loaded(root), 0)
+        return found
+
+    def load(self, user_ids, pending=None):
+        """user_ids의 평점 집계와 아직 불러오지 않은 사용자 FK 객체를 한 번의 쿼리로 조회"""
+        pending = pending or {}
+        user_ids = {user_id for user_id in user_ids if user_id not in self.ratings or pending.get(user_id)}
+        if not user_ids:
+            return
+
+        User = get_user_model()
+        users = User.objects.filter(pk__in=user_ids).annotate(
+            rating_total=Sum('received_reviews__rating'),
+            received_count=Count('received_reviews'),
+        )
+        for user in users:
+            self.ratings[user.pk] = (average_from_total(user.rating_total, user.received_count), user.received_count)
+            for instance, field in pending.get(user.pk, []):
+                field.set_cached_value(instance, user)
+        for user_id in user_ids:
+            self.ratings.setdefault(user_id, (0.00, 0))
+
+
+def _loaded(objects):
+    """이미 메모리에 있는 객체만 반환 (평가되지 않은 QuerySet은 새로 조회하지 않음)"""
+    if isinstance(objects, QuerySet):
+        return objects._result_cache or []
+    if isinstance(objects, (list, tuple)):
+        return objects
+    return [objects]
+
+
+def get_user_profile_loader(holder):
+    """holder(보통 request) 단위로 공유되는 로더 반환"""
+    loader = getattr(holder, '_user_profile_loader', None)
+    if loader is None:
+        loader = UserProfileLoader()
+        setattr(holder, '_user_profile_loader', loader)
+    return loader
@@ -0,0 +1,316 @@
+import random
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from chat.models import ChatMessage, Room, RoomReadState, TradeEvent, TradeHistoryEntry, TradeRequest
+from chat.trade_state import initial_events
+from posts.cache import invalidate_feeds
+from posts.models import TimePost
+from review.models import Review
+from wallet.models import Transaction, Wallet
+
+User = get_user_model()
+
+# 게시글 위치: 주요 도시 중심 (위도, 경도, 가중치, 분산 반경(도))
+CITIES = [
+    ('서울', 37.5665, 126.9780, 45, 0.06),
+    ('부산', 35.1796, 129.0756, 12, 0.05),
+    ('인천', 37.4563, 126.7052, 10, 0.04),
+    ('대구', 35.8714, 128.6014, 8, 0.04),
+    ('대전', 36.3504, 127.3845, 6, 0.04),
+    ('광주', 35.1595, 126.8526, 6, 0.04),
+    ('수원', 37.2636, 127.0286, 8, 0.03),
+    ('울산', 35.5384, 129.3114, 5, 0.03),
+]
+
+POST_TITLES = {
+    'sale': ['컴퓨터 수리 도와드립니다', '영어 회화 알려드려요', '반려견 산책 대행', '이사 짐 정리 도움', '사진 보정해드립니다', '기타 레슨'],
+    'request': ['과외 선생님 구해요', '가구 조립 도와주실 분', '장보기 대행 구합니다', '노트북 설정 도움 요청', '집 청소 도와주실 분', '코딩 과제 질문'],
+}
+CHAT_LINES = ['안녕하세요!', '혹시 아직 가능할까요?', '네 가능합니다', '언제 시간 되세요?', '주말 오후 괜찮아요', '좋아요, 그때 뵐게요', '감사합니다 :)']
+REVIEW_LINES = ['시간 약속을 잘 지켜주셨어요', '친절하고 꼼꼼했어요', '다음에도 거래하고 싶어요', '조금 늦었지만 괜찮았어요', None]
+
+# 거래 상태 분포 (completed는 잔액이 부족하면 rejected로 바뀜)
+TRADE_STATUS_WEIGHTS = [('completed', 55), ('pending', 20), ('rejected', 15), ('cancelled', 10)]
+
+
+@contextmanager
+def explicit_timestamps(*fields):
+    """bulk_create 동안 auto_now / auto_now_add를 꺼서 생성한 시각을 그대로 저장"""
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def field(model, name):
+    return model._meta.get_field(name)
+
+
+class Command(BaseCommand):
+    help = (
+        "부하/규모 테스트용 합성 데이터(사용자, 게시글, 채팅방, 메시지, 거래, 리뷰, 지갑 내역)를 생성합니다. "
+        "bulk_create와 미리 해시한 비밀번호를 사용하며, 같은 --seed면 같은 데이터가 만들어집니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--posts', type=int, default=5000)
+        parser.add_argument('--rooms', type=int, default=3000)
+        parser.add_argument('--messages', type=int, default=20, help='채팅방별 평균 메시지 수')
+        parser.add_argument('--trade-ratio', type=float, default=0.6, help='거래 요청이 있는 채팅방 비율')
+        parser.add_argument('--review-ratio', type=float, default=0.7, help='완료된 거래에서 참여자가 리뷰를 남길 확률')
+        parser.add_argument('--transactions', type=int, default=5, help='사용자별 평균 충전/사용 내역 수 (거래 정산 내역 제외)')
+        parser.add_argument('--days', type=int, default=90, help='데이터가 분포할 기간 (현재 시각 기준 과거 N일)')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--prefix', default='synthetic', help='생성할 사용자 닉네임/이메일 접두사')
+        parser.add_argument('--password', default='synthetic1234', help='모든 생성 사용자의 비밀번호')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--clear', action='store_true', help='같은 접두사로 생성한 기존 데이터를 먼저 삭제')
+
+    def handle(self, *args, **options):
+        if not connection.features.can_return_rows_from_bulk_insert:
+            raise CommandError("bulk_create 후 id를 돌려받을 수 없는 DB입니다. (SQLite 3.35+ 또는 PostgreSQL 필요)")
+
+        self.rng = random.Random(options['seed'])
+        self.options = options
+        self.batch_size = options['batch_size']
+        self.total_rows = 0
+        self.now = timezone.now()
+        self.start = self.now - timedelta(days=options['days'])
+        started_at = time.perf_counter()
+
+        with transaction.atomic():
+            if options['clear']:
+                deleted, _ = User.objects.filter(nickname__startswith=options['prefix']).delete()
+                self.log(f"🗑️ 기존 합성 데이터 삭제: {deleted}행")
+            elif User.objects.filter(nickname__startswith=options['prefix']).exists():
+                raise CommandError(f"'{options['prefix']}' 접두사의 사용자가 이미 있습니다. --clear 또는 다른 --prefix를 사용하세요.")
+
+            users = self.create_users()
+            posts = self.create_posts(users)
+            rooms = self.create_rooms(posts, users)
+            self.create_messages(rooms)
+            trades = self.create_trades(rooms)
+            self.create_wallets(users, trades)
+            self.create_reviews(trades)
+            invalidate_feeds()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 합성 데이터 생성 완료: {self.total_rows}행 ({time.perf_counter() - started_at:.1f}초)"
+        ))
+
+    # -------------------- 공통 --------------------
+
+    def log(self, message):
+        self.stdout.write(message)
+
+    def bulk_create(self, model, objects):
+        created = model.objects.bulk_create(objects, batch_size=self.batch_size)
+        self.total_rows += len(created)
+        self.log(f"  - {model.__name__}: {len(created)}행")
+        return created
+
+    def random_time(self, after=None):
+        """after(없으면 기간 시작) 이후 현재까지의 임의 시각"""
+        start = max(after or self.start, self.start)
+        span = (self.now - start).total_seconds()
+        return start + timedelta(seconds=self.rng.random() * span)
+
+    def random_location(self):
+        _, lat, lng, _, spread = self.rng.choices(CITIES, weights=[city[3] for city in CITIES])[0]
+        return round(self.rng.gauss(lat, spread), 6), round(self.rng.gauss(lng, spread), 6)
+
+    # -------------------- 생성 --------------------
+
+    def create_users(self):
+        prefix = self.options['prefix']
+        password = make_password(self.options['password'])  # 해시는 한 번만 계산
+        users = [
+            User(
+                nickname=f'{prefix}{i}', email=f'{prefix}{i}@synthetic.test', password=password,
+                date_joined=self.start - timedelta(days=self.rng.randint(0, 365)),
+            )
+            for i in range(self.options['users'])
+        ]
+        return self.bulk_create(User, users)
+
+    def create_posts(self, users):
+        # 일부 사용자가 글을 많이 올리도록 활동량 가중치를 둠
+        activity = [self.rng.paretovariate(1.5) for _ in users]
+        authors = self.rng.choices(users, weights=activity, k=self.options['posts'])
+        posts = []
+        for author in authors:
+            post_type = self.rng.choices(['sale', 'request'], weights=[60, 40])[0]
+            created_at = self.random_time(author.date_joined)
+            latitude, longitude = self.random_location()
+            posts.append(TimePost(
+                user=author,
+                title=self.rng.choice(POST_TITLES[post_type]),
+                description='합성 데이터로 생성된 게시글입니다.',
+                type=post_type,
+                price=self.rng.choice([0, 5000, 10000, 15000, 20000, 30000]),
+                latitude=latitude,
+                longitude=longitude,
+                created_at=created_at,
+                updated_at=created_at,
+            ))
+        with explicit_timestamps(field(TimePost, 'created_at'), field(TimePost, 'updated_at')):
+            return self.bulk_create(TimePost, posts)
+
+    def create_rooms(self, posts, users):
+        """Returns: [(room, post, 상대방)] - 상대방은 게시글 작성자가 아닌 참여자"""
+        if not posts or len(users) < 2:
+            return []
+        pairs = []
+        for post in self.rng.choices(posts, k=self.options['rooms']):
+            other = self.rng.choice(users)
+            while other.pk == post.user_id:
+                other = self.rng.choice(users)
+            pairs.append((post, other))
+
+        rooms = [Room(post=post, created_at=self.random_time(post.created_at)) for post, _ in pairs]
+        with explicit_timestamps(field(Room, 'created_at')):
+            rooms = self.bulk_create(Room, rooms)
+
+        Membership = Room.users.through
+        self.bulk_create(Membership, [
+            Membership(room_id=room.pk, user_id=user_id)
+            for room, (post, other) in zip(rooms, pairs)
+            for user_id in (post.user_id, other.pk)
+        ])
+        return [(room, post, other) for room, (post, other) in zip(rooms, pairs)]
+
+    def create_messages(self, rooms):
+        """채팅방별 메시지와 참여자별 읽음 상태 (마지막으로 읽은 위치 이후만 안 읽음)"""
+        average = self.options['messages']
+        messages, plans = [], []
+        for room, post, other in rooms:
+            count = max(0, int(self.rng.expovariate(1 / average))) if average else 0
+            times = sorted(self.random_time(room.created_at) for _ in range(count))
+            members = (post.user_id, other.pk)
+            start = len(messages)
+            for timestamp in times:
+                sender = self.rng.choice(members)
+                receiver = members[1] if sender == members[0] else members[0]
+                messages.append(ChatMessage(
+                    room=room, sender_id=sender, receiver_id=receiver,
+                    message=self.rng.choice(CHAT_LINES), timestamp=timestamp,
+                ))
+            plans.append((room, members, start, len(messages)))
+
+        with explicit_timestamps(field(ChatMessage, 'timestamp')):
+            messages = self.bulk_create(ChatMessage, messages)
+
+        read_states = []
+        for room, members, start, end in plans:
+            if start == end:
+                continue
+            for user_id in members:
+                read_upto = self.rng.randint(start, end - 1)
+                unread = sum(1 for message in messages[read_upto + 1:end] if message.receiver_id == user_id)
+                read_states.append(RoomReadState(
+                    room=room, user_id=user_id, last_read_message=messages[read_upto], unread_count=unread,
+                ))
+        self.bulk_create(RoomReadState, read_states)
+
+    def create_trades(self, rooms):
+        trades = []
+        for room, post, other in rooms:
+            if self.rng.random() >= self.options['trade_ratio']:
+                continue
+            status = self.rng.choices(
+                [status for status, _ in TRADE_STATUS_WEIGHTS], weights=[weight for _, weight in TRADE_STATUS_WEIGHTS]
+            )[0]
+            created_at = self.random_time(room.created_at)
+            trades.append(TradeRequest(
+                room=room, post=post, requester=other, receiver_id=post.user_id,
+                proposed_price=Decimal(post.price or 1000),
+                proposed_hours=Decimal(self.rng.choice(['0.5', '1', '1.5', '2', '3'])),
+                message='거래 요청합니다',
+                status=status,
+                requester_accepted=status in ('completed', 'pending'),
+                receiver_accepted=status == 'completed',
+                created_at=created_at,
+                updated_at=self.random_time(created_at),
+            ))
+        return trades  # 정산 결과(잔액 부족 → rejected)를 반영한 뒤 create_wallets에서 저장
+
+    def create_wallets(self, users, trades):
+        """충전/사용 내역과 완료된 거래의 정산 내역을 시간순으로 적용하여 잔액 계산"""
+        events = []  # (시각, 순서, 종류, 데이터)
+        for user in users:
+            events.append((user.date_joined, 0, 'deposit', (user.pk, Decimal(self.rng.randint(5, 30)), '가입 축하 시간 충전')))
+            for _ in range(int(self.rng.expovariate(1 / self.options['transactions'])) if self.options['transactions'] else 0):
+                kind = self.rng.choices(['deposit', 'withdraw'], weights=[60, 40])[0]
+                amount = Decimal(self.rng.choice(['0.5', '1', '2', '3', '5']))
+                events.append((self.random_time(user.date_joined), 1, kind, (user.pk, amount, '시간 충전' if kind == 'deposit' else '시간 사용')))
+        for trade in trades:
+            if trade.status == 'completed':
+                events.append((trade.updated_at, 2, 'trade', trade))
+        events.sort(key=lambda event: (event[0], event[1]))
+
+        balances = {user.pk: Decimal('0') for user in users}
+        history = []
+        for timestamp, _, kind, data in events:
+            if kind == 'trade':
+                trade = data
+                payer, payee = (trade.requester_id, trade.receiver_id) if trade.post.type == 'sale' else (trade.receiver_id, trade.requester_id)
+                if balances[payer] < trade.proposed_hours:
+                    trade.status, trade.receiver_accepted = 'rejected', False
+                    continue
+                balances[payer] -= trade.proposed_hours
+                balances[payee] += trade.proposed_hours
+                history.append((payer, 'withdraw', trade.proposed_hours, timestamp, '시간 지불', trade))
+                history.append((payee, 'deposit', trade.proposed_hours, timestamp, '시간 받음', trade))
+                continue
+            user_id, amount, note = data
+            if kind == 'withdraw':
+                if balances[user_id] < amount:
+                    continue
+                balances[user_id] -= amount
+            else:
+                balances[user_id] += amount
+            history.append((user_id, kind, amount, timestamp, note, None))
+
+        with explicit_timestamps(field(TradeRequest, 'created_at'), field(TradeRequest, 'updated_at')):
+            self.bulk_create(TradeRequest, trades)
+        TradeHistoryEntry.backfill(trades)
+        self.bulk_create(TradeEvent, [event for trade in trades for event in initial_events(trade)])
+        wallets = self.bulk_create(Wallet, [Wallet(user_id=user_id, balance=balance) for user_id, balance in balances.items()])
+        wallet_ids = {wallet.user_id: wallet.pk for wallet in wallets}
+        self.bulk_create(Transaction, [
+            Transaction(
+                wallet_id=wallet_ids[user_id], transaction_type=kind, amount=amount, timestamp=timestamp,
+                note=f"거래 #{trade.pk}: {note}" if trade else note,
+            )
+            for user_id, kind, amount, timestamp, note, trade in history
+        ])
+
+    def create_reviews(self, trades):
+        reviews = []
+        for trade in trades:
+            if trade.status != 'completed':
+                continue
+            for author, target in ((trade.requester_id, trade.receiver_id), (trade.receiver_id, trade.requester_id)):
+                if self.rng.random() >= self.options['review_ratio']:
+                    continue
+                reviews.append(Review(
+                    trade=trade, author_id=author, target_id=target,
+                    rating=Decimal(self.rng.choices(range(2, 11), weights=[1, 1, 2, 3, 5, 8, 12, 18, 25])[0]) / 2,
+                    content=self.rng.choice(REVIEW_LINES),
+                    created_at=self.random_time(trade.updated_at),
+                ))
+        self.bulk_create(Review, reviews)
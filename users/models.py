@@ -25,6 +25,7 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     date_joined = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)  # 닉네임/프로필 이미지 등 변경 시각 (목록 ETag 버전에 사용)
 
     objects = UserManager()
 
@@ -30,9 +30,41 @@ class SignUpSerializer(serializers.ModelSerializer):
 
 # 사용자 정보 조회 및 수정용
 from rest_framework import serializers
+from .loaders import UserProfileLoader, get_user_profile_loader
 
 
-class UserSerializer(serializers.ModelSerializer):
+def profile_image_url(user, request=None):
+    """profile_image를 전체 URL로 변환 (request가 없으면 상대 URL)"""
+    if not user.profile_image:
+        return None
+    if request:
+        # HTTP 요청이 있으면 전체 URL 생성
+        return request.build_absolute_uri(user.profile_image.url)
+    # WebSocket 등 request가 없는 경우 상대 URL 반환
+    from django.conf import settings
+    return f"{settings.MEDIA_URL}{user.profile_image}"
+
+
+class UserRatingFieldsMixin(serializers.Serializer):
+    """
+    average_rating / rating_count를 요청 단위 로더(users.loaders)로 일괄 조회
+    응답에 등장하는 사용자들의 평점 집계를 사용자마다 따로 조회하지 않고 한 번의 쿼리로 가져옵니다.
+    """
+    average_rating = serializers.SerializerMethodField()
+    rating_count = serializers.SerializerMethodField()
+
+    def get_average_rating(self, obj):
+        return self._get_ratings(obj)[0]
+
+    def get_rating_count(self, obj):
+        return self._get_ratings(obj)[1]
+
+    def _get_ratings(self, obj):
+        loader = get_user_profile_loader(self.context.get('request') or self.root)
+        return loader.get_ratings(obj, root=self.root.instance)
+
+
+class UserSerializer(UserRatingFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'nickname', 'email', 'profile_image', 'average_rating', 'rating_count']
@@ -41,20 +73,38 @@ class UserSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         """응답 시 profile_image를 전체 URL로 변환"""
         data = super().to_representation(instance)
-        if instance.profile_image:
-            request = self.context.get('request')
-            if request:
-                # HTTP 요청이 있으면 전체 URL 생성
-                data['profile_image'] = request.build_absolute_uri(instance.profile_image.url)
-            else:
-                # WebSocket 등 request가 없는 경우 상대 URL 반환
-                from django.conf import settings
-                data['profile_image'] = f"{settings.MEDIA_URL}{instance.profile_image}"
-        else:
-            data['profile_image'] = None
+        if 'profile_image' in data:  # fields= 로 제외된 경우 제외 유지
+            data['profile_image'] = profile_image_url(instance, self.context.get('request'))
         return data
 
 
+def serialize_users_bulk(users, request=None):
+    """
+    여러 사용자를 UserSerializer와 같은 형식으로 직렬화
+    평점 집계(average_rating, rating_count)를 사용자마다 조회하지 않고 한 번의 쿼리로 가져옵니다.
+    Returns: {user_id: dict}
+    """
+    users = {user.id: user for user in users if user is not None}
+    if not users:
+        return {}
+
+    loader = get_user_profile_loader(request) if request is not None else UserProfileLoader()
+    loader.load(users.keys())
+
+    result = {}
+    for user_id, user in users.items():
+        average, count = loader.ratings[user_id]
+        result[user_id] = {
+            'id': user.id,
+            'nickname': user.nickname,
+            'email': user.email,
+            'profile_image': profile_image_url(user, request),
+            'average_rating': average,
+            'rating_count': count,
+        }
+    return result
+
+
 # ▼▼▼▼▼ [추가] 비밀번호 변경 Serializer ▼▼▼▼▼
 class PasswordChangeSerializer(serializers.Serializer):
     current_password = serializers.CharField(required=True)
@@ -0,0 +1,71 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Q, Sum
+from django.test import TestCase
+
+from chat.models import ChatMessage, Room, RoomReadState, TradeRequest
+from posts.models import TimePost
+from review.models import Review
+from wallet.models import Wallet
+
+User = get_user_model()
+
+OPTIONS = {'users': 30, 'posts': 60, 'rooms': 40, 'messages': 5, 'seed': 7, 'stdout': StringIO()}
+
+
+class GenerateSyntheticDataTests(TestCase):
+    def snapshot(self):
+        return (
+            list(TimePost.objects.order_by('id').values_list('user__nickname', 'title', 'type', 'latitude', 'longitude')),
+            list(TradeRequest.objects.order_by('id').values_list('status', 'proposed_hours')),
+            list(Wallet.objects.order_by('user__nickname').values_list('user__nickname', 'balance')),
+        )
+
+    def test_generates_related_rows_with_prehashed_password(self):
+        call_command('generate_synthetic_data', **OPTIONS)
+
+        self.assertEqual(User.objects.filter(nickname__startswith='synthetic').count(), 30)
+        self.assertEqual(TimePost.objects.count(), 60)
+        self.assertEqual(Room.objects.count(), 40)
+        self.assertTrue(ChatMessage.objects.exists())
+        self.assertTrue(Review.objects.exists())
+        self.assertTrue(User.objects.get(nickname='synthetic0').check_password('synthetic1234'))
+
+        # 채팅방마다 게시글 작성자 + 상대방 두 명
+        for room in Room.objects.prefetch_related('users').select_related('post'):
+            member_ids = [user.id for user in room.users.all()]
+            self.assertEqual(len(member_ids), 2)
+            self.assertIn(room.post.user_id, member_ids)
+
+        # 안 읽은 메시지 수는 마지막으로 읽은 메시지 이후 받은 메시지 수와 같음
+        for state in RoomReadState.objects.all():
+            expected = ChatMessage.objects.filter(
+                room=state.room, receiver=state.user, id__gt=state.last_read_message_id
+            ).count()
+            self.assertEqual(state.unread_count, expected)
+
+    def test_wallet_balance_matches_history(self):
+        call_command('generate_synthetic_data', **OPTIONS)
+
+        wallets = Wallet.objects.annotate(
+            deposits=Sum('transactions__amount', filter=Q(transactions__transaction_type='deposit')),
+            withdrawals=Sum('transactions__amount', filter=Q(transactions__transaction_type='withdraw')),
+        )
+        for wallet in wallets:
+            self.assertGreaterEqual(wallet.balance, 0)
+            self.assertEqual(wallet.balance, (wallet.deposits or 0) - (wallet.withdrawals or 0))
+
+    def test_same_seed_generates_same_data(self):
+        call_command('generate_synthetic_data', **OPTIONS)
+        first = self.snapshot()
+
+        call_command('generate_synthetic_data', clear=True, **OPTIONS)
+        self.assertEqual(self.snapshot(), first)
+
+    def test_refuses_to_mix_with_existing_prefix(self):
+        call_command('generate_synthetic_data', **OPTIONS)
+        with self.assertRaises(CommandError):
+            call_command('generate_synthetic_data', **OPTIONS)
@@ -0,0 +1,66 @@
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+from chat.models import Room, TradeRequest
+from posts.models import TimePost
+from review.models import Review
+
+User = get_user_model()
+
+
+class UserProfileLoaderTests(APITestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(nickname=f'user{i}', email=f'user{i}@test.com', password='testpass')
+            for i in range(3)
+        ]
+        self.post = TimePost.objects.create(user=self.users[0], title='제목', description='설명', type='sale', price=1000)
+        self.room = Room.objects.create(post=self.post)
+        self.room.users.add(*self.users)
+
+    def create_reviews(self, count):
+        for i in range(count):
+            author, target = self.users[i % 3], self.users[(i + 1) % 3]
+            trade = TradeRequest.objects.create(
+                room=self.room, post=self.post, requester=author, receiver=target,
+                proposed_price=1000, proposed_hours=1, status='completed'
+            )
+            Review.objects.create(trade=trade, author=author, target=target, rating=Decimal('4.5') if i % 2 else Decimal('3.0'))
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        """중첩 사용자 프로필/평점은 응답 크기와 관계없이 한 번에 조회"""
+        self.create_reviews(3)
+        _, few = self.count_queries(reverse('review-list'))
+        self.create_reviews(9)
+        response, many = self.count_queries(reverse('review-list'))
+        self.assertEqual(len(response.data), 12)
+        self.assertEqual(few, many)
+        # ETag 버전 + 리뷰 목록 + 첫 작성자 FK + 나머지 사용자/평점 일괄 조회
+        self.assertLessEqual(many, 4)
+
+    def test_ratings_match_model_properties(self):
+        self.create_reviews(5)
+        response, _ = self.count_queries(reverse('review-list'))
+        for review in response.data:
+            for key in ('author', 'target'):
+                user = User.objects.get(pk=review[key]['id'])
+                self.assertEqual(review[key]['average_rating'], user.average_rating)
+                self.assertEqual(review[key]['rating_count'], user.rating_count)
+
+    def test_trade_list_nested_users_loaded_once(self):
+        self.create_reviews(6)
+        self.client.force_authenticate(user=self.users[0])
+        response, queries = self.count_queries(reverse('trade-list', kwargs={'room_id': self.room.id}))
+        self.assertEqual(len(response.data), 6)
+        # 인증 사용자 + 거래 목록 + 평점 일괄 조회
+        self.assertLessEqual(queries, 3)
+        self.assertEqual(response.data[0]['post']['user']['rating_count'], self.users[0].rating_count)
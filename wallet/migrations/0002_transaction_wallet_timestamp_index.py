@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-19 12:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wallet", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["wallet", "-timestamp"], name="wallet_tx_wallet_ts_idx"
+            ),
+        ),
+    ]
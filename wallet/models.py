@@ -1,5 +1,6 @@
 # wallet/models.py
 from django.db import models
+from django.db.models import F
 from django.conf import settings
 from django.utils import timezone
 
@@ -10,6 +11,19 @@ class Wallet(models.Model):
     def __str__(self):
         return f"{self.user.username} Wallet: {self.balance} hours"
 
+    @classmethod
+    def credit(cls, wallet_id, amount):
+        """잔액 증가 (balance 열만 갱신하는 UPDATE 한 번)"""
+        cls.objects.filter(id=wallet_id).update(balance=F('balance') + amount)
+
+    @classmethod
+    def debit(cls, wallet_id, amount):
+        """
+        잔액이 충분할 때만 차감 (조건부 UPDATE 한 번) - 차감했으면 True, 잔액 부족이면 False
+        잔액 확인과 차감이 한 문장이므로 행을 미리 잠그지 않아도 동시 출금으로 잔액이 음수가 되지 않습니다.
+        """
+        return cls.objects.filter(id=wallet_id, balance__gte=amount).update(balance=F('balance') - amount) == 1
+
 class Transaction(models.Model):
     TRANSACTION_TYPES = (
         ('deposit', '입금'),
@@ -23,5 +37,11 @@ class Transaction(models.Model):
     timestamp = models.DateTimeField(default=timezone.now)
     note = models.CharField(max_length=255, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            # 지갑 거래 내역 (지갑별 최신순)
+            models.Index(fields=['wallet', '-timestamp'], name='wallet_tx_wallet_ts_idx'),
+        ]
+
     def __str__(self):
         return f"{self.wallet.user.username} {self.transaction_type} {self.amount} hours"
@@ -0,0 +1,24 @@
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from wallet.models import Wallet
+
+User = get_user_model()
+
+class WalletBalanceConditionalGetTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(nickname='wallet', email='wallet@test.com', password='pass1234')
+        self.client.force_authenticate(user=self.user)
+        self.wallet = Wallet.objects.create(user=self.user, balance=10)
+        self.url = reverse('wallet-balance')
+
+    def test_balance_poll_not_modified_until_balance_changes(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.post(reverse('wallet-deposit'), {'amount': 3})
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(float(response.data['balance']), 13)
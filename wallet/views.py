@@ -6,8 +6,15 @@ from .serializers import WalletSerializer, TransactionSerializer
 from django.contrib.auth.models import User
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 from decimal import Decimal
+from TimeMarket_BackEnd.conditional import conditional_get
 
+def wallet_version(request):
+    # 응답(user, balance)이 지갑 행 값에서 바로 나오므로 행 값 자체를 버전으로 사용
+    return Wallet.objects.filter(user=request.user).values_list('id', 'balance').first()
+
+@conditional_get(wallet_version)
 class WalletBalanceView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -25,10 +32,10 @@ class DepositView(APIView):
         if amount <= 0:
             return Response({'error': '입금액은 0보다 커야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        wallet.balance += amount
-        wallet.save()
-
-        Transaction.objects.create(wallet=wallet, transaction_type='deposit', amount=amount, note='충전')
+        with transaction.atomic():
+            Wallet.credit(wallet.id, amount)
+            Transaction.objects.create(wallet=wallet, transaction_type='deposit', amount=amount, note='충전')
+        wallet.refresh_from_db(fields=['balance'])
 
         return Response({'message': f'{amount} 시간 입금 완료', 'balance': wallet.balance})
 
@@ -40,13 +47,11 @@ class WithdrawView(APIView):
         amount = Decimal(request.data.get('amount', '0'))
         if amount <= 0:
             return Response({'error': '출금액은 0보다 커야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
-        if wallet.balance < amount:
-            return Response({'error': '잔액이 부족합니다.'}, status=status.HTTP_400_BAD_REQUEST)
-
-        wallet.balance -= amount
-        wallet.save()
-
-        Transaction.objects.create(wallet=wallet, transaction_type='withdraw', amount=amount, note='사용')
+        with transaction.atomic():
+            if not Wallet.debit(wallet.id, amount):
+                return Response({'error': '잔액이 부족합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+            Transaction.objects.create(wallet=wallet, transaction_type='withdraw', amount=amount, note='사용')
+        wallet.refresh_from_db(fields=['balance'])
 
         return Response({'message': f'{amount} 시간 출금 완료', 'balance': wallet.balance})
 
@@ -95,15 +100,10 @@ class TransferView(APIView):
         except Wallet.DoesNotExist:
             return Response({'error': 'Wallet not found for sender or recipient.'}, status=status.HTTP_404_NOT_FOUND)
 
-        # 잔액 부족 체크
-        if sender_wallet.balance < amount:
-            return Response({'error': 'Insufficient balance.'}, status=status.HTTP_400_BAD_REQUEST)
-
-        # 잔액 업데이트 (트랜잭션 처리 권장)
-        sender_wallet.balance -= amount
-        recipient_wallet.balance += amount
-
-        sender_wallet.save()
-        recipient_wallet.save()
+        # 잔액 업데이트 (잔액이 충분할 때만 차감 후 입금)
+        with transaction.atomic():
+            if not Wallet.debit(sender_wallet.id, amount):
+                return Response({'error': 'Insufficient balance.'}, status=status.HTTP_400_BAD_REQUEST)
+            Wallet.credit(recipient_wallet.id, amount)
 
         return Response({'message': f'{amount}시간이 {recipient_username}님께 성공적으로 전송되었습니다.'})
\ No newline at end of file